@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+세이브 읽기/수정 경로 벤치마크
+
+합성 .hsg 세이브(해제 기준 1MB ~ 수백 MB)를 만들어 decompress_save, read_current_values,
+edit_save, compress_and_save의 처리량(MB/초)과 최대 메모리(tracemalloc, RSS)를 잽니다.
+결과를 기준값(bench_baseline.json)으로 저장해 두고, 이후 실행에서 기준값과 비교해 느려진 항목을 보여 줍니다.
+
+실행 예:
+    python bench_save.py                         # 기본 크기(1, 16, 64MB)로 측정 후 기준값과 비교
+    python bench_save.py --sizes 1,64,256,512    # 큰 세이브까지
+    python bench_save.py --save-baseline         # 측정 결과를 기준값으로 저장
+    python bench_save.py --generate big.hsg --sizes 200 --placement end   # 합성 세이브만 만들기
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import edit_save
+
+try:
+    import resource
+except ImportError:  # Windows: RSS 최대값은 측정하지 않음
+    resource = None
+
+
+# 기준값 파일 (이 스크립트와 같은 폴더)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baseline.json')
+
+# edit_save_incremental: 에디터가 한 번 저장한 세이브(복원 지점 기록 있음)를 다시 수정
+# edit_save_verified: edit_save + 저장 후 검증. 나머지 쓰기 항목은 검증 없이 잽니다
+# (기본값은 출력 파일이 있을 때만 검증하므로 첫 실행과 이후 실행이 섞이지 않도록 명시)
+BENCHMARKS = (
+    'decompress_save',
+    'read_current_values',
+    'edit_save',
+    'edit_save_incremental',
+    'edit_save_verified',
+    'compress_and_save',
+)
+PLACEMENTS = ('start', 'end')
+DEFAULT_SIZES_MB = (1, 16, 64)
+# 해제 1MB당 필드명 수 / 반복 필드(Salary/Wage) 등장 수
+DEFAULT_FIELD_DENSITY = 2000
+DEFAULT_REPEATS = 200
+# 기준값보다 이만큼(%) 넘게 느리면 느려짐으로 표시
+DEFAULT_REGRESSION_PCT = 10.0
+
+# 합성 세이브 구성: 1MB 블록을 만들어 이어 붙임
+_BLOCK_SIZE = 1 << 20
+_FILLER_NAMES = (
+    'Item', 'Price', 'Owner', 'Building', 'Employee', 'Stock', 'Vehicle',
+    'Contract', 'Address', 'Rent', 'Customer', 'Supplier', 'Shelf', 'Level',
+)
+REPEATED_FIELDS = ('Salary', 'Wage')
+
+
+def _synthetic_block(rng: random.Random, density: int, repeats: int) -> bytes:
+    """
+    실제 세이브처럼 UTF-16 필드명 + 4바이트 값 + 압축이 적당히 되는 채움 바이트로 된 1MB 블록.
+    Money/Energy/NetWorth는 넣지 않습니다 (앞/뒤 배치는 호출 측에서).
+    """
+    records = max(1, density + repeats)
+    gap = max(0, _BLOCK_SIZE // records - 24)
+    names = [name.encode('utf-16-le') for name in _FILLER_NAMES]
+    repeated = [name.encode('utf-16-le') for name in REPEATED_FIELDS]
+    kinds = [True] * repeats + [False] * density
+    rng.shuffle(kinds)
+    parts = []
+    for is_repeated in kinds:
+        if is_repeated:
+            parts.append(rng.choice(repeated))
+        else:
+            parts.append(rng.choice(names) + str(rng.randrange(1000)).encode('utf-16-le'))
+        parts.append(struct.pack('<f', rng.uniform(0, 1e6)))
+        # 채움: 1/4은 난수, 나머지는 0 (실제 세이브와 비슷한 압축률)
+        noise = gap // 4
+        parts.append(rng.randbytes(noise) + bytes(gap - noise))
+    block = b''.join(parts)
+    return (block + bytes(_BLOCK_SIZE))[:_BLOCK_SIZE]
+
+
+def make_synthetic_save(
+    path: str,
+    size_mb: float,
+    density: int = DEFAULT_FIELD_DENSITY,
+    repeats: int = DEFAULT_REPEATS,
+    placement: str = 'start',
+    seed: int = 1,
+    compress_level: int = 6,
+) -> int:
+    """
+    합성 .hsg 세이브를 만듭니다.
+
+    Args:
+        path: 저장 경로
+        size_mb: 해제 기준 크기 (MB)
+        density: 1MB당 필드명 수
+        repeats: 1MB당 반복 필드(Salary/Wage) 등장 수
+        placement: Money/Energy/NetWorth 위치 ('start' 앞쪽, 'end' 맨 뒤)
+        seed: 난수 시드 (같으면 같은 파일)
+        compress_level: GZIP 압축 수준
+
+    Returns:
+        해제 기준 바이트 수
+    """
+    if placement not in PLACEMENTS:
+        raise ValueError(f'placement는 {PLACEMENTS} 중 하나여야 합니다: {placement}')
+    rng = random.Random(seed)
+    special = b''.join(
+        pattern + struct.pack('<f', value)
+        for pattern, value in (
+            (edit_save.FIELD_MONEY, 250000.0),
+            (edit_save.FIELD_ENERGY, 0.8),
+            (edit_save.FIELD_NET_WORTH, 1500000.0),
+        )
+    )
+    total = max(int(size_mb * (1 << 20)), len(special) + 1)
+    # 블록 몇 개를 돌려 써서 큰 세이브도 빠르게 만듦
+    blocks = [_synthetic_block(rng, density, repeats) for _ in range(4)]
+    body_len = total - len(special)
+    body = bytearray()
+    i = 0
+    while len(body) < body_len:
+        body += blocks[i % len(blocks)]
+        i += 1
+    del body[body_len:]
+    data = special + body if placement == 'start' else body + special
+    edit_save.compress_and_save(data, path, level=compress_level)
+    return len(data)
+
+
+def _peak_rss_bytes() -> int | None:
+    """이 프로세스의 최대 RSS (바이트). 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _run_once(bench: str, path: str, out_path: str, buffer: bytes | None) -> None:
+    """벤치마크 한 번 실행. 캐시는 모두 끈 상태(매번 실제로 해제/스캔)."""
+    if bench == 'decompress_save':
+        edit_save.decompress_save(path)
+    elif bench == 'read_current_values':
+        edit_save.read_current_values(path)
+    elif bench in ('edit_save', 'edit_save_incremental', 'edit_save_verified'):
+        verify = bench == 'edit_save_verified'
+        edit_save.edit_save(path, out_path, money=123456.0, backup=False, verify=verify)
+    elif bench == 'compress_and_save':
+        edit_save.compress_and_save(buffer, out_path, verify=False)
+    else:
+        raise ValueError(f'알 수 없는 벤치마크: {bench}')
+
+
+def measure(bench: str, path: str, size: int, repeat: int) -> dict:
+    """
+    작업 프로세스에서 실행: 벤치마크를 repeat번 재서 중앙값을 내고, 한 번 더 tracemalloc으로 최대 할당량을 잽니다.
+
+    Returns:
+        {'seconds', 'mb_per_s', 'peak_alloc_mb', 'peak_rss_mb'}
+    """
+    edit_save.configure_index_cache(enabled=False)
+    edit_save.configure_buffer_cache(0)
+    edit_save.configure_restart_index(enabled=False)
+    if bench == 'edit_save_incremental':
+        # 에디터로 한 번 저장해 복원 지점을 남긴 뒤부터 측정 (게임이 쓴 합성 세이브는 기록 없음)
+        edit_save.configure_restart_index(directory=os.path.join(os.path.dirname(path), 'restart'))
+        edit_save.edit_save(path, path, money=1.0, backup=False, verify=False)
+    out_path = os.path.join(os.path.dirname(path), f'out-{os.getpid()}.hsg')
+    buffer = edit_save.decompress_save(path) if bench == 'compress_and_save' else None
+    try:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _run_once(bench, path, out_path, buffer)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        _run_once(bench, path, out_path, buffer)
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+    seconds = statistics.median(times)
+    rss = _peak_rss_bytes()
+    return {
+        'seconds': round(seconds, 6),
+        'mb_per_s': round(size / seconds / 1e6, 2),
+        'peak_alloc_mb': round(peak / 1e6, 2),
+        'peak_rss_mb': round(rss / 1e6, 2) if rss is not None else None,
+    }
+
+
+def run_suite(
+    sizes_mb: list[float],
+    placements: list[str],
+    benches: list[str],
+    density: int,
+    repeats: int,
+    repeat: int,
+    workdir: str,
+) -> dict:
+    """
+    크기 × 필드 위치 × 벤치마크 조합을 모두 잽니다. 조합마다 새 프로세스를 띄워 RSS를 따로 잽니다.
+
+    Returns:
+        {'environment': 실행 환경, 'results': {'벤치마크/크기MB/위치': 측정값}}
+    """
+    results = {}
+    ctx = multiprocessing.get_context('spawn')
+    for size_mb in sizes_mb:
+        for placement in placements:
+            path = os.path.join(workdir, f'synthetic-{size_mb:g}mb-{placement}.hsg')
+            size = make_synthetic_save(path, size_mb, density, repeats, placement)
+            for bench in benches:
+                # 필드 위치가 영향을 주지 않는 벤치마크는 한 번만
+                if placement != placements[0] and bench in ('decompress_save', 'compress_and_save'):
+                    continue
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    result = pool.submit(measure, bench, path, size, repeat).result()
+                key = f'{bench}/{size_mb:g}MB/{placement}'
+                results[key] = result
+                print(_format_result(key, result), flush=True)
+            os.remove(path)
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'numpy': edit_save.np is not None,
+            'density': density,
+            'repeats': repeats,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def _format_result(key: str, result: dict) -> str:
+    rss = f'{result["peak_rss_mb"]:8.1f} MB' if result['peak_rss_mb'] is not None else '       —'
+    return (
+        f'{key:<42} {result["seconds"]:8.3f}초 {result["mb_per_s"]:9.1f} MB/초 '
+        f'할당 {result["peak_alloc_mb"]:8.1f} MB  RSS {rss}'
+    )
+
+
+def compare(report: dict, baseline: dict, threshold_pct: float) -> list[str]:
+    """
+    기준값과 같은 항목끼리 시간·메모리를 비교한 표를 만듭니다.
+
+    Returns:
+        출력할 줄 목록 (느려진 항목은 '느려짐' 표시)
+    """
+    lines = [f'기준값 비교 (느려짐 기준 +{threshold_pct:g}%):']
+    base_results = baseline.get('results', {})
+    for key, result in report['results'].items():
+        base = base_results.get(key)
+        if base is None:
+            lines.append(f'  {key:<42} (기준값 없음)')
+            continue
+        time_pct = (result['seconds'] / base['seconds'] - 1) * 100 if base['seconds'] else 0.0
+        mem_pct = (
+            (result['peak_alloc_mb'] / base['peak_alloc_mb'] - 1) * 100 if base['peak_alloc_mb'] else 0.0
+        )
+        mark = '  느려짐' if time_pct > threshold_pct else ''
+        lines.append(f'  {key:<42} 시간 {time_pct:+7.1f}%  할당 {mem_pct:+7.1f}%{mark}')
+    return lines
+
+
+def _parse_list(text: str, cast):
+    return [cast(item) for item in text.split(',') if item.strip()]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='세이브 읽기/수정 경로 벤치마크 (합성 .hsg 사용)')
+    parser.add_argument(
+        '--sizes',
+        default=','.join(str(n) for n in DEFAULT_SIZES_MB),
+        help='해제 기준 세이브 크기(MB) 목록, 쉼표로 구분 (기본 1,16,64)',
+    )
+    parser.add_argument(
+        '--placement',
+        default=','.join(PLACEMENTS),
+        help='Money/Energy/NetWorth 위치: start, end (기본 둘 다)',
+    )
+    parser.add_argument(
+        '--bench',
+        default=','.join(BENCHMARKS),
+        help=f'실행할 벤치마크 (기본 전부: {",".join(BENCHMARKS)})',
+    )
+    parser.add_argument('--density', type=int, default=DEFAULT_FIELD_DENSITY, help='1MB당 필드명 수')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help='1MB당 반복 필드 등장 수')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='항목별 반복 측정 횟수 (중앙값 사용)')
+    parser.add_argument('--json', default=None, metavar='FILE', help='결과를 JSON으로 저장')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준값 파일 (기본: bench_baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument(
+        '--fail-over',
+        type=float,
+        default=None,
+        metavar='PCT',
+        help='기준값보다 PCT%% 넘게 느린 항목이 있으면 종료 코드 1',
+    )
+    parser.add_argument(
+        '--generate',
+        default=None,
+        metavar='FILE',
+        help='측정 없이 합성 세이브 하나만 만듦 (--sizes 첫 값, --placement 첫 값 사용)',
+    )
+    args = parser.parse_args(argv)
+    # 합성 세이브는 게임이 쓴 세이브처럼 복원 지점 기록 없이 만듦 (사용자 캐시 폴더에도 남기지 않음)
+    edit_save.configure_restart_index(enabled=False)
+
+    sizes = _parse_list(args.sizes, float)
+    placements = _parse_list(args.placement, str)
+    benches = _parse_list(args.bench, str)
+    for placement in placements:
+        if placement not in PLACEMENTS:
+            parser.error(f'알 수 없는 위치: {placement}')
+    for bench in benches:
+        if bench not in BENCHMARKS:
+            parser.error(f'알 수 없는 벤치마크: {bench}')
+
+    if args.generate:
+        size = make_synthetic_save(args.generate, sizes[0], args.density, args.repeats, placements[0])
+        print(f'합성 세이브 저장: {args.generate} (해제 {size / 1e6:.1f} MB, '
+              f'압축 {os.path.getsize(args.generate) / 1e6:.1f} MB)')
+        return
+
+    with tempfile.TemporaryDirectory(prefix='ba-bench-') as workdir:
+        report = run_suite(sizes, placements, benches, args.density, args.repeats, args.repeat, workdir)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    regressed = False
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        threshold = args.fail_over if args.fail_over is not None else DEFAULT_REGRESSION_PCT
+        lines = compare(report, baseline, threshold)
+        print('\n'.join(lines))
+        regressed = any(line.endswith('느려짐') for line in lines)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print('기준값 저장:', args.baseline)
+    if regressed and args.fail_over is not None:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Big Ambitions 세이브 수정 기록 (되돌리기 / 다시 실행)
+
+수정 한 번(리비전)을 해제한 버퍼의 (오프셋, 이전 바이트, 새 바이트) 패치 목록으로 기록합니다.
+되돌리기/다시 실행은 패치를 버퍼 제자리에 다시 쓰고 증분 저장하므로, 기록의 메모리·디스크 크기는
+세이브 사본 수가 아니라 바뀐 바이트 수만큼만 늘어납니다. 기록은 세이브 옆 '저장이름.hsg.journal'에
+둡니다. 기록 뒤에 게임 등이 세이브를 다시 쓰면 (크기/수정 시각이 다르면) 그 기록으로는 되돌리지 않습니다.
+"""
+
+import json
+import os
+import time
+from typing import NamedTuple
+
+from edit_save import DEFAULT_COMPRESS_LEVEL, SaveFile, atomic_write
+
+
+# 기록 파일 확장자 (세이브 경로 뒤에 붙임)
+JOURNAL_SUFFIX = '.journal'
+# 세이브마다 남기는 최대 리비전 수 (넘으면 가장 오래된 것부터 버림)
+JOURNAL_MAX_REVISIONS = 200
+
+_JOURNAL_VERSION = 1
+
+
+class Patch(NamedTuple):
+    """해제한 버퍼의 한 구간: offset에서 old 바이트가 new 바이트로 바뀜 (길이 같음)."""
+
+    offset: int
+    old: bytes
+    new: bytes
+
+
+class Revision(NamedTuple):
+    """수정 한 번: 설명, 시각(epoch 초), 오프셋 순 패치 목록."""
+
+    label: str
+    time: float
+    patches: tuple[Patch, ...]
+
+    @property
+    def size(self) -> int:
+        """바뀐 바이트 수."""
+        return sum(len(p.new) for p in self.patches)
+
+
+class JournalStatus(NamedTuple):
+    """화면 표시용 기록 상태. 세이브와 맞지 않는 기록이면 undo/redo 설명이 None."""
+
+    undo: str | None
+    redo: str | None
+    position: int
+    count: int
+
+
+class JournalMismatchError(ValueError):
+    """기록이 지금 세이브 내용과 맞지 않음 (기록 뒤에 세이브가 바뀜). 세이브는 바뀌지 않습니다."""
+
+
+def journal_path(save_path: str) -> str:
+    """세이브의 수정 기록 파일 경로."""
+    return save_path + JOURNAL_SUFFIX
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """파일 크기와 수정 시각(ns). 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def merge_patches(patches) -> tuple[Patch, ...]:
+    """
+    SaveFile.take_patches() 결과를 리비전 하나의 패치로 정리합니다.
+    같은 오프셋을 여러 번 고쳤으면 처음 이전 값과 마지막 새 값만 남기고, 결과가 같은 패치는 버리며,
+    이어진 구간은 하나로 합칩니다.
+
+    Raises:
+        ValueError: 이전/새 바이트 길이가 다른 패치 (값 크기가 바뀌는 수정은 기록할 수 없음)
+    """
+    by_offset: dict[int, list[bytes]] = {}
+    for offset, old, new in patches:
+        if len(old) != len(new):
+            raise ValueError(f'오프셋 {offset}: 이전/새 바이트 길이가 다릅니다.')
+        if offset in by_offset:
+            by_offset[offset][1] = bytes(new)
+        else:
+            by_offset[offset] = [bytes(old), bytes(new)]
+    merged: list[Patch] = []
+    for offset in sorted(by_offset):
+        old, new = by_offset[offset]
+        if old == new:
+            continue
+        if merged:
+            last = merged[-1]
+            end = last.offset + len(last.old)
+            if offset < end:
+                raise ValueError(f'오프셋 {offset}: 겹치는 패치입니다.')
+            if offset == end:
+                merged[-1] = Patch(last.offset, last.old + old, last.new + new)
+                continue
+        merged.append(Patch(offset, old, new))
+    return tuple(merged)
+
+
+def _apply(save: SaveFile, patches: tuple[Patch, ...], undo: bool) -> None:
+    """
+    패치를 버퍼 제자리에 씁니다 (undo면 new -> old). 먼저 모든 구간이 기대한 바이트인지 확인하고,
+    하나라도 다르면 아무것도 쓰지 않습니다. 쓴 곳은 증분 저장과 저장 후 검증 대상으로 표시합니다.
+    """
+    data = save.data
+    for p in patches:
+        current = p.new if undo else p.old
+        if data[p.offset : p.offset + len(current)] != current:
+            raise JournalMismatchError(f'오프셋 {p.offset:#x}의 내용이 기록과 다릅니다.')
+    for p in patches:
+        target = p.old if undo else p.new
+        data[p.offset : p.offset + len(target)] = target
+        save.mark_dirty(p.offset, len(target))
+
+
+class EditJournal:
+    """
+    세이브 하나의 수정 기록.
+
+    - revisions[:position]: 적용된 리비전 (되돌리기 대상), revisions[position:]: 되돌린 리비전 (다시 실행 대상)
+    - signature: 기록에 맞춰 마지막으로 쓴 세이브의 (크기, 수정 시각). 지금 파일과 다르면 기록이 낡은 것
+
+    사용 예:
+        journal = EditJournal.load(path)
+        with SaveFile(path) as save:
+            journal.undo(save)
+            save.commit()
+        journal.mark_saved()
+        journal.store()
+    """
+
+    def __init__(self, save_path: str) -> None:
+        self.save_path = save_path
+        self.path = journal_path(save_path)
+        self.revisions: list[Revision] = []
+        self.position = 0
+        self.signature: tuple[int, int] | None = None
+
+    @classmethod
+    def load(cls, save_path: str) -> 'EditJournal':
+        """세이브 옆 기록 파일을 읽습니다. 없거나 읽을 수 없으면 빈 기록."""
+        journal = cls(save_path)
+        try:
+            with open(journal.path, 'rb') as f:
+                doc = json.loads(f.read().decode('utf-8'))
+            if doc.get('version') != _JOURNAL_VERSION:
+                return journal
+            revisions = [
+                Revision(
+                    str(rev['label']),
+                    float(rev['time']),
+                    tuple(
+                        Patch(int(off), bytes.fromhex(old), bytes.fromhex(new))
+                        for off, old, new in rev['patches']
+                    ),
+                )
+                for rev in doc['revisions']
+            ]
+            position = int(doc['position'])
+            signature = doc.get('signature')
+        except (OSError, ValueError, KeyError, TypeError):
+            return journal
+        if not 0 <= position <= len(revisions):
+            return journal
+        journal.revisions = revisions
+        journal.position = position
+        journal.signature = tuple(signature) if signature else None
+        return journal
+
+    def store(self) -> None:
+        """기록 파일을 원자적으로 다시 씁니다. 리비전이 없으면 파일을 지웁니다."""
+        if not self.revisions:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        doc = {
+            'version': _JOURNAL_VERSION,
+            'signature': list(self.signature) if self.signature else None,
+            'position': self.position,
+            'revisions': [
+                {
+                    'label': rev.label,
+                    'time': rev.time,
+                    'patches': [[p.offset, p.old.hex(), p.new.hex()] for p in rev.patches],
+                }
+                for rev in self.revisions
+            ],
+        }
+        body = json.dumps(doc, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with atomic_write(self.path) as f:
+            f.write(body)
+
+    @property
+    def can_undo(self) -> bool:
+        """되돌릴 리비전이 있으면 True."""
+        return self.position > 0
+
+    @property
+    def can_redo(self) -> bool:
+        """다시 실행할 리비전이 있으면 True."""
+        return self.position < len(self.revisions)
+
+    def matches(self) -> bool:
+        """세이브가 마지막 기록 뒤로 바뀌지 않았으면 True (리비전이 없으면 항상 True)."""
+        return not self.revisions or _file_signature(self.save_path) == self.signature
+
+    def clear(self) -> None:
+        """모든 리비전을 버립니다 (낡은 기록, 다른 내용으로 덮어쓴 세이브)."""
+        self.revisions = []
+        self.position = 0
+        self.signature = None
+
+    def status(self) -> JournalStatus:
+        """되돌리기/다시 실행할 리비전 설명과 위치."""
+        if not self.matches():
+            return JournalStatus(None, None, self.position, len(self.revisions))
+        return JournalStatus(
+            self.revisions[self.position - 1].label if self.can_undo else None,
+            self.revisions[self.position].label if self.can_redo else None,
+            self.position,
+            len(self.revisions),
+        )
+
+    def record(self, label: str, patches) -> Revision | None:
+        """
+        저장한 수정 한 번을 리비전으로 추가합니다. 되돌려 둔 리비전(다시 실행 대상)은 버립니다.
+        저장 후 mark_saved()와 store()를 호출하세요.
+
+        Args:
+            label: 화면에 보일 설명
+            patches: (오프셋, 이전 바이트, 새 바이트) 목록 (SaveFile.take_patches())
+
+        Returns:
+            추가한 리비전. 실제로 바뀐 바이트가 없으면 None
+        """
+        merged = merge_patches(patches)
+        if not merged:
+            return None
+        revision = Revision(label, time.time(), merged)
+        del self.revisions[self.position :]
+        self.revisions.append(revision)
+        excess = len(self.revisions) - JOURNAL_MAX_REVISIONS
+        if excess > 0:
+            del self.revisions[:excess]
+        self.position = len(self.revisions)
+        return revision
+
+    def undo(self, save: SaveFile) -> Revision:
+        """
+        마지막 리비전의 패치를 save 버퍼에 거꾸로 적용합니다 (저장은 호출한 쪽에서 save.commit()).
+
+        Raises:
+            ValueError: 되돌릴 리비전이 없음
+            JournalMismatchError: 버퍼 내용이 기록과 다름
+        """
+        if not self.can_undo:
+            raise ValueError('되돌릴 수정이 없습니다.')
+        revision = self.revisions[self.position - 1]
+        _apply(save, revision.patches, undo=True)
+        self.position -= 1
+        return revision
+
+    def redo(self, save: SaveFile) -> Revision:
+        """
+        되돌린 리비전 하나를 save 버퍼에 다시 적용합니다 (저장은 호출한 쪽에서 save.commit()).
+
+        Raises:
+            ValueError: 다시 실행할 리비전이 없음
+            JournalMismatchError: 버퍼 내용이 기록과 다름
+        """
+        if not self.can_redo:
+            raise ValueError('다시 실행할 수정이 없습니다.')
+        revision = self.revisions[self.position]
+        _apply(save, revision.patches, undo=False)
+        self.position += 1
+        return revision
+
+    def mark_saved(self) -> None:
+        """세이브를 기록에 맞춰 쓴 직후 호출해 지금 파일을 기록의 기준으로 삼습니다."""
+        self.signature = _file_signature(self.save_path)
+
+
+def step_journal(
+    save_path: str,
+    redo: bool = False,
+    backup: bool = True,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+) -> tuple[Revision, dict, JournalStatus]:
+    """
+    세이브를 한 리비전 되돌리거나(redo=False) 다시 실행하고 저장합니다.
+    바뀐 블록만 다시 압축하며 (증분 저장), 교체 전에 패치한 값을 검증합니다.
+
+    Returns:
+        (적용한 리비전, 저장한 버퍼에서 읽은 현재 값, 새 기록 상태)
+
+    Raises:
+        ValueError: 되돌릴/다시 실행할 리비전이 없음
+        JournalMismatchError: 세이브가 마지막 기록 뒤에 바뀜
+    """
+    journal = EditJournal.load(save_path)
+    if not journal.matches():
+        raise JournalMismatchError(
+            '세이브가 마지막 수정 기록 뒤에 바뀌었습니다 (게임이 다시 저장했을 수 있음). '
+            '이 기록으로는 되돌릴 수 없습니다.'
+        )
+    with SaveFile(save_path) as save:
+        revision = journal.redo(save) if redo else journal.undo(save)
+        save.commit(backup=backup, compress_level=compress_level, verify=True)
+        values = save.values()
+    journal.mark_saved()
+    journal.store()
+    return revision, values, journal.status()
@@ -7,10 +7,36 @@ Money, Energy, NetWorth 등 특정 필드의 값을 변경한 뒤 다시 압축
 """
 
 import gzip
+import hashlib
+import json
 import struct
 import shutil
 import argparse
+import cProfile
+import importlib
 import os
+import re
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성: 없으면 대량 수정은 순수 파이썬으로 처리
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: reflink(FICLONE) 없이 하드링크/복사로 백업
+    fcntl = None
 
 
 # 필드명(UTF-16)과 그 뒤에 오는 값 타입/오프셋 정보
@@ -21,63 +47,2213 @@ FIELD_NET_WORTH = b'N\x00e\x00t\x00W\x00o\x00r\x00t\x00h\x00'
 # Energy는 필드명 뒤 구조가 다를 수 있음 (추가 타입 바이트 등)
 VALUE_OFFSET_AFTER_FIELD = 0  # 필드명 끝(마지막 문자 2바이트) 바로 다음이 값인 경우
 
+# 스트리밍 압축 해제 시 한 번에 읽고 풀어내는 최대 크기 (1 MiB)
+STREAM_CHUNK_SIZE = 1 << 20
+
+# 저장 시 GZIP 압축 수준 (gzip.open 기본값과 동일한 9) 과 병렬 압축 블록 크기
+DEFAULT_COMPRESS_LEVEL = 9
+COMPRESS_BLOCK_SIZE = 1 << 20
+# 압축 스레드 수 기본값 (None: CPU 수). 여러 프로세스가 동시에 저장할 때 줄여서 사용
+COMPRESS_WORKERS: int | None = None
+
+# 필드 오프셋 인덱스 디스크 캐시 기본 용량 (항목 파일 크기 합)
+INDEX_CACHE_MAX_BYTES = 64 << 20
+# 파일 stat -> 내용 키 연결 파일 총 용량 (항목 하나가 100바이트 안팎)
+INDEX_ALIAS_MAX_BYTES = 1 << 20
+
+# 복원 지점(증분 저장) 디스크 캐시 기본 용량. 항목은 1MB 블록당 28바이트라 작음
+RESTART_INDEX_MAX_BYTES = 4 << 20
+
+# 저장 후 검증에서 다시 읽어 비교할 고친 값 최대 개수 (넘는 값은 CRC32로만 확인)
+VERIFY_MAX_VALUES = 1 << 16
+
+# 해제된 세이브 버퍼 메모리 캐시 기본 용량 (환경 변수 BA_SAVE_EDITOR_BUFFER_CACHE_MB로 변경, 0이면 끔)
+BUFFER_CACHE_MAX_BYTES = 256 << 20
+
+# 값 타입 이름 -> 미리 컴파일한 little-endian 코덱
+VALUE_CODECS = {
+    'float32': struct.Struct('<f'),
+    'float64': struct.Struct('<d'),
+    'int32': struct.Struct('<i'),
+    'int64': struct.Struct('<q'),
+    'bool': struct.Struct('<?'),
+}
+
+# 값 타입 이름 -> NumPy dtype (대량 수정용, little-endian)
+_NUMPY_DTYPES = {
+    'float32': '<f4',
+    'float64': '<f8',
+    'int32': '<i4',
+    'int64': '<i8',
+}
+
+# 필드 등장 위치 정책: first(첫 위치만), all(모든 위치)
+OCCURRENCE_POLICIES = ('first', 'all')
+
+# 대량 수정 연산: set(값으로 설정), scale(배율 곱하기), clamp(최소~최대로 제한)
+BULK_OPS = ('set', 'scale', 'clamp')
+
+# 화면/CLI에서 다루는 기본 필드 (표시 이름 -> UTF-16 필드명), 표시 순서 유지
+SAVE_FIELDS = {
+    'Money': FIELD_MONEY,
+    'Energy': FIELD_ENERGY,
+    'NetWorth': FIELD_NET_WORTH,
+}
+
+
+# 단계별 시간 측정: 단계 id -> 표시 이름 (출력 순서)
+TIMING_PHASES = {
+    'read': '파일 읽기',
+    'decompress': '압축 해제',
+    'scan': '필드 스캔',
+    'patch': '값 쓰기',
+    'backup': '백업',
+    'compress': '압축',
+    'write': '파일 쓰기',
+    'verify': '검증',
+}
+
+
+class PhaseTimings:
+    """
+    한 작업의 단계별 누적 시간, 처리 바이트, 호출 횟수.
+    collect_timings()가 켜 둔 스레드에서만 기록되며, 꺼져 있으면 측정 비용이 거의 없습니다.
+    """
+
+    __slots__ = ('phases', 'total')
+
+    def __init__(self) -> None:
+        # 단계 id -> [초, 바이트, 횟수]
+        self.phases: dict[str, list] = {}
+        self.total = 0.0
+
+    def add(self, phase: str, seconds: float, nbytes: int = 0) -> None:
+        entry = self.phases.get(phase)
+        if entry is None:
+            entry = self.phases[phase] = [0.0, 0, 0]
+        entry[0] += seconds
+        entry[1] += nbytes
+        entry[2] += 1
+
+    def _ordered(self):
+        order = list(TIMING_PHASES)
+        return sorted(self.phases.items(), key=lambda kv: order.index(kv[0]) if kv[0] in order else len(order))
+
+    def to_dict(self) -> dict:
+        """JSON으로 내보낼 형식: 전체 시간과 단계별 초/바이트/횟수/MB/s"""
+        phases = {}
+        for phase, (seconds, nbytes, calls) in self._ordered():
+            phases[phase] = {
+                'seconds': round(seconds, 6),
+                'bytes': nbytes,
+                'calls': calls,
+                'mb_per_s': round(nbytes / seconds / 1e6, 3) if seconds > 0 and nbytes else None,
+            }
+        return {'total_seconds': round(self.total, 6), 'phases': phases}
+
+    @staticmethod
+    def _format_bytes(nbytes: int) -> str:
+        if nbytes >= 1e6:
+            return f'{nbytes / 1e6:.1f} MB'
+        if nbytes >= 1e3:
+            return f'{nbytes / 1e3:.1f} KB'
+        return f'{nbytes} B'
+
+    def format_lines(self) -> list[str]:
+        """사람이 읽는 단계별 표 (단계, 시간, 비율, 처리량, MB/s)."""
+        total = self.total or sum(entry[0] for entry in self.phases.values())
+        lines = [f'단계별 시간 (전체 {total:.3f}초):']
+        measured = 0.0
+        for phase, (seconds, nbytes, calls) in self._ordered():
+            measured += seconds
+            share = seconds / total * 100 if total > 0 else 0.0
+            line = f'  {TIMING_PHASES.get(phase, phase):<8} {seconds:8.3f}초 {share:5.1f}%'
+            if nbytes:
+                line += f' {self._format_bytes(nbytes):>10}'
+                # 아주 작은 처리량(값 몇 바이트)은 MB/초가 의미 없으므로 생략
+                if seconds > 0 and nbytes >= 1 << 16:
+                    line += f' {nbytes / seconds / 1e6:9.1f} MB/초'
+            if calls > 1:
+                line += f' ({calls}회)'
+            lines.append(line)
+        if total > measured:
+            lines.append(f'  {"기타":<8} {total - measured:8.3f}초 {(total - measured) / total * 100:5.1f}%')
+        return lines
+
+    def summary(self) -> str:
+        """한 줄 요약 (GUI 상태 줄용)."""
+        parts = [f'{TIMING_PHASES.get(phase, phase)} {entry[0]:.2f}초' for phase, entry in self._ordered()]
+        parts.append(f'합계 {self.total:.2f}초')
+        return ' · '.join(parts)
+
+
+def latency_summary(samples) -> dict:
+    """지연 시간 표본(초)의 평균/중앙값/p95/최대. 표본이 없으면 모두 None"""
+    values = sorted(samples)
+    if not values:
+        return {'mean': None, 'p50': None, 'p95': None, 'max': None}
+    n = len(values)
+    return {
+        'mean': sum(values) / n,
+        'p50': values[(n - 1) // 2],
+        'p95': values[min(n - 1, int(n * 0.95))],
+        'max': values[-1],
+    }
+
+
+class _PhaseTimer:
+    __slots__ = ('timings', 'phase', 'nbytes', 'start')
+
+    def __init__(self, timings: PhaseTimings, phase: str, nbytes: int) -> None:
+        self.timings = timings
+        self.phase = phase
+        self.nbytes = nbytes
+
+    def __enter__(self) -> '_PhaseTimer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.timings.add(self.phase, time.perf_counter() - self.start, self.nbytes)
+
+
+class _NullTimer:
+    """측정이 꺼져 있을 때 쓰는 아무 일도 하지 않는 타이머 (nbytes 대입도 무시)."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        pass
+
+    def __setattr__(self, _name, _value) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+_timing_state = threading.local()
+
+
+def timed(phase: str, nbytes: int = 0):
+    """
+    단계 시간을 잽니다. collect_timings() 안(같은 스레드)이 아니면 아무것도 하지 않습니다.
+    처리 바이트를 나중에 알면 `with timed('decompress') as t: ...; t.nbytes = n` 처럼 씁니다.
+    """
+    timings = getattr(_timing_state, 'timings', None)
+    if timings is None:
+        return _NULL_TIMER
+    return _PhaseTimer(timings, phase, nbytes)
+
+
+@contextmanager
+def collect_timings():
+    """
+    이 블록 안에서(같은 스레드) 실행되는 해제/스캔/쓰기/압축/백업 시간을 모읍니다.
+
+    사용 예:
+        with collect_timings() as timings:
+            edit_save(path, path, money=1000000)
+        print('\n'.join(timings.format_lines()))
+    """
+    timings = PhaseTimings()
+    previous = getattr(_timing_state, 'timings', None)
+    _timing_state.timings = timings
+    start = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        timings.total = time.perf_counter() - start
+        _timing_state.timings = previous
+
+
+def find_field_value_offset(data: bytes, field_utf16: bytes, value_size: int = 4) -> int:
+    """
+    바이너리 데이터에서 UTF-16 필드명 위치를 찾고, 그 뒤 값의 시작 오프셋을 반환합니다.
+
+    Args:
+        data: 압축 해제된 세이브 바이너리
+        field_utf16: UTF-16으로 인코딩된 필드명 (예: b'M\\x00o\\x00n\\x00e\\x00y\\x00')
+        value_size: 값 크기(바이트). float=4, double=8
+
+    Returns:
+        값이 시작하는 바이트 오프셋. 없으면 -1
+    """
+    with timed('scan'):
+        idx = data.find(field_utf16)
+    if idx < 0:
+        return -1
+    # 필드명 길이만큼 건너뛴 뒤가 값 (일부 필드는 중간에 타입 바이트가 있을 수 있음)
+    value_start = idx + len(field_utf16)
+    if value_start + value_size > len(data):
+        return -1
+    return value_start
+
+
+class FieldScanner:
+    """
+    여러 UTF-16 필드명을 버퍼 한 번 훑기로 찾는 다중 패턴 매처.
+
+    필드명들을 하나의 정규식 교대(alternation) 패턴으로 컴파일해 C 구현 정규식 엔진이
+    버퍼를 한 번만 지나가도록 합니다. 필드 수가 늘어도 스캔 횟수는 1회로 고정됩니다.
+    긴 패턴을 먼저 두고, 매치 위치에서 함께 일치하는 짧은 접두 패턴도 같이 보고하며,
+    매치 다음 바이트부터 다시 검색하므로 data.find()와 같은 위치를 찾습니다.
+    """
+
+    def __init__(self, fields: dict[str, bytes]) -> None:
+        """
+        Args:
+            fields: 이름 -> UTF-16 필드명 바이트 (예: {'Money': FIELD_MONEY})
+        """
+        if not fields:
+            raise ValueError('찾을 필드가 없습니다.')
+        self.fields = dict(fields)
+        by_pattern: dict[bytes, list[str]] = {}
+        for name, pattern in self.fields.items():
+            if not pattern:
+                raise ValueError(f'빈 필드명은 찾을 수 없습니다: {name}')
+            by_pattern.setdefault(pattern, []).append(name)
+        patterns = sorted(by_pattern, key=len, reverse=True)
+        # 매치된 (가장 긴) 패턴 -> 같은 위치에서 일치하는 모든 이름 (자기 자신 + 접두 패턴)
+        self._names_at_match = {
+            p: [name for q in patterns if p.startswith(q) for name in by_pattern[q]]
+            for p in patterns
+        }
+        self._regex = re.compile(b'|'.join(re.escape(p) for p in patterns))
+        self.max_pattern_len = len(patterns[0])
+
+    def iter_matches(self, data: bytes, start: int = 0, end: int | None = None):
+        """
+        data[start:end] 안의 모든 필드명 위치를 앞에서부터 생성합니다 (겹치는 매치 포함).
+
+        Yields:
+            (이름, 필드명 시작 오프셋)
+        """
+        if end is None:
+            end = len(data)
+        search = self._regex.search
+        pos = start
+        while True:
+            m = search(data, pos, end)
+            if m is None:
+                return
+            idx = m.start()
+            for name in self._names_at_match[m.group()]:
+                yield name, idx
+            pos = idx + 1
+
+    def find_value_offsets(self, data: bytes, value_size: int = 4) -> dict[str, int]:
+        """
+        각 필드의 첫 번째 위치 뒤 값 시작 오프셋을 한 번의 스캔으로 찾습니다.
+        필드별 의미는 find_field_value_offset()과 같습니다.
+
+        Returns:
+            이름 -> 값 시작 오프셋 (없거나 값이 데이터 끝을 넘으면 -1)
+        """
+        offsets: dict[str, int] = {}
+        for name, idx in self.iter_matches(data):
+            if name in offsets:
+                continue
+            value_start = idx + len(self.fields[name])
+            offsets[name] = value_start if value_start + value_size <= len(data) else -1
+            if len(offsets) == len(self.fields):
+                # 모든 필드를 찾았으면 나머지 버퍼는 볼 필요 없음
+                break
+        return {name: offsets.get(name, -1) for name in self.fields}
+
+    def find_all_value_offsets(self, data: bytes, value_size: int = 4) -> dict[str, array]:
+        """
+        각 필드의 모든 위치 뒤 값 시작 오프셋을 한 번의 스캔으로 찾습니다.
+        값이 데이터 끝을 넘는 위치는 제외합니다.
+
+        Returns:
+            이름 -> 값 시작 오프셋 array('Q') (앞에서부터)
+        """
+        result = {name: array('Q') for name in self.fields}
+        end = len(data)
+        for name, idx in self.iter_matches(data):
+            value_start = idx + len(self.fields[name])
+            if value_start + value_size <= end:
+                result[name].append(value_start)
+        return result
+
+
+@lru_cache(maxsize=32)
+def _scanner_for(fields: tuple[tuple[str, bytes], ...]) -> FieldScanner:
+    """같은 필드 조합에 대해 컴파일된 스캐너를 재사용합니다."""
+    return FieldScanner(dict(fields))
+
+
+def find_field_value_offsets(data: bytes, fields: dict[str, bytes], value_size: int = 4) -> dict[str, int]:
+    """
+    여러 필드의 값 시작 오프셋을 버퍼 한 번 훑기로 찾습니다.
+
+    Args:
+        data: 압축 해제된 세이브 바이너리
+        fields: 이름 -> UTF-16 필드명 (예: SAVE_FIELDS)
+        value_size: 값 크기(바이트)
+
+    Returns:
+        이름 -> 값 시작 오프셋. 없으면 -1
+    """
+    # 모두 찾으면 멈추므로 실제로 훑은 바이트 수는 모름 (처리량 대신 시간만 기록)
+    with timed('scan'):
+        return _scanner_for(tuple(fields.items())).find_value_offsets(data, value_size)
+
+
+def find_all_field_value_offsets(
+    data: bytes, fields: dict[str, bytes], value_size: int = 4
+) -> dict[str, array]:
+    """
+    여러 필드의 모든 등장 위치(값 시작 오프셋)를 버퍼 한 번 훑기로 찾습니다.
+
+    Returns:
+        이름 -> 값 시작 오프셋 array('Q')
+    """
+    with timed('scan', len(data)):
+        return _scanner_for(tuple(fields.items())).find_all_value_offsets(data, value_size)
+
+
+# 인덱서가 필드명으로 보는 UTF-16 식별자: 영문자/_ 로 시작하는 ASCII 영숫자/_ 연속
+FIELD_NAME_MIN_CHARS = 3
+
+
+@lru_cache(maxsize=8)
+def _field_name_regex(min_chars: int) -> re.Pattern:
+    """UTF-16(LE) ASCII 식별자 연속을 찾는 정규식."""
+    return re.compile(rb'[A-Za-z_]\x00(?:[A-Za-z0-9_]\x00){%d,}' % (min_chars - 1))
+
+
+class FieldIndex:
+    """
+    압축 해제된 세이브 안의 모든 UTF-16 필드명 -> 값 오프셋 목록 인덱스.
+
+    버퍼를 한 번 훑어 만든 뒤에는 이름 조회가 dict 한 번이고, 접두어 조회는 정렬된 이름
+    목록에서 이진 탐색합니다. 오프셋은 이름별로 묶어 하나의 array('Q')에 이어 담고
+    (시작 위치는 array('Q') starts), 이름 순서대로 [starts[i], starts[i+1]) 구간을 씁니다.
+    값 오프셋은 필드명 바로 뒤 위치입니다 (VALUE_OFFSET_AFTER_FIELD와 같은 가정).
+    """
+
+    __slots__ = ('names', '_ids', '_starts', '_offsets')
+
+    def __init__(self, names: list[str], starts: array, offsets: array) -> None:
+        self.names = names  # 정렬된 고유 필드명
+        self._ids = {name: i for i, name in enumerate(names)}
+        self._starts = starts  # len(names) + 1
+        self._offsets = offsets
+
+    @classmethod
+    def build(cls, data: bytes, min_chars: int = FIELD_NAME_MIN_CHARS) -> 'FieldIndex':
+        """
+        버퍼를 한 번 훑어 인덱스를 만듭니다.
+
+        Args:
+            data: 압축 해제된 세이브 바이너리
+            min_chars: 필드명으로 볼 최소 글자 수
+        """
+        grouped: dict[bytes, array] = {}
+        for m in _field_name_regex(min_chars).finditer(data):
+            offs = grouped.get(m.group())
+            if offs is None:
+                offs = grouped[m.group()] = array('Q')
+            offs.append(m.end())
+        names = []
+        starts = array('Q', [0])
+        offsets = array('Q')
+        for raw in sorted(grouped, key=lambda b: b.decode('utf-16-le')):
+            names.append(raw.decode('utf-16-le'))
+            offsets.extend(grouped[raw])
+            starts.append(len(offsets))
+        return cls(names, starts, offsets)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def offsets(self, name: str) -> array:
+        """필드의 모든 값 오프셋 (앞에서부터). 없으면 빈 array."""
+        i = self._ids.get(name)
+        if i is None:
+            return array('Q')
+        return self._offsets[self._starts[i] : self._starts[i + 1]]
+
+    def first(self, name: str) -> int:
+        """필드의 첫 번째 값 오프셋. 없으면 -1"""
+        i = self._ids.get(name)
+        return -1 if i is None else self._offsets[self._starts[i]]
+
+    def count(self, name: str) -> int:
+        """필드가 나타나는 횟수."""
+        i = self._ids.get(name)
+        return 0 if i is None else self._starts[i + 1] - self._starts[i]
+
+    def names_with_prefix(self, prefix: str) -> list[str]:
+        """prefix로 시작하는 필드명 목록 (정렬 순)."""
+        names = self.names
+        i = bisect_left(names, prefix)
+        j = i
+        while j < len(names) and names[j].startswith(prefix):
+            j += 1
+        return names[i:j]
+
+    def with_prefix(self, prefix: str) -> dict[str, array]:
+        """prefix로 시작하는 필드명 -> 값 오프셋 목록."""
+        return {name: self.offsets(name) for name in self.names_with_prefix(prefix)}
+
+    def to_bytes(self) -> bytes:
+        """디스크 캐시용 직렬화 (배열은 이 PC의 바이트 순서 그대로)."""
+        names = '\n'.join(self.names).encode('utf-8')
+        header = struct.pack('<QQQ', len(names), len(self._starts), len(self._offsets))
+        return header + names + self._starts.tobytes() + self._offsets.tobytes()
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'FieldIndex':
+        """to_bytes()로 만든 바이트에서 인덱스를 복원합니다."""
+        names_len, n_starts, n_offsets = struct.unpack_from('<QQQ', raw)
+        pos = 24
+        names = raw[pos : pos + names_len].decode('utf-8').split('\n') if names_len else []
+        pos += names_len
+        starts = array('Q')
+        starts.frombytes(raw[pos : pos + n_starts * 8])
+        pos += n_starts * 8
+        offsets = array('Q')
+        offsets.frombytes(raw[pos : pos + n_offsets * 8])
+        if len(starts) != len(names) + 1 or len(offsets) != n_offsets:
+            raise ValueError('손상된 필드 인덱스입니다.')
+        return cls(names, starts, offsets)
+
+
+def build_field_index(data: bytes, min_chars: int = FIELD_NAME_MIN_CHARS) -> FieldIndex:
+    """압축 해제된 세이브 전체의 필드명 -> 값 오프셋 인덱스를 만듭니다."""
+    with timed('scan', len(data)):
+        return FieldIndex.build(data, min_chars)
+
+
+def read_float_at(data: bytes, offset: int) -> float:
+    """지정 오프셋에서 little-endian float 4바이트를 읽습니다."""
+    return struct.unpack('<f', data[offset : offset + 4])[0]
+
+
+def write_float_at(data: bytearray, offset: int, value: float) -> None:
+    """지정 오프셋에 little-endian float 4바이트를 씁니다."""
+    with timed('patch', 4):
+        data[offset : offset + 4] = struct.pack('<f', value)
+
+
+def _bulk_new_values(op: str, old, value, value_type: str):
+    """대량 수정 연산의 새 값을 계산합니다 (NumPy 배열과 float 모두 처리)."""
+    if op == 'set':
+        new = np.full(old.shape, value, dtype=np.float64) if hasattr(old, 'dtype') else value
+    elif op == 'scale':
+        new = old * value
+    elif op == 'clamp':
+        lo, hi = value
+        new = old
+        if lo is not None:
+            new = np.maximum(new, lo) if np is not None and hasattr(new, 'dtype') else max(new, lo)
+        if hi is not None:
+            new = np.minimum(new, hi) if np is not None and hasattr(new, 'dtype') else min(new, hi)
+    else:
+        raise ValueError(f'알 수 없는 대량 수정 연산: {op}')
+    if value_type.startswith('int'):
+        # 정수 필드는 반올림 후 타입 범위로 제한
+        bits = VALUE_CODECS[value_type].size * 8
+        lo, hi = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+        if hasattr(new, 'dtype'):
+            # float64 -> int64 변환이 넘치지 않도록 범위 밖 값은 경계값으로 직접 채움
+            new = np.rint(new)
+            over = new >= 2.0 ** (bits - 1)
+            under = new < -(2.0 ** (bits - 1))
+            safe = np.where(over | under, 0, new).astype(np.int64)
+            new = np.where(over, hi, np.where(under, lo, safe))
+        else:
+            new = min(max(round(new), lo), hi)
+    return new
+
+
+def bulk_read(data: bytes, offsets, value_type: str = 'float32') -> list:
+    """
+    여러 오프셋의 값을 한 번에 읽습니다.
+
+    Args:
+        data: 압축 해제된 세이브 바이너리
+        offsets: 값 시작 오프셋들
+        value_type: 값 타입 (VALUE_CODECS 키)
+
+    Returns:
+        값 목록 (offsets 순서)
+    """
+    if np is not None and value_type in _NUMPY_DTYPES and len(offsets) > 1:
+        off = np.asarray(offsets, dtype=np.int64)
+        size = VALUE_CODECS[value_type].size
+        out = np.empty(len(off), dtype=np.float64 if value_type.startswith('float') else np.int64)
+        for r in range(size):
+            sel = off % size == r
+            if sel.any():
+                view = np.frombuffer(data, dtype=_NUMPY_DTYPES[value_type], offset=r, count=(len(data) - r) // size)
+                out[sel] = view[(off[sel] - r) // size]
+        return out.tolist()
+    codec = VALUE_CODECS[value_type]
+    return [codec.unpack_from(data, off)[0] for off in offsets]
+
+
+def bulk_edit(data: bytearray, offsets, op: str, value, value_type: str = 'float32') -> int:
+    """
+    여러 오프셋의 값을 한 번의 배열 연산으로 수정합니다.
+
+    NumPy가 있으면 버퍼를 값 타입 배열로 보는 view를 만들어(정렬이 다른 오프셋은 나머지별로
+    view를 따로 둠) fancy-index로 한꺼번에 읽고 씁니다. 없으면 struct로 하나씩 처리합니다.
+    계산은 float64/int64에서 한 뒤 값 타입으로 저장하므로 두 경로의 결과가 같습니다.
+
+    Args:
+        data: 압축 해제된 세이브 바이너리 (수정됨)
+        offsets: 값 시작 오프셋들
+        op: 'set' | 'scale' | 'clamp'
+        value: set은 새 값, scale은 배율, clamp는 (최소, 최대) (한쪽은 None 가능)
+        value_type: 값 타입 (bool 제외)
+
+    Returns:
+        바이트가 실제로 바뀐 값의 개수
+    """
+    if op not in BULK_OPS:
+        raise ValueError(f'알 수 없는 대량 수정 연산: {op}')
+    if value_type not in _NUMPY_DTYPES:
+        raise ValueError(f'대량 수정을 지원하지 않는 값 타입: {value_type}')
+    if np is not None and len(offsets) > 1:
+        off = np.asarray(offsets, dtype=np.int64)
+        size = VALUE_CODECS[value_type].size
+        wide = np.float64 if value_type.startswith('float') else np.int64
+        changed = 0
+        for r in range(size):
+            sel = off % size == r
+            if not sel.any():
+                continue
+            view = np.frombuffer(data, dtype=_NUMPY_DTYPES[value_type], offset=r, count=(len(data) - r) // size)
+            idx = (off[sel] - r) // size
+            old = view[idx]
+            view[idx] = _bulk_new_values(op, old.astype(wide), value, value_type)
+            # NaN도 바이트 단위로 비교
+            changed += int(np.count_nonzero(view[idx].view(f'u{size}') != old.view(f'u{size}')))
+        return changed
+    codec = VALUE_CODECS[value_type]
+    changed = 0
+    for off in offsets:
+        old_bytes = bytes(data[off : off + codec.size])
+        new = _bulk_new_values(op, codec.unpack(old_bytes)[0], value, value_type)
+        codec.pack_into(data, off, new)
+        if data[off : off + codec.size] != old_bytes:
+            changed += 1
+    return changed
+
+
+def decompress_save(path: str) -> bytes:
+    """
+    .hsg 파일을 GZIP 해제하여 바이트 데이터를 반환합니다.
+
+    Args:
+        path: .hsg 파일 경로
+
+    Returns:
+        압축 해제된 바이너리 (같은 파일을 다시 해제하면 버퍼 캐시에서 반환)
+    """
+    return _decompress_cached(path)[0]
+
+
+def iter_decompressed_chunks(path: str, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    .hsg 파일을 chunk 단위로 조금씩 GZIP 해제하며 생성합니다.
+    호출 측이 중간에 멈추면 나머지는 해제하지 않습니다. 이어 붙은 여러 GZIP 멤버도 처리합니다.
+
+    Args:
+        path: .hsg 파일 경로
+        chunk_size: 한 번에 읽는 압축 바이트 수이자 한 번에 내놓는 해제 바이트 상한
+
+    Yields:
+        압축 해제된 바이트 조각 (순서대로)
+    """
+    with open(path, 'rb') as f:
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pending = b''
+        while True:
+            if not pending:
+                with timed('read') as t:
+                    pending = f.read(chunk_size)
+                    t.nbytes = len(pending)
+                if not pending:
+                    out = d.flush()
+                    if out:
+                        yield out
+                    if not d.eof:
+                        raise EOFError('압축 스트림이 끝나기 전에 파일이 끝났습니다.')
+                    return
+            with timed('decompress') as t:
+                out = d.decompress(pending, chunk_size)
+                t.nbytes = len(out)
+            pending = d.unconsumed_tail
+            if d.eof:
+                # 다음 GZIP 멤버가 이어지면 새 해제기로 계속 (끝의 0 패딩은 무시)
+                rest = d.unused_data + pending
+                if rest.strip(b'\x00'):
+                    d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    pending = rest
+                else:
+                    if out:
+                        yield out
+                    return
+            if out:
+                yield out
+
+
+def read_ranges_streaming(path: str, ranges: dict[str, tuple[int, int]]) -> dict[str, bytes | None]:
+    """
+    오프셋을 이미 알고 있는 값들을 스트리밍으로 읽습니다. 마지막 범위까지 해제하면 멈춥니다.
+
+    Args:
+        path: .hsg 파일 경로
+        ranges: 이름 -> (시작 오프셋, 크기)
+
+    Returns:
+        이름 -> 값 바이트. 데이터가 그 전에 끝나면 None
+    """
+    parts = {name: bytearray() for name in ranges}
+    end_all = max((off + size for off, size in ranges.values()), default=0)
+    pos = 0
+    if end_all:
+        chunks = iter_decompressed_chunks(path)
+        try:
+            for chunk in chunks:
+                chunk_end = pos + len(chunk)
+                for name, (off, size) in ranges.items():
+                    lo, hi = max(off, pos), min(off + size, chunk_end)
+                    if lo < hi:
+                        parts[name] += chunk[lo - pos : hi - pos]
+                pos = chunk_end
+                if pos >= end_all:
+                    break
+        finally:
+            chunks.close()
+    return {
+        name: bytes(parts[name]) if len(parts[name]) == size else None
+        for name, (_off, size) in ranges.items()
+    }
+
+
+def read_fields_streaming(
+    path: str,
+    fields: dict[str, bytes],
+    value_size: int | dict[str, int] = 4,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> dict[str, tuple[int, bytes] | None]:
+    """
+    세이브를 chunk 단위로 해제하면서 필드를 찾고, 모든 필드를 찾으면 즉시 해제를 멈춥니다.
+
+    chunk 경계에 걸친 필드명도 찾도록 이전 chunk의 끝부분(가장 긴 필드명 - 1 바이트)과
+    아직 다 읽지 못한 값 영역을 다음 chunk 앞에 이어 붙여 검색합니다.
+    필드별 의미(첫 번째 위치, 값이 데이터 끝을 넘으면 실패)는 find_field_value_offset()과 같습니다.
+
+    Args:
+        path: .hsg 파일 경로
+        fields: 이름 -> UTF-16 필드명
+        value_size: 값 크기(바이트). 필드마다 다르면 이름 -> 크기 dict
+        chunk_size: 스트리밍 단위
+
+    Returns:
+        이름 -> (값 시작 오프셋, 값 바이트). 찾지 못하면 None
+    """
+    scanner = _scanner_for(tuple(fields.items()))
+    overlap = scanner.max_pattern_len - 1
+    sizes = value_size if isinstance(value_size, dict) else dict.fromkeys(fields, value_size)
+    result: dict[str, tuple[int, bytes] | None] = {}
+    seen: set[str] = set()
+    pending: dict[str, int] = {}  # 필드명은 찾았지만 값이 아직 다 해제되지 않은 필드
+    window = b''
+    window_start = 0  # window[0]의 절대 오프셋
+    search_from = 0  # 이 절대 오프셋 이전은 이미 완전히 검색함
+    chunks = iter_decompressed_chunks(path, chunk_size)
+    try:
+        for chunk in chunks:
+            window = window + chunk
+            # 해제 시간은 iter_decompressed_chunks가 따로 잼
+            with timed('scan', len(window) - (search_from - window_start)):
+                for name, idx in scanner.iter_matches(window, search_from - window_start):
+                    if name in seen:
+                        continue
+                    seen.add(name)
+                    pending[name] = window_start + idx + len(fields[name])
+            for name, value_start in list(pending.items()):
+                rel = value_start - window_start
+                if rel + sizes[name] <= len(window):
+                    result[name] = (value_start, window[rel : rel + sizes[name]])
+                    del pending[name]
+            if len(result) == len(fields):
+                break
+            # 다음 chunk와 이어 검색할 꼬리만 남김
+            window_end = window_start + len(window)
+            search_from = max(window_end - overlap, window_start)
+            keep_from = min([search_from, *pending.values()])
+            window = window[keep_from - window_start :]
+            window_start = keep_from
+    finally:
+        chunks.close()
+    return {name: result.get(name) for name in fields}
+
+
+# Linux FICLONE ioctl (btrfs/XFS/bcachefs 등에서 데이터 공유 복제, 즉시 끝남)
+_FICLONE = 0x40049409
+
+
+def _temp_path_for(path: str) -> str:
+    """path와 같은 폴더의 임시 파일 이름 (같은 폴더여야 os.replace가 원자적)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    name = f'.{os.path.basename(path)}.{os.getpid()}.{os.urandom(4).hex()}.tmp'
+    return os.path.join(directory, name)
+
+
+def _fsync_dir(directory: str) -> None:
+    """이름 바꾸기가 디스크에 남도록 폴더를 fsync (POSIX만, 실패는 무시)."""
+    if os.name == 'nt':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _reflink_fd(src_fd: int, dst_fd: int) -> bool:
+    """src 파일 내용을 dst로 reflink 복제합니다. 지원하지 않는 파일 시스템이면 False"""
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _preserve_as_backup(path: str, backup_path: str) -> str:
+    """
+    곧 교체할 path의 현재 파일을 backup_path로 보존합니다.
+
+    하드링크가 되면 복사 없이 끝납니다. 이어서 path를 새 파일로 os.replace 하므로 그 뒤에는
+    백업만 원래 파일을 가리킵니다 (교체하지 않을 파일에는 쓰면 안 됨). 하드링크가 안 되는
+    파일 시스템(FAT/exFAT 등)에서는 reflink, 그것도 안 되면 복사합니다. 백업도 임시 이름에
+    만든 뒤 교체하므로 이전 백업이 반쯤 덮인 채로 남지 않습니다.
+
+    Returns:
+        사용한 방법 ('hardlink', 'reflink', 'copy')
+    """
+    tmp = _temp_path_for(backup_path)
+    try:
+        try:
+            os.link(path, tmp)
+            method = 'hardlink'
+        except OSError:
+            with open(path, 'rb') as src, open(tmp, 'wb') as dst:
+                if _reflink_fd(src.fileno(), dst.fileno()):
+                    method = 'reflink'
+                else:
+                    shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+                    method = 'copy'
+            shutil.copystat(path, tmp)
+        os.replace(tmp, backup_path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return method
+
+
+@contextmanager
+def atomic_write(path: str, backup_path: str | None = None, verify=None):
+    """
+    path를 충돌(크래시·전원 차단)에 안전하게 씁니다.
+
+    같은 폴더의 임시 파일에 쓰고 fsync한 뒤 os.replace로 한 번에 바꿉니다. 도중에 실패하면
+    임시 파일만 지우므로 원래 파일은 그대로입니다. backup_path를 주면 교체 직전에 기존 파일을
+    하드링크(또는 reflink/복사)로 보존합니다. 기존 파일의 권한은 새 파일에 이어집니다.
+    verify를 주면 fsync 뒤 교체 전에 임시 파일 경로로 호출하며, 예외를 올리면 교체하지 않습니다.
+
+    사용 예:
+        with atomic_write(path, backup_path=path + '.bak') as f:
+            f.write(data)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp = _temp_path_for(path)
+    try:
+        with open(tmp, 'xb') as f:
+            yield f
+            with timed('write'):
+                f.flush()
+                os.fsync(f.fileno())
+        if verify is not None:
+            verify(tmp)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+            if backup_path:
+                with timed('backup', os.path.getsize(path)):
+                    _preserve_as_backup(path, backup_path)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    _fsync_dir(directory)
+    invalidate_buffer_cache(path)
+
+
+def copy_save_file(src: str, dst: str) -> None:
+    """세이브를 다른 경로로 복사합니다 (가능하면 reflink, 아니면 복사. dst는 원자적으로 교체)."""
+    with open(src, 'rb') as f_src, atomic_write(dst) as f_dst:
+        if not _reflink_fd(f_src.fileno(), f_dst.fileno()):
+            shutil.copyfileobj(f_src, f_dst, STREAM_CHUNK_SIZE)
+
+
+def _gzip_header(path: str, level: int) -> bytes:
+    """gzip 모듈과 같은 형식의 GZIP 헤더(파일명 포함)를 만듭니다."""
+    fname = os.path.basename(path)
+    try:
+        fname = fname.encode('latin-1')
+    except UnicodeEncodeError:
+        fname = b''
+    if fname.endswith(b'.gz'):
+        fname = fname[:-3]
+    flags = 0x08 if fname else 0
+    xfl = 2 if level == 9 else 4 if level == 1 else 0
+    header = b'\x1f\x8b\x08' + bytes([flags]) + struct.pack('<L', int(time.time())) + bytes([xfl, 255])
+    if fname:
+        header += fname + b'\x00'
+    return header
+
+
+def _deflate_block(block: memoryview, level: int, last: bool) -> bytes:
+    """
+    블록 하나를 독립적인 raw deflate 조각으로 압축합니다.
+    마지막이 아니면 full flush로 끝내 바이트 경계에서 끝나므로, 조각들을 이어 붙이면
+    하나의 올바른 deflate 스트림이 됩니다.
+    """
+    c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return c.compress(block) + c.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+
+
+class SaveVerifyError(ValueError):
+    """저장한 파일이 쓰려던 내용과 다름 (저장 후 검증 실패). 기존 파일은 바뀌지 않습니다."""
+
+
+def verify_save_file(
+    path: str,
+    crc: int,
+    length: int,
+    expected: dict[int, bytes] | None = None,
+    start: tuple[int, int, int] | None = None,
+) -> None:
+    """
+    저장한 .hsg 파일을 한 번 스트리밍 해제하며 CRC32·길이와 수정한 값을 확인합니다.
+    해제한 조각은 바로 버리므로 세이브 크기만큼의 버퍼를 만들지 않습니다.
+
+    Args:
+        path: 확인할 파일 (보통 교체 전 임시 파일)
+        crc: 저장하려던 해제 데이터의 CRC32
+        length: 저장하려던 해제 데이터 길이
+        expected: 해제 오프셋 -> 그 자리에 있어야 할 바이트 (수정한 값)
+        start: (압축 파일 오프셋, 해제 오프셋, 그 앞까지의 CRC32). full flush 블록 경계이며,
+            주면 그 블록부터 해제합니다 (증분 저장에서 해시로 확인하며 복사한 앞부분은 건너뜀)
+
+    Raises:
+        SaveVerifyError: 해제할 수 없거나 CRC/길이/값이 다른 경우
+    """
+    if start is None:
+        file_pos, pos, running = 0, 0, 0
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    else:
+        file_pos, pos, running = start
+        d = zlib.decompressobj(-zlib.MAX_WBITS)
+    # 건너뛴 앞부분의 값은 복사할 때 확인했으므로 제외
+    checks = sorted((off, value) for off, value in (expected or {}).items() if off >= pos)
+    if checks and checks[-1][0] + len(checks[-1][1]) > length:
+        raise SaveVerifyError(f'수정한 오프셋 {checks[-1][0]}이 데이터 길이 {length}를 넘습니다.')
+    ci = 0
+    with timed('verify') as t, open(path, 'rb') as f:
+        f.seek(file_pos)
+        try:
+            while not d.eof:
+                raw = f.read(STREAM_CHUNK_SIZE)
+                if not raw:
+                    break
+                while raw and not d.eof:
+                    out = d.decompress(raw, STREAM_CHUNK_SIZE)
+                    raw = d.unconsumed_tail
+                    end = pos + len(out)
+                    running = zlib.crc32(out, running)
+                    j = ci
+                    while j < len(checks) and checks[j][0] < end:
+                        off, value = checks[j]
+                        lo, hi = max(off, pos), min(off + len(value), end)
+                        if lo < hi and out[lo - pos : hi - pos] != value[lo - off : hi - off]:
+                            raise SaveVerifyError(f'오프셋 {off}의 값이 쓰려던 값과 다릅니다.')
+                        j += 1
+                    while ci < len(checks) and checks[ci][0] + len(checks[ci][1]) <= end:
+                        ci += 1
+                    pos = end
+            tail = d.unused_data + f.read()
+        except zlib.error as e:
+            raise SaveVerifyError(f'저장한 파일의 압축을 풀 수 없습니다: {e}') from None
+        t.nbytes = pos - (start[1] if start else 0)
+    if not d.eof:
+        raise SaveVerifyError('저장한 파일이 중간에 끝났습니다.')
+    if start is not None:
+        # raw deflate는 GZIP 꼬리(CRC32, 길이)를 직접 확인
+        if tail[:8] != struct.pack('<LL', crc, length & 0xFFFFFFFF):
+            raise SaveVerifyError('저장한 파일의 GZIP 꼬리(CRC/길이)가 다릅니다.')
+        tail = tail[8:]
+    if tail:
+        raise SaveVerifyError(f'저장한 파일 끝에 알 수 없는 데이터 {len(tail)}바이트가 있습니다.')
+    if pos != length:
+        raise SaveVerifyError(f'해제한 길이가 다릅니다 ({pos} != {length}).')
+    if running != crc:
+        raise SaveVerifyError('해제한 내용의 CRC32가 쓰려던 내용과 다릅니다.')
+
+
+class IncrementalSource(NamedTuple):
+    """
+    증분 저장의 기준: 버퍼를 해제한 원본 파일과 그때의 크기/수정 시각, 처음 바뀐 해제 오프셋.
+    원본이 이 상태 그대로이고 복원 지점 목록이 있으면, 바뀐 곳 앞의 압축 블록은 그대로 복사합니다.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    dirty_from: int
+
+
+class _StaleRestartIndex(Exception):
+    """원본 파일의 압축 블록이 복원 지점 목록과 달라 증분 저장을 할 수 없음 (내부용)."""
+
+
+class _NothingChanged(Exception):
+    """스트리밍 수정에서 바뀐 바이트가 없어 임시 파일을 버림 (내부용)."""
+
+
+def compress_and_save(
+    data: bytes,
+    path: str,
+    level: int = DEFAULT_COMPRESS_LEVEL,
+    workers: int | None = None,
+    backup_path: str | None = None,
+    incremental: IncrementalSource | None = None,
+    verify: bool | None = None,
+    expected: dict[int, bytes] | None = None,
+) -> None:
+    """
+    바이트 데이터를 GZIP으로 압축하여 .hsg 파일로 저장합니다.
+
+    pigz처럼 데이터를 블록으로 나눠 스레드 풀에서 동시에 압축합니다 (zlib은 압축 중 GIL을
+    놓음). 각 블록은 full flush로 끝나는 독립 조각이고, 앞에서부터 순서대로 이어 쓰므로
+    결과는 게임이 읽을 수 있는 일반 단일 GZIP 스트림입니다.
+    저장은 atomic_write()로 하므로 도중에 멈춰도 기존 파일은 그대로 남습니다.
+
+    블록 경계(복원 지점)는 캐시 폴더에 기록해 두고, incremental을 주면 처음 바뀐 오프셋 앞의
+    블록은 원본 파일에서 압축된 그대로 복사하고 그 뒤만 다시 압축합니다. 게임이 쓴 세이브처럼
+    기록이 없거나 원본이 바뀌었으면 전체를 압축합니다.
+
+    verify이면 압축하며 구한 CRC32·길이와 수정한 값(expected)을 교체 전 임시 파일에서
+    verify_save_file()로 확인하고, 다르면 SaveVerifyError를 올리며 기존 파일을 그대로 둡니다.
+    증분 저장이면 다시 압축한 블록부터만 해제해 확인합니다.
+
+    Args:
+        data: 압축할 바이너리
+        path: 저장할 .hsg 파일 경로
+        level: 압축 수준 0~9 (기본 9)
+        workers: 압축 스레드 수 (기본: COMPRESS_WORKERS, 없으면 CPU 수)
+        backup_path: 주면 덮어쓰기 직전 기존 파일을 이 경로로 보존 (하드링크 우선)
+        incremental: 증분 저장 기준 (SaveFile.commit이 넘김)
+        verify: 저장 후 검증 (기본: 기존 파일을 덮어쓸 때만)
+        expected: 검증할 때 확인할 해제 오프셋 -> 바이트 (수정한 값)
+    """
+    if verify is None:
+        verify = os.path.exists(path)
+    checks = expected if verify else None
+    restart = get_restart_index()
+    plan = None
+    if restart is not None and incremental is not None:
+        plan = restart.plan(incremental, level)
+    if plan is not None:
+        try:
+            _write_compressed(data, path, level, workers, backup_path, restart, plan, verify, checks)
+            return
+        except _StaleRestartIndex:
+            restart.discard(incremental.path)
+    _write_compressed(data, path, level, workers, backup_path, restart, None, verify, checks)
+
+
+def _write_compressed(
+    data: bytes,
+    path: str,
+    level: int,
+    workers: int | None,
+    backup_path: str | None,
+    restart: 'RestartIndexCache | None',
+    plan: 'RestartPlan | None',
+    verify: bool = False,
+    expected: dict[int, bytes] | None = None,
+) -> None:
+    """compress_and_save 본체. plan이 있으면 앞쪽 블록을 원본에서 검증하며 복사합니다."""
+    view = memoryview(data)
+    total = len(view)
+    starts = range(0, total, COMPRESS_BLOCK_SIZE) if total else range(1)
+    last_start = starts[-1]
+    first = plan.first_block if plan is not None else 0
+    workers = workers or COMPRESS_WORKERS or os.cpu_count() or 1
+    crc = 0
+    # 블록별 (해제 오프셋, deflate 스트림 안 압축 오프셋, 블록 앞까지의 CRC, 압축 블록 해시)
+    points: list[RestartPoint] = []
+    deflate_pos = 0
+    # 압축과 쓰기가 겹쳐 진행되므로 쓰기 시간만 따로 재고 나머지를 압축 시간으로 기록
+    began = time.perf_counter()
+    write_seconds = 0.0
+    written = 0
+
+    def emit(chunk: bytes) -> None:
+        nonlocal write_seconds, written
+        t0 = time.perf_counter()
+        f.write(chunk)
+        write_seconds += time.perf_counter() - t0
+        written += len(chunk)
+
+    def emit_block(start: int, crc_before: int, chunk: bytes) -> None:
+        nonlocal deflate_pos
+        points.append(RestartPoint(start, deflate_pos, crc_before, _block_digest(chunk)))
+        deflate_pos += len(chunk)
+        emit(chunk)
+
+    def check(tmp_path: str) -> None:
+        # 교체 전 임시 파일 확인. 복사한 앞쪽 블록은 해시로 확인했으므로 다시 압축한 첫 블록부터
+        start = None
+        if first:
+            point = points[first]
+            start = (len(header) + point.deflate_offset, point.offset, point.crc)
+        verify_save_file(tmp_path, crc, total, expected, start)
+
+    with atomic_write(path, backup_path, check if verify else None) as f, ThreadPoolExecutor(max_workers=workers) as pool:
+        header = _gzip_header(path, level)
+        emit(header)
+        if plan is not None:
+            # 바뀌지 않은 앞쪽 블록: 원본에서 읽어 해시를 확인하며 그대로 복사
+            with open(plan.source, 'rb') as src:
+                src.seek(plan.header_len)
+                for point, next_point in zip(plan.points, plan.points[1 : first + 1]):
+                    t0 = time.perf_counter()
+                    chunk = src.read(next_point.deflate_offset - point.deflate_offset)
+                    write_seconds += time.perf_counter() - t0
+                    if _block_digest(chunk) != point.digest:
+                        raise _StaleRestartIndex(plan.source)
+                    emit_block(point.offset, point.crc, chunk)
+            crc = plan.points[first].crc
+        # 메모리를 제한하기 위해 진행 중인 블록 수를 스레드 수의 2배로 제한하고 순서대로 씀
+        in_flight: deque = deque()
+        for start in starts[first:]:
+            block = view[start : start + COMPRESS_BLOCK_SIZE]
+            future = pool.submit(_deflate_block, block, level, start == last_start)
+            in_flight.append((start, crc, future))
+            crc = zlib.crc32(block, crc)
+            if len(in_flight) >= workers * 2:
+                start_, crc_, future_ = in_flight.popleft()
+                emit_block(start_, crc_, future_.result())
+        while in_flight:
+            start_, crc_, future_ = in_flight.popleft()
+            emit_block(start_, crc_, future_.result())
+        emit(struct.pack('<LL', crc, total & 0xFFFFFFFF))
+        compressed_at = time.perf_counter()
+    # fsync/백업/교체 시간은 atomic_write()가 따로 기록
+    timings = getattr(_timing_state, 'timings', None)
+    if timings is not None:
+        timings.add('compress', compressed_at - began - write_seconds, total - first * COMPRESS_BLOCK_SIZE)
+        timings.add('write', write_seconds, written)
+    if restart is not None:
+        restart.store(path, level, len(header), total, points)
+
+
+def get_cache_dir() -> str:
+    """
+    에디터 캐시 폴더 경로를 반환합니다.
+    환경 변수 BA_SAVE_EDITOR_CACHE가 있으면 그 경로, Windows는 %LOCALAPPDATA%\\BigAmbitionsSaveEditor,
+    그 밖에는 ~/.cache/big_ambitions_save_editor
+    """
+    env = os.environ.get('BA_SAVE_EDITOR_CACHE')
+    if env:
+        return env
+    local = os.environ.get('LOCALAPPDATA')
+    if local:
+        return os.path.join(local, 'BigAmbitionsSaveEditor')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'big_ambitions_save_editor')
+
+
+def _stat_signature(path: str) -> tuple[int, int]:
+    """파일 크기와 수정 시각(ns)."""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _stat_key(path: str, st: os.stat_result | None = None) -> str:
+    """경로 + inode + 크기 + 수정 시각으로 만든 가벼운 키 (파일 내용은 읽지 않음)."""
+    st = st or os.stat(path)
+    h = hashlib.blake2b(os.path.abspath(path).encode('utf-8', 'surrogatepass'), digest_size=8)
+    return f'{h.hexdigest()}-{st.st_ino}-{st.st_size}-{st.st_mtime_ns}'
+
+
+def save_content_key(path: str, content: bytes | None = None) -> str:
+    """
+    압축된 세이브 파일 내용의 해시 + 크기 + 수정 시각으로 캐시 키를 만듭니다.
+    내용이 조금이라도 바뀌면 키가 달라집니다.
+
+    Args:
+        path: .hsg 파일 경로
+        content: 이미 읽어 둔 압축 파일 내용 (없으면 파일을 읽어 해시)
+    """
+    size, mtime_ns = _stat_signature(path)
+    h = hashlib.blake2b(digest_size=16)
+    if content is None:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                h.update(block)
+    else:
+        h.update(content)
+    return f'{h.hexdigest()}-{size}-{mtime_ns}'
+
+
+class OffsetIndexCache:
+    """
+    필드 오프셋 인덱스를 캐시 폴더에 저장해 두는 디스크 캐시 (프로세스 간 공유).
+
+    - 키: save_content_key() (압축 파일 해시 + 크기 + 수정 시각). 해시를 구하려면 파일 전체를 읽어야 하므로,
+      내용 키를 구한 파일은 stat 기반 키(경로/inode/크기/수정 시각)로 link()해 두고 key_for()로 찾음
+    - 값: 필드 검색 패턴(UTF-16 이름 + 태그, hex) -> 첫 값 오프셋, 만들어 둔 경우 전체 FieldIndex
+    항목은 키별 파일 하나이며 임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 반쯤 쓴 항목을
+    읽지 않습니다. 총 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지웁니다.
+    memory_entries > 0이면 최근 항목을 메모리에도 두어 디스크를 다시 읽지 않습니다 (상주 서비스용,
+    키가 내용 해시이므로 항목은 바뀌지 않음; 돌려준 값은 고치지 말 것).
+    """
+
+    __slots__ = ('directory', 'max_bytes', 'memory_entries', '_memory', '_lock')
+
+    _MAGIC = b'BAIX\x02'
+    _KEY_RE = re.compile(r'[0-9a-f]+-\d+-\d+')
+
+    def __init__(self, directory: str, max_bytes: int = INDEX_CACHE_MAX_BYTES, memory_entries: int = 0) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, tuple[dict[bytes, int], FieldIndex | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, entry: tuple[dict[bytes, int], FieldIndex | None]) -> None:
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.idx')
+
+    def key_for(self, path: str) -> str:
+        """
+        파일을 읽지 않고 path의 캐시 키를 구합니다. 같은 파일(경로/inode/크기/수정 시각)의 내용 키를
+        link()해 두었으면 그 키, 없으면 stat 기반 키 (파일이 바뀌면 다른 키가 되어 쓰이지 않음).
+        """
+        stat_key = _stat_key(path)
+        try:
+            with open(os.path.join(self.directory, stat_key + '.key'), encoding='ascii') as f:
+                key = f.read().strip()
+        except (OSError, ValueError):
+            key = ''
+        return key if self._KEY_RE.fullmatch(key) else 'stat-' + stat_key
+
+    def link(self, path: str, key: str, st: os.stat_result | None = None) -> None:
+        """
+        path의 지금 stat(또는 내용을 읽을 때 구한 st)을 내용 키 key에 연결합니다.
+        실패해도 무시합니다 (캐시는 최선 노력).
+        """
+        try:
+            alias = os.path.join(self.directory, _stat_key(path, st) + '.key')
+            tmp = _temp_path_for(alias)
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'w', encoding='ascii') as f:
+                f.write(key)
+            os.replace(tmp, alias)
+        except OSError:
+            return
+        _evict_oldest(self.directory, '.key', INDEX_ALIAS_MAX_BYTES)
+
+    def load(self, key: str) -> tuple[dict[str, int], FieldIndex | None] | None:
+        """
+        캐시 항목을 읽습니다. 없거나 손상되었으면 None (손상된 항목은 지움).
+
+        Returns:
+            (검색 패턴 -> 값 오프셋, FieldIndex 또는 None)
+        """
+        if self.memory_entries > 0:
+            with self._lock:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+                    return entry
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            return None
+        try:
+            if not raw.startswith(self._MAGIC):
+                raise ValueError('캐시 형식이 다릅니다.')
+            pos = len(self._MAGIC)
+            (meta_len,) = struct.unpack_from('<I', raw, pos)
+            pos += 4
+            meta = json.loads(raw[pos : pos + meta_len])
+            pos += meta_len
+            offsets = {bytes.fromhex(key): int(off) for key, off in meta['fields'].items()}
+            index = FieldIndex.from_bytes(raw[pos:]) if meta.get('index') else None
+        except (ValueError, KeyError, TypeError, struct.error):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path)  # LRU: 최근 사용 표시
+        except OSError:
+            pass
+        self._remember(key, (offsets, index))
+        return offsets, index
+
+    def store(self, key: str, offsets: dict[bytes, int], index: FieldIndex | None = None) -> None:
+        """캐시 항목을 저장합니다. 실패해도 무시합니다 (캐시는 최선 노력)."""
+        self._remember(key, (dict(offsets), index))
+        fields = {pattern.hex(): off for pattern, off in offsets.items()}
+        meta = json.dumps({'fields': fields, 'index': index is not None}).encode('utf-8')
+        body = self._MAGIC + struct.pack('<I', len(meta)) + meta
+        if index is not None:
+            body += index.to_bytes()
+        path = self._path(key)
+        tmp = _temp_path_for(path)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """총 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 지웁니다."""
+        _evict_oldest(self.directory, '.idx', self.max_bytes)
+
+
+def _evict_oldest(directory: str, suffix: str, max_bytes: int) -> None:
+    """directory 안 suffix 파일들의 총 크기가 max_bytes 이하가 될 때까지 수정 시각이 오래된 것부터 지웁니다."""
+    entries = []
+    total = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(suffix):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total += st.st_size
+    except OSError:
+        return
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+_index_cache: OffsetIndexCache | None = None
+_index_cache_enabled = not os.environ.get('BA_SAVE_EDITOR_NO_CACHE')
+
+
+def configure_index_cache(
+    enabled: bool = True,
+    directory: str | None = None,
+    max_bytes: int = INDEX_CACHE_MAX_BYTES,
+    memory_entries: int = 0,
+) -> None:
+    """
+    오프셋 인덱스 디스크 캐시를 켜고 끄거나 위치/용량을 바꿉니다.
+
+    Args:
+        enabled: False면 캐시를 쓰지 않음 (항상 스캔)
+        directory: 캐시 폴더 (기본: get_cache_dir()/index)
+        max_bytes: 캐시 총 용량
+        memory_entries: 메모리에도 둘 최근 항목 수 (0이면 매번 디스크에서 읽음)
+    """
+    global _index_cache, _index_cache_enabled
+    _index_cache_enabled = enabled
+    _index_cache = OffsetIndexCache(
+        directory or os.path.join(get_cache_dir(), 'index'), max_bytes, memory_entries
+    )
+
+
+def get_index_cache() -> OffsetIndexCache | None:
+    """현재 오프셋 인덱스 캐시. 꺼져 있으면 None"""
+    global _index_cache
+    if not _index_cache_enabled:
+        return None
+    if _index_cache is None:
+        _index_cache = OffsetIndexCache(os.path.join(get_cache_dir(), 'index'))
+    return _index_cache
+
+
+class RestartPoint(NamedTuple):
+    """압축 블록 하나의 복원 지점: 해제 오프셋, deflate 스트림 안 압축 오프셋, 그 앞까지의 CRC32, 압축 블록 해시."""
+
+    offset: int
+    deflate_offset: int
+    crc: int
+    digest: bytes
+
+
+class RestartPlan(NamedTuple):
+    """증분 저장 계획: 원본 경로, 원본 GZIP 헤더 길이, 원본 복원 지점들, 다시 압축할 첫 블록 번호."""
+
+    source: str
+    header_len: int
+    points: list[RestartPoint]
+    first_block: int
+
+
+def _block_digest(chunk: bytes) -> bytes:
+    return hashlib.blake2b(chunk, digest_size=8).digest()
+
+
+class RestartIndexCache:
+    """
+    에디터가 쓴 세이브의 압축 블록 경계(복원 지점) 목록을 캐시 폴더에 저장해 두는 디스크 캐시.
+
+    compress_and_save()의 블록은 full flush로 끝나 서로 독립이므로, 어느 블록 경계에서든 그 앞의
+    압축 바이트를 그대로 두고 뒤만 다시 압축할 수 있습니다.
+    - 키: 세이브 경로 (항목은 경로별 파일 하나, 마지막으로 쓴 상태만 보관)
+    - 값: 쓴 직후 파일 크기/수정 시각, 압축 수준, 블록 크기, GZIP 헤더 길이, 블록별 RestartPoint
+    파일 크기/수정 시각이 다르면(게임이 다시 저장 등) 쓰지 않습니다.
+    """
+
+    __slots__ = ('directory', 'max_bytes')
+
+    _MAGIC = b'BARS\x01'
+    _POINT = struct.Struct('<QQI8s')
+
+    def __init__(self, directory: str, max_bytes: int = RESTART_INDEX_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, save_path: str) -> str:
+        key = os.path.normcase(os.path.abspath(save_path)).encode('utf-8')
+        return os.path.join(self.directory, hashlib.blake2b(key, digest_size=16).hexdigest() + '.rst')
 
-def find_field_value_offset(data: bytes, field_utf16: bytes, value_size: int = 4) -> int:
+    def plan(self, source: IncrementalSource, level: int) -> RestartPlan | None:
+        """
+        source 기준으로 증분 저장할 수 있으면 계획을, 아니면 None을 돌려줍니다.
+        처음 바뀐 오프셋이 첫 블록 안이면 이득이 없으므로 None
+        """
+        first = source.dirty_from // COMPRESS_BLOCK_SIZE
+        if first < 1:
+            return None
+        try:
+            with open(self._path(source.path), 'rb') as f:
+                raw = f.read()
+            if not raw.startswith(self._MAGIC):
+                return None
+            pos = len(self._MAGIC)
+            (meta_len,) = struct.unpack_from('<I', raw, pos)
+            pos += 4
+            meta = json.loads(raw[pos : pos + meta_len])
+            pos += meta_len
+            if (
+                meta['path'] != os.path.abspath(source.path)
+                or meta['size'] != source.size
+                or meta['mtime_ns'] != source.mtime_ns
+                or meta['level'] != level
+                or meta['block_size'] != COMPRESS_BLOCK_SIZE
+            ):
+                return None
+            points = [RestartPoint(*fields) for fields in self._POINT.iter_unpack(raw[pos:])]
+        except (OSError, ValueError, KeyError, TypeError, struct.error):
+            return None
+        if first >= len(points):
+            return None
+        return RestartPlan(source.path, meta['header_len'], points, first)
+
+    def store(self, save_path: str, level: int, header_len: int, total: int, points: list[RestartPoint]) -> None:
+        """방금 쓴 세이브의 복원 지점을 저장합니다. 실패해도 무시합니다 (캐시는 최선 노력)."""
+        try:
+            st = os.stat(save_path)
+        except OSError:
+            return
+        meta = json.dumps(
+            {
+                'path': os.path.abspath(save_path),
+                'size': st.st_size,
+                'mtime_ns': st.st_mtime_ns,
+                'level': level,
+                'block_size': COMPRESS_BLOCK_SIZE,
+                'header_len': header_len,
+                'total': total,
+            }
+        ).encode('utf-8')
+        body = self._MAGIC + struct.pack('<I', len(meta)) + meta
+        body += b''.join(self._POINT.pack(*point) for point in points)
+        path = self._path(save_path)
+        tmp = _temp_path_for(path)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        _evict_oldest(self.directory, '.rst', self.max_bytes)
+
+    def discard(self, save_path: str) -> None:
+        """맞지 않는 항목을 지웁니다."""
+        try:
+            os.remove(self._path(save_path))
+        except OSError:
+            pass
+
+
+_restart_index: RestartIndexCache | None = None
+_restart_index_enabled = not os.environ.get('BA_SAVE_EDITOR_NO_CACHE')
+
+
+def configure_restart_index(enabled: bool = True, directory: str | None = None) -> None:
     """
-    바이너리 데이터에서 UTF-16 필드명 위치를 찾고, 그 뒤 값의 시작 오프셋을 반환합니다.
+    복원 지점 캐시(증분 저장)를 켜고 끄거나 위치를 바꿉니다.
 
     Args:
-        data: 압축 해제된 세이브 바이너리
-        field_utf16: UTF-16으로 인코딩된 필드명 (예: b'M\\x00o\\x00n\\x00e\\x00y\\x00')
-        value_size: 값 크기(바이트). float=4, double=8
+        enabled: False면 항상 전체를 압축하고 복원 지점도 기록하지 않음
+        directory: 캐시 폴더 (기본: get_cache_dir()/restart)
+    """
+    global _restart_index, _restart_index_enabled
+    _restart_index_enabled = enabled
+    _restart_index = RestartIndexCache(directory or os.path.join(get_cache_dir(), 'restart'))
 
-    Returns:
-        값이 시작하는 바이트 오프셋. 없으면 -1
+
+def get_restart_index() -> RestartIndexCache | None:
+    """현재 복원 지점 캐시. 꺼져 있으면 None"""
+    global _restart_index
+    if not _restart_index_enabled:
+        return None
+    if _restart_index is None:
+        _restart_index = RestartIndexCache(os.path.join(get_cache_dir(), 'restart'))
+    return _restart_index
+
+
+def cache_settings(enabled: bool = True) -> dict:
     """
-    idx = data.find(field_utf16)
-    if idx < 0:
-        return -1
-    # 필드명 길이만큼 건너뛴 뒤가 값 (일부 필드는 중간에 타입 바이트가 있을 수 있음)
-    value_start = idx + len(field_utf16)
-    if value_start + value_size > len(data):
-        return -1
-    return value_start
+    지금 프로세스의 디스크 캐시 설정 (오프셋 인덱스, 복원 지점). 작업 프로세스에 넘겨
+    apply_cache_settings()로 같은 설정을 쓰게 합니다 (spawn 방식에서는 부모의 설정이 이어지지 않음).
+    enabled가 False면 두 캐시 모두 끈 설정을 돌려줍니다.
+    """
+    return {
+        'index': {
+            'enabled': enabled and _index_cache_enabled,
+            'directory': _index_cache.directory if _index_cache is not None else None,
+            'max_bytes': _index_cache.max_bytes if _index_cache is not None else INDEX_CACHE_MAX_BYTES,
+        },
+        'restart': {
+            'enabled': enabled and _restart_index_enabled,
+            'directory': _restart_index.directory if _restart_index is not None else None,
+        },
+    }
 
 
-def read_float_at(data: bytes, offset: int) -> float:
-    """지정 오프셋에서 little-endian float 4바이트를 읽습니다."""
-    return struct.unpack('<f', data[offset : offset + 4])[0]
+def apply_cache_settings(settings: dict) -> None:
+    """cache_settings() 결과를 이 프로세스에 적용합니다."""
+    configure_index_cache(**settings['index'])
+    configure_restart_index(**settings['restart'])
 
 
-def write_float_at(data: bytearray, offset: int, value: float) -> None:
-    """지정 오프셋에 little-endian float 4바이트를 씁니다."""
-    data[offset : offset + 4] = struct.pack('<f', value)
+class DecompressedBufferCache:
+    """
+    해제된 세이브 버퍼 메모리 캐시 (프로세스 안에서 공유, 스레드 안전).
+
+    - 키: 파일 경로. 항목마다 (크기, 수정 시각 ns, inode)를 기억해 두고 조회할 때 stat()으로 비교하므로
+      파일이 바뀌면 적중하지 않습니다.
+    - 값: 해제된 버퍼(bytes, 읽기 전용)와 오프셋 캐시 키 (save_content_key(), 없으면 None)
+    총 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+    """
 
+    __slots__ = ('max_bytes', '_entries', '_total', '_lock')
 
-def decompress_save(path: str) -> bytes:
+    def __init__(self, max_bytes: int = BUFFER_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[tuple[int, int, int], bytes, str | None]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def signature(st: os.stat_result) -> tuple[int, int, int]:
+        """캐시 항목 검증용 (크기, 수정 시각 ns, inode)."""
+        return st.st_size, st.st_mtime_ns, st.st_ino
+
+    def get(self, path: str) -> tuple[bytes, str | None] | None:
+        """
+        파일이 캐시에 넣을 때와 같으면 (버퍼, 오프셋 캐시 키). 없거나 바뀌었으면 None
+        """
+        key = self._key(path)
+        try:
+            sig = self.signature(os.stat(path))
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != sig:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    def put(self, path: str, sig: tuple[int, int, int], data: bytes, content_key: str | None) -> None:
+        """버퍼를 넣습니다. 하나가 용량보다 크면 넣지 않습니다."""
+        key = self._key(path)
+        with self._lock:
+            self._drop(key)
+            if len(data) > self.max_bytes:
+                return
+            self._entries[key] = (sig, data, content_key)
+            self._total += len(data)
+            while self._total > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, path: str) -> None:
+        """경로의 항목을 버립니다 (이 프로세스가 파일을 쓴 직후 호출)."""
+        with self._lock:
+            self._drop(self._key(path))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def stats(self) -> dict:
+        """항목 수와 사용 중인 크기 / 용량 (바이트)."""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._total, 'max_bytes': self.max_bytes}
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total -= len(entry[1])
+
+
+_buffer_cache: DecompressedBufferCache | None = None
+
+
+def configure_buffer_cache(max_bytes: int = BUFFER_CACHE_MAX_BYTES) -> None:
     """
-    .hsg 파일을 GZIP 해제하여 바이트 데이터를 반환합니다.
+    해제된 버퍼 메모리 캐시 용량을 바꿉니다. 0이면 캐시를 끕니다 (기존 항목은 버림).
+    """
+    global _buffer_cache
+    _buffer_cache = DecompressedBufferCache(max_bytes) if max_bytes > 0 else None
+
+
+def get_buffer_cache() -> DecompressedBufferCache | None:
+    """현재 해제된 버퍼 캐시. 꺼져 있으면 None"""
+    return _buffer_cache
+
+
+def invalidate_buffer_cache(path: str) -> None:
+    """이 프로세스가 path에 쓴 뒤 호출해 이전 버퍼가 쓰이지 않게 합니다."""
+    if _buffer_cache is not None:
+        _buffer_cache.invalidate(path)
+
+
+def _decompress_cached(path: str, need_key: bool = False) -> tuple[bytes, str | None]:
+    """
+    버퍼 캐시를 거쳐 세이브를 해제합니다. 적중하면 stat() 한 번으로 끝납니다.
 
     Args:
-        path: .hsg 파일 경로
+        need_key: True면 오프셋 캐시 키도 계산 (해제할 때 이미 읽은 압축 내용으로 해시)
 
     Returns:
-        압축 해제된 바이너리
+        (해제된 버퍼, 오프셋 캐시 키 또는 None)
     """
-    with gzip.open(path, 'rb') as f:
-        return f.read()
+    cache = _buffer_cache
+    if cache is not None:
+        hit = cache.get(path)
+        if hit is not None:
+            data, content_key = hit
+            if need_key and content_key is None:
+                content_key = save_content_key(path)
+            return data, content_key
+    with timed('read') as t, open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        compressed = f.read()
+        t.nbytes = len(compressed)
+    with timed('decompress') as t:
+        data = gzip.decompress(compressed)
+        t.nbytes = len(data)
+    content_key = save_content_key(path, compressed) if need_key or cache is not None else None
+    index_cache = get_index_cache()
+    if index_cache is not None and content_key:
+        index_cache.link(path, content_key, st)
+    if cache is not None:
+        cache.put(path, DecompressedBufferCache.signature(st), data, content_key)
+    return data, content_key
 
 
-def compress_and_save(data: bytes, path: str) -> None:
+_env_buffer_mb = os.environ.get('BA_SAVE_EDITOR_BUFFER_CACHE_MB')
+configure_buffer_cache(int(_env_buffer_mb) << 20 if _env_buffer_mb else BUFFER_CACHE_MAX_BYTES)
+
+
+def field_utf16(name: str) -> bytes:
+    """필드 이름을 세이브 안에 저장된 UTF-16(LE) 바이트열로 바꿉니다."""
+    return SAVE_FIELDS.get(name) or name.encode('utf-16-le')
+
+
+class FieldSpec(NamedTuple):
     """
-    바이트 데이터를 GZIP으로 압축하여 .hsg 파일로 저장합니다.
+    세이브 필드 선언.
+
+    - name: 세이브에 UTF-16으로 저장된 필드명
+    - value_type: 값 타입 (VALUE_CODECS 키: float32/float64/int32/int64/bool)
+    - tag: 필드명과 값 사이의 타입 태그 바이트 (이 바이트까지 일치하는 위치만 필드로 인정)
+    - occurrence: 'first'(첫 위치만) 또는 'all'(모든 위치를 한꺼번에 읽기/쓰기)
+    """
+
+    name: str
+    value_type: str = 'float32'
+    tag: bytes = b''
+    occurrence: str = 'first'
+
+    @property
+    def pattern(self) -> bytes:
+        """검색할 바이트열 (UTF-16 필드명 + 태그). 바로 뒤가 값입니다."""
+        return field_utf16(self.name) + self.tag
+
+    @property
+    def codec(self) -> struct.Struct:
+        """값 타입의 미리 컴파일된 코덱."""
+        return VALUE_CODECS[self.value_type]
+
+
+# 등록된 필드 스키마 (이름 -> FieldSpec). 등록되지 않은 필드는 float32 / 태그 없음 / 첫 위치로 취급
+FIELD_SCHEMA: dict[str, FieldSpec] = {name: FieldSpec(name) for name in SAVE_FIELDS}
+
+
+def register_field(
+    name: str,
+    value_type: str = 'float32',
+    tag: bytes = b'',
+    occurrence: str = 'first',
+) -> FieldSpec:
+    """
+    필드 선언을 스키마에 등록합니다 (같은 이름이 있으면 교체).
+
+    Raises:
+        ValueError: 알 수 없는 값 타입/등장 정책이거나 이름이 비어 있는 경우
+    """
+    if not name:
+        raise ValueError('필드 이름이 비어 있습니다.')
+    if value_type not in VALUE_CODECS:
+        raise ValueError(f'알 수 없는 값 타입: {value_type} (가능: {", ".join(VALUE_CODECS)})')
+    if occurrence not in OCCURRENCE_POLICIES:
+        raise ValueError(f'알 수 없는 등장 정책: {occurrence} (가능: {", ".join(OCCURRENCE_POLICIES)})')
+    spec = FieldSpec(name, value_type, bytes(tag), occurrence)
+    FIELD_SCHEMA[name] = spec
+    return spec
+
+
+def load_field_schema(path: str) -> list[FieldSpec]:
+    """
+    JSON 스키마 파일의 필드들을 등록합니다.
+
+    형식:
+        {"fields": [{"name": "Salary", "type": "float32", "tag": "0400", "occurrence": "all"}]}
+    type/tag(hex 문자열)/occurrence는 생략 가능 (float32 / 없음 / first).
+
+    Returns:
+        등록한 FieldSpec 목록
+    """
+    with open(path, encoding='utf-8') as f:
+        doc = json.load(f)
+    specs = []
+    for entry in doc.get('fields', []):
+        specs.append(
+            register_field(
+                entry['name'],
+                entry.get('type', 'float32'),
+                bytes.fromhex(entry.get('tag', '')),
+                entry.get('occurrence', 'first'),
+            )
+        )
+    return specs
+
+
+def field_spec(name: str, value_type: str | None = None) -> FieldSpec:
+    """
+    필드 선언을 반환합니다. 등록되지 않은 이름은 기본 선언, value_type을 주면 타입만 바꿉니다.
+    """
+    spec = FIELD_SCHEMA.get(name) or FieldSpec(name)
+    if value_type and value_type != spec.value_type:
+        if value_type not in VALUE_CODECS:
+            raise ValueError(f'알 수 없는 값 타입: {value_type}')
+        spec = spec._replace(value_type=value_type)
+    return spec
+
+
+def _coerce_value(value, value_type: str):
+    """입력 값(대개 float)을 값 타입에 맞게 바꿉니다."""
+    if value_type == 'bool':
+        return bool(value)
+    if value_type.startswith('int'):
+        return int(round(value))
+    return float(value)
+
+
+# 하나의 unpack_from으로 묶어 읽을 최대 구간 (그 사이 바이트는 패딩으로 건너뜀)
+_DECODE_GROUP_SPAN = 4096
+
+
+@lru_cache(maxsize=256)
+def _group_codec(layout: tuple[tuple[int, str], ...]) -> struct.Struct:
+    """(그룹 시작 기준 오프셋, 형식 문자) 목록을 패딩 포함 하나의 Struct로 컴파일합니다."""
+    fmt = ['<']
+    pos = 0
+    for rel, code in layout:
+        if rel > pos:
+            fmt.append(f'{rel - pos}x')
+        fmt.append(code)
+        pos = rel + struct.calcsize('<' + code)
+    return struct.Struct(''.join(fmt))
+
+
+def batch_decode(data: bytes, items: list[tuple[int, str]]) -> list:
+    """
+    여러 (오프셋, 값 타입)을 가까운 것끼리 묶어 그룹마다 unpack_from 한 번으로 읽습니다.
 
     Args:
-        data: 압축할 바이너리
-        path: 저장할 .hsg 파일 경로
+        data: 압축 해제된 세이브 바이너리
+        items: (값 시작 오프셋, 값 타입) 목록 (오프셋 < 0 이면 없음)
+
+    Returns:
+        items 순서의 값 목록 (없거나 데이터 끝을 넘으면 None)
+    """
+    result: list = [None] * len(items)
+    order = sorted(
+        (i for i, (off, vt) in enumerate(items) if off >= 0 and off + VALUE_CODECS[vt].size <= len(data)),
+        key=lambda i: items[i][0],
+    )
+    group: list[int] = []
+
+    def flush() -> None:
+        base = items[group[0]][0]
+        layout = tuple((items[i][0] - base, VALUE_CODECS[items[i][1]].format[1:]) for i in group)
+        for i, value in zip(group, _group_codec(layout).unpack_from(data, base)):
+            result[i] = value
+        group.clear()
+
+    group_end = 0
+    for i in order:
+        off, vt = items[i]
+        end = off + VALUE_CODECS[vt].size
+        # 겹치거나 그룹 구간을 넘으면 새 그룹
+        if group and (off < group_end or end - items[group[0]][0] > _DECODE_GROUP_SPAN):
+            flush()
+        group.append(i)
+        group_end = end
+    if group:
+        flush()
+    return result
+
+
+class SaveFile:
+    """
+    세이브 하나를 한 번만 해제해 두고 여러 번 읽기/수정한 뒤 한 번에 저장하는 세션.
+
+    - 입력: .hsg 파일 경로 (열 때 한 번 GZIP 해제, 버퍼 캐시에 있으면 해제 생략)
+    - 동작: 필드 검색 패턴 -> 값 오프셋 인덱스를 쌓아 두고 get/set, 변경이 있을 때만 commit에서 재압축
+    - 필드 타입/태그/등장 정책은 FIELD_SCHEMA 선언을 따릅니다.
+
+    사용 예:
+        with SaveFile(path) as save:
+            save.set('Money', 1000000)
+            save.commit()
     """
-    with gzip.open(path, 'wb') as f:
-        f.write(data)
+
+    __slots__ = (
+        'path',
+        '_data',
+        '_offsets',
+        '_all_offsets',
+        '_index',
+        '_dirty',
+        '_dirty_from',
+        '_expected',
+        '_patches',
+        '_source_sig',
+        '_cache',
+        '_cache_key',
+        '_cache_dirty',
+    )
+
+    def __init__(self, path: str, use_cache: bool = True) -> None:
+        """
+        Args:
+            path: .hsg 파일 경로
+            use_cache: True면 디스크 오프셋 인덱스 캐시를 사용 (적중 시 필드 스캔 생략)
+        """
+        self.path = path
+        self._cache = get_index_cache() if use_cache else None
+        # 캐시된 버퍼는 공유되므로 수정용 사본을 만듦
+        before = _stat_signature(path)
+        data, content_key = _decompress_cached(path, need_key=self._cache is not None)
+        self._data = bytearray(data)
+        # 해제한 파일의 크기/수정 시각 (증분 저장 기준). 읽는 도중 바뀌었으면 None
+        self._source_sig = before if _stat_signature(path) == before else None
+        # 검색 패턴 -> 첫 값 시작 오프셋 (-1: 세이브에 없음)
+        self._offsets: dict[bytes, int] = {}
+        # 검색 패턴 -> 모든 값 시작 오프셋 (등장 정책 all / 대량 수정용)
+        self._all_offsets: dict[bytes, array] = {}
+        self._index: FieldIndex | None = None
+        self._dirty = False
+        # 처음 바뀐 해제 오프셋 (이 앞의 압축 블록은 commit 때 다시 압축하지 않음)
+        self._dirty_from: int | None = None
+        # 고친 오프셋 -> 써 넣은 바이트 (commit 후 검증에서 파일과 비교)
+        self._expected: dict[int, bytes] = {}
+        # record_patches() 이후 바뀐 바이트 (오프셋, 이전 바이트, 새 바이트). None이면 모으지 않음
+        self._patches: list[tuple[int, bytes, bytes]] | None = None
+        self._cache_key = None
+        self._cache_dirty = False
+        if self._cache is not None:
+            self._cache_key = content_key
+            hit = self._cache.load(self._cache_key)
+            if hit is not None:
+                self._offsets.update(hit[0])
+                self._index = hit[1]
+
+    def __enter__(self) -> 'SaveFile':
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """해제된 버퍼를 놓습니다. 저장하지 않은 변경은 버려집니다."""
+        if self._data is not None:
+            self._flush_cache()
+        self._data = None
+        self._offsets.clear()
+        self._all_offsets.clear()
+        self._index = None
+
+    @property
+    def data(self) -> bytearray:
+        """압축 해제된 세이브 버퍼."""
+        if self._data is None:
+            raise ValueError('닫힌 세이브입니다.')
+        return self._data
+
+    @property
+    def dirty(self) -> bool:
+        """commit하지 않은 변경이 있으면 True."""
+        return self._dirty
+
+    def mark_dirty(self, offset: int = 0, length: int = 0) -> None:
+        """
+        data 버퍼를 직접 고친 뒤 호출해 변경으로 표시합니다.
+        offset은 고친 곳 중 가장 앞 오프셋 (모르면 0: commit 때 전체를 다시 압축).
+        length를 주면 지금 그 자리의 바이트를 기억해 두었다가 저장 후 검증에서 파일과 비교합니다.
+        """
+        self._dirty = True
+        if self._dirty_from is None or offset < self._dirty_from:
+            self._dirty_from = offset
+        if length and len(self._expected) < VERIFY_MAX_VALUES:
+            self._expected[offset] = bytes(self.data[offset : offset + length])
+
+    def record_patches(self) -> None:
+        """
+        이후 set/update/bulk_edit로 바뀌는 바이트를 (오프셋, 이전 바이트, 새 바이트) 패치로 모읍니다.
+        수정 기록(되돌리기/다시 실행)에 쓰며, take_patches()로 꺼냅니다.
+        """
+        if self._patches is None:
+            self._patches = []
+
+    def take_patches(self) -> list[tuple[int, bytes, bytes]]:
+        """모은 패치를 바뀐 순서대로 꺼내고 목록을 비웁니다 (모으는 중이 아니면 빈 목록)."""
+        patches = self._patches or []
+        if self._patches is not None:
+            self._patches = []
+        return patches
+
+    @property
+    def index(self) -> FieldIndex:
+        """세이브 전체 필드 인덱스 (처음 접근할 때 한 번 스캔)."""
+        if self._index is None:
+            self._index = build_field_index(self.data)
+            self._cache_dirty = True
+        return self._index
+
+    def _flush_cache(self) -> None:
+        """새로 찾은 오프셋/인덱스가 있으면 디스크 캐시에 기록합니다."""
+        if self._cache is not None and self._cache_key and self._cache_dirty:
+            self._cache.store(self._cache_key, self._offsets, self._index)
+            self._cache_dirty = False
+
+    def locate(self, names) -> dict[str, int]:
+        """
+        여러 필드의 첫 값 오프셋을 찾습니다. 아직 모르는 필드만 모아 한 번의 스캔으로 찾습니다.
+
+        Args:
+            names: 필드 이름들
+
+        Returns:
+            이름 -> 값 시작 오프셋. 없으면 -1 (값이 데이터 끝을 넘는지는 읽을 때 확인)
+        """
+        patterns = {name: field_spec(name).pattern for name in names}
+        unknown = {p.hex(): p for p in patterns.values() if p not in self._offsets}
+        if unknown:
+            found = find_field_value_offsets(self.data, unknown, 1)
+            self._offsets.update((unknown[key], off) for key, off in found.items())
+            self._cache_dirty = True
+        return {name: self._offsets[p] for name, p in patterns.items()}
+
+    def locate_all(self, names) -> dict[str, array]:
+        """
+        여러 필드의 모든 등장 위치를 찾습니다. 아직 모르는 필드만 모아 한 번에 스캔합니다.
+
+        Returns:
+            이름 -> 값 시작 오프셋 array('Q') (값이 데이터 끝을 넘는 위치는 제외)
+        """
+        specs = {name: field_spec(name) for name in names}
+        unknown = {s.pattern.hex(): s.pattern for s in specs.values() if s.pattern not in self._all_offsets}
+        if unknown:
+            found = find_all_field_value_offsets(self.data, unknown, 1)
+            self._all_offsets.update((unknown[key], offs) for key, offs in found.items())
+        data_len = len(self.data)
+        result = {}
+        for name, spec in specs.items():
+            offs = self._all_offsets[spec.pattern]
+            size = spec.codec.size
+            # 타입 크기만큼 값이 들어가지 않는 마지막 위치는 제외
+            while offs and offs[-1] + size > data_len:
+                offs = offs[:-1]
+            result[name] = offs
+        return result
+
+    def get(self, name: str, value_type: str | None = None):
+        """
+        필드 값을 읽습니다. 등장 정책이 all이면 모든 위치 값 목록을 반환합니다.
+
+        Returns:
+            값 (all이면 list). 필드가 없으면 None
+        """
+        spec = field_spec(name, value_type)
+        if spec.occurrence == 'all':
+            return self.get_all(name, spec.value_type) or None
+        off = self.locate([name])[name]
+        return batch_decode(self.data, [(off, spec.value_type)])[0]
+
+    def set(self, name: str, value, value_type: str | None = None):
+        """
+        필드 값을 바꿉니다. 바이트가 실제로 달라질 때만 변경으로 표시합니다.
+        등장 정책이 all이면 모든 위치를 같은 값으로 바꿉니다.
+
+        Returns:
+            이전 값 (all이면 이전 값 목록)
+
+        Raises:
+            KeyError: 세이브에서 필드를 찾지 못한 경우
+        """
+        spec = field_spec(name, value_type)
+        if spec.occurrence == 'all':
+            old = self.get_all(name, spec.value_type)
+            if not old:
+                raise KeyError(name)
+            self.bulk_edit(name, 'set', value, spec.value_type)
+            return old
+        off = self.locate([name])[name]
+        codec = spec.codec
+        data = self.data
+        if off < 0 or off + codec.size > len(data):
+            raise KeyError(name)
+        old_bytes = bytes(data[off : off + codec.size])
+        old = codec.unpack(old_bytes)[0]
+        with timed('patch', codec.size):
+            codec.pack_into(data, off, _coerce_value(value, spec.value_type))
+        if data[off : off + codec.size] != old_bytes:
+            self.mark_dirty(off, codec.size)
+            if self._patches is not None:
+                self._patches.append((off, old_bytes, bytes(data[off : off + codec.size])))
+        return old
+
+    def get_all(self, name: str, value_type: str | None = None) -> list:
+        """필드의 모든 등장 위치 값을 앞에서부터 읽습니다."""
+        spec = field_spec(name, value_type)
+        return bulk_read(self.data, self.locate_all([name])[name], spec.value_type)
+
+    def bulk_edit(self, name: str, op: str, value, value_type: str | None = None) -> tuple[int, int]:
+        """
+        필드의 모든 등장 위치 값을 한 번에 수정합니다 (bulk_edit() 참고).
+
+        Returns:
+            (등장 횟수, 실제로 바뀐 값 개수)
+        """
+        spec = field_spec(name, value_type)
+        offsets = self.locate_all([name])[name]
+        data = self.data
+        size = spec.codec.size
+        before = None
+        if self._patches is not None:
+            before = [bytes(data[off : off + size]) for off in offsets]
+        with timed('patch', len(offsets) * size):
+            changed = bulk_edit(data, offsets, op, value, spec.value_type)
+        if changed:
+            self.mark_dirty(min(offsets))
+            for off in offsets[: max(0, VERIFY_MAX_VALUES - len(self._expected))]:
+                self.mark_dirty(off, size)
+            if before is not None:
+                for off, old_bytes in zip(offsets, before):
+                    if data[off : off + size] != old_bytes:
+                        self._patches.append((off, old_bytes, bytes(data[off : off + size])))
+        return len(offsets), changed
+
+    def values(self, names=None) -> dict:
+        """
+        여러 필드 값을 한 번에 읽습니다 (read_current_values()와 같은 형식).
+        첫 위치 필드들은 오프셋을 한 번에 찾고 batch_decode()로 묶어 읽습니다.
+
+        Args:
+            names: 필드 이름들 (기본: Money/Energy/NetWorth)
+
+        Returns:
+            필드명 -> 값 (등장 정책 all이면 list) 또는 '(필드 없음)'
+        """
+        names = list(names or SAVE_FIELDS)
+        specs = {name: field_spec(name) for name in names}
+        firsts = [name for name in names if specs[name].occurrence == 'first']
+        offsets = self.locate(firsts)
+        decoded = dict(
+            zip(firsts, batch_decode(self.data, [(offsets[n], specs[n].value_type) for n in firsts]))
+        )
+        alls = [name for name in names if specs[name].occurrence == 'all']
+        if alls:
+            self.locate_all(alls)
+            decoded.update((name, self.get_all(name) or None) for name in alls)
+        return {name: decoded[name] if decoded[name] is not None else '(필드 없음)' for name in names}
+
+    def update(self, values: dict[str, float], value_type: str | None = None) -> dict:
+        """
+        여러 필드를 한 번에 바꿉니다 (오프셋은 한 번의 스캔으로 찾음).
+
+        Args:
+            values: 이름 -> 새 값 (None이면 건너뜀)
+            value_type: 지정하면 스키마 대신 이 값 타입으로 씀
+
+        Returns:
+            변경된 필드와 이전/이후 값을 담은 dict (edit_save()와 같은 형식)
+        """
+        values = {name: value for name, value in values.items() if value is not None}
+        self.locate(name for name in values if field_spec(name).occurrence == 'first')
+        changes = {}
+        for name, value in values.items():
+            try:
+                changes[name] = (self.set(name, value, value_type), value)
+            except KeyError:
+                changes[name] = (None, '필드 찾기 실패')
+        return changes
+
+    def commit(
+        self,
+        output_path: str | None = None,
+        backup: bool = True,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        verify: bool | None = None,
+    ) -> bool:
+        """
+        변경 사항을 저장합니다. 변경이 없으면 재압축하지 않습니다
+        (다른 경로로 저장하는 경우 원본 파일을 그대로 복사).
+
+        Args:
+            output_path: 저장 경로 (기본: 연 파일 덮어쓰기)
+            backup: 덮어쓸 때 원본을 .hsg.bak으로 백업
+            compress_level: GZIP 압축 수준 0~9
+            verify: 교체 전에 저장한 파일을 해제해 CRC/길이와 고친 값 확인 (기본: 기존 파일을 덮어쓸 때만).
+                실패하면 SaveVerifyError를 올리고 기존 파일과 세션의 변경은 그대로 남습니다.
+
+        Returns:
+            파일을 썼으면 True
+        """
+        output_path = output_path or self.path
+        overwrite = os.path.abspath(output_path) == os.path.abspath(self.path)
+        if not self._dirty:
+            if overwrite:
+                return False
+            copy_save_file(self.path, output_path)
+        else:
+            # 임시 파일에 압축해 쓰고, 교체 직전에 원본을 .bak으로 보존 (하드링크라 복사 없음).
+            # 연 파일이 그대로면 처음 바뀐 곳 앞의 압축 블록은 원본에서 복사 (증분 저장)
+            incremental = None
+            if self._source_sig is not None and self._dirty_from is not None:
+                incremental = IncrementalSource(self.path, *self._source_sig, self._dirty_from)
+            compress_and_save(
+                self.data,
+                output_path,
+                level=compress_level,
+                backup_path=self.path + '.bak' if backup and overwrite else None,
+                incremental=incremental,
+                verify=verify,
+                expected=self._expected,
+            )
+        self.path = output_path
+        self._dirty = False
+        self._dirty_from = None
+        self._expected = {}
+        self._source_sig = _stat_signature(output_path)
+        # 값만 바뀌고 오프셋은 그대로이므로 새 파일 키로 인덱스를 이어서 캐시
+        content_key = None
+        if self._cache is not None:
+            content_key = self._cache_key = save_content_key(output_path)
+            self._cache.link(output_path, content_key)
+            self._cache_dirty = True
+            self._flush_cache()
+        # 방금 쓴 내용이 곧 버퍼이므로 다시 읽을 때 해제하지 않도록 버퍼 캐시에 넣음
+        buffers = get_buffer_cache()
+        if buffers is not None:
+            sig = DecompressedBufferCache.signature(os.stat(output_path))
+            buffers.put(output_path, sig, bytes(self.data), content_key)
+        return True
 
 
 def edit_save(
@@ -87,6 +2263,8 @@ def edit_save(
     energy: float = None,
     net_worth: float = None,
     backup: bool = True,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    verify: bool | None = None,
 ) -> dict:
     """
     세이브 파일을 읽어 지정한 값만 수정한 뒤 저장합니다.
@@ -98,121 +2276,602 @@ def edit_save(
         energy: 설정 시 Energy 값을 이 값으로 변경
         net_worth: 설정 시 NetWorth 값을 이 값으로 변경
         backup: True면 원본을 .hsg.bak으로 백업
+        compress_level: 저장 시 GZIP 압축 수준 0~9
+        verify: 저장 후 검증 (기본: 기존 파일을 덮어쓸 때만, SaveFile.commit() 참고)
 
     Returns:
         변경된 필드와 이전/이후 값을 담은 dict
     """
-    # 압축 해제
-    raw = decompress_save(input_path)
-    data = bytearray(raw)
-    changes = {}
+    with SaveFile(input_path) as save:
+        changes = save.update({'Money': money, 'Energy': energy, 'NetWorth': net_worth})
+        save.commit(output_path, backup=backup, compress_level=compress_level, verify=verify)
+    return changes
 
-    # Money 수정
-    if money is not None:
-        off = find_field_value_offset(data, FIELD_MONEY, 4)
-        if off >= 0:
-            old = read_float_at(data, off)
-            write_float_at(data, off, money)
-            changes['Money'] = (old, money)
-        else:
-            changes['Money'] = (None, '필드 찾기 실패')
-
-    # Energy 수정 (구조가 동일하다고 가정)
-    if energy is not None:
-        off = find_field_value_offset(data, FIELD_ENERGY, 4)
-        if off >= 0:
-            old = read_float_at(data, off)
-            write_float_at(data, off, energy)
-            changes['Energy'] = (old, energy)
-        else:
-            changes['Energy'] = (None, '필드 찾기 실패')
-
-    # NetWorth 수정
-    if net_worth is not None:
-        off = find_field_value_offset(data, FIELD_NET_WORTH, 4)
-        if off >= 0:
-            old = read_float_at(data, off)
-            write_float_at(data, off, net_worth)
-            changes['NetWorth'] = (old, net_worth)
-        else:
-            changes['NetWorth'] = (None, '필드 찾기 실패')
 
-    # 백업
-    if backup and os.path.abspath(input_path) == os.path.abspath(output_path):
-        bak_path = input_path + '.bak'
-        shutil.copy2(input_path, bak_path)
+def edit_save_streaming(
+    input_path: str,
+    output_path: str,
+    money: float = None,
+    energy: float = None,
+    net_worth: float = None,
+    backup: bool = True,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    verify: bool | None = None,
+) -> tuple[dict, bool]:
+    """
+    edit_save()와 같은 동작을 스트리밍으로 수행합니다 (해제 -> 수정 -> 재압축).
+
+    세이브 전체를 메모리에 올리지 않고 chunk 단위로 해제하면서 필드를 찾아 값을 고치고,
+    곧바로 GZIP으로 다시 압축해 임시 파일에 씁니다. chunk 경계에 걸친 필드명/값을 위해
+    가장 긴 필드명 - 1 바이트와 아직 수정하지 못한 값 영역만 내보내지 않고 붙잡아 둡니다.
+    따라서 세이브 크기와 상관없이 메모리 사용량이 chunk 크기 수준으로 일정합니다.
+    출력은 같은 폴더의 임시 파일에 쓴 뒤 교체하므로 입력과 출력이 같아도 됩니다.
+    verify(기본: 덮어쓸 때)이면 내보내며 구한 CRC32·길이와 고친 값을 교체 전에 verify_save_file()로 확인합니다.
+    바뀐 바이트가 없으면 (필드를 못 찾았거나 같은 값) 임시 파일을 버리고 원본과 .bak을 건드리지 않습니다
+    (다른 경로로 저장하는 경우 SaveFile.commit()처럼 원본을 그대로 복사).
+
+    Args: edit_save()와 동일 (verify는 SaveFile.commit()과 같음)
+
+    Returns:
+        (edit_save()와 같은 변경 내역 dict, 파일을 썼으면 True)
+    """
+    requested = {
+        'Money': money,
+        'Energy': energy,
+        'NetWorth': net_worth,
+    }
+    requested = {name: value for name, value in requested.items() if value is not None}
+    results: dict[str, tuple] = {}
+
+    same_file = os.path.abspath(input_path) == os.path.abspath(output_path)
+    if not requested:
+        if same_file:
+            return {}, False
+        copy_save_file(input_path, output_path)
+        return {}, True
+    if verify is None:
+        verify = os.path.exists(output_path)
+    crc = length = 0
+    expected: dict[int, bytes] = {}
+    modified = False
+
+    def check(tmp_path: str) -> None:
+        verify_save_file(tmp_path, crc, length, expected)
+
+    backup_path = input_path + '.bak' if backup and same_file else None
+    written = True
+    try:
+        with atomic_write(output_path, backup_path, check if verify else None) as raw_out:
+            with gzip.GzipFile(
+                filename=os.path.basename(output_path),
+                mode='wb',
+                compresslevel=compress_level,
+                fileobj=raw_out,
+            ) as out:
+                def emit(chunk) -> None:
+                    nonlocal crc, length
+                    with timed('compress', len(chunk)):
+                        out.write(chunk)
+                    if verify:
+                        crc = zlib.crc32(chunk, crc)
+                        length += len(chunk)
+
+                fields = {name: SAVE_FIELDS[name] for name in requested}
+                scanner = _scanner_for(tuple(fields.items()))
+                overlap = scanner.max_pattern_len - 1
+                seen: set[str] = set()
+                pending: dict[str, int] = {}  # 이름 -> 아직 수정하지 못한 값의 절대 오프셋
+                window = bytearray()
+                window_start = 0  # window[0]의 절대 오프셋
+                search_from = 0
+                for chunk in iter_decompressed_chunks(input_path):
+                    if len(results) == len(requested):
+                        # 모든 필드를 고쳤으면 나머지는 그대로 재압축
+                        emit(chunk)
+                        continue
+                    window += chunk
+                    with timed('scan', len(window) - (search_from - window_start)):
+                        for name, idx in scanner.iter_matches(window, search_from - window_start):
+                            if name not in seen:
+                                seen.add(name)
+                                pending[name] = window_start + idx + len(fields[name])
+                    for name, value_start in list(pending.items()):
+                        rel = value_start - window_start
+                        if rel + 4 <= len(window):
+                            before = bytes(window[rel : rel + 4])
+                            old = read_float_at(window, rel)
+                            write_float_at(window, rel, requested[name])
+                            expected[value_start] = bytes(window[rel : rel + 4])
+                            modified = modified or expected[value_start] != before
+                            results[name] = (old, requested[name])
+                            del pending[name]
+                    # 경계에 걸칠 수 있는 꼬리와 미수정 값 영역을 제외하고 내보냄
+                    window_end = window_start + len(window)
+                    search_from = max(window_end - overlap, window_start)
+                    if len(results) == len(requested):
+                        keep_from = window_end
+                    else:
+                        keep_from = min([search_from, *pending.values()])
+                    emit(window[: keep_from - window_start])
+                    del window[: keep_from - window_start]
+                    window_start = keep_from
+                emit(window)
+            if not modified:
+                # 임시 파일만 지우고 원본(.bak 포함)은 그대로 둠
+                raise _NothingChanged
+    except _NothingChanged:
+        written = False
+        if not same_file:
+            copy_save_file(input_path, output_path)
+            written = True
+
+    changes = {}
+    for name in requested:
+        changes[name] = results.get(name, (None, '필드 찾기 실패'))
+    return changes, written
 
-    # 압축하여 저장
-    compress_and_save(bytes(data), output_path)
-    return changes
 
+def _values_from_buffer(data: bytes, content_key: str | None, specs: dict[str, FieldSpec]) -> dict:
+    """해제된 버퍼에서 첫 위치 필드 값들을 읽습니다 (오프셋 캐시에 있으면 스캔 생략)."""
+    cache = get_index_cache()
+    known = cache.load(content_key) if cache is not None and content_key else None
+    offsets = known[0] if known is not None else {}
+    unknown = {spec.pattern.hex(): spec.pattern for spec in specs.values() if spec.pattern not in offsets}
+    if unknown:
+        found = find_field_value_offsets(data, unknown, 1)
+        offsets = {**offsets, **{unknown[key]: off for key, off in found.items()}}
+        if cache is not None and content_key:
+            cache.store(content_key, offsets, known[1] if known is not None else None)
+    decoded = batch_decode(data, [(offsets[spec.pattern], spec.value_type) for spec in specs.values()])
+    return {name: value if value is not None else '(필드 없음)' for name, value in zip(specs, decoded)}
 
-def read_current_values(path: str) -> dict:
+
+def read_current_values(path: str, names=None, cache_buffer: bool = False) -> dict:
     """
-    수정 없이 현재 세이브의 Money/Energy/NetWorth 값을 읽어 반환합니다.
+    수정 없이 현재 세이브의 Money/Energy/NetWorth(또는 지정한 필드) 값을 읽어 반환합니다.
+
+    해제된 버퍼가 버퍼 캐시에 있으면 그 버퍼에서 바로 읽고, 없으면 필요한 필드까지만 스트리밍 해제합니다.
 
     Args:
         path: .hsg 파일 경로
+        names: 읽을 필드 이름들 (기본: Money/Energy/NetWorth). 타입 등은 FIELD_SCHEMA를 따름
+        cache_buffer: True면 캐시에 없을 때 전체를 해제해 버퍼 캐시에 넣음
+            (곧 다시 읽거나 저장할 파일, 예: GUI에서 연 세이브)
 
     Returns:
-        필드명 -> float 값 또는 오류 메시지
+        필드명 -> 값 또는 오류 메시지
     """
-    raw = decompress_save(path)
+    names = list(names or SAVE_FIELDS)
+    specs = {name: field_spec(name) for name in names}
+    if any(spec.occurrence == 'all' for spec in specs.values()):
+        # 모든 위치를 읽어야 하는 필드는 끝까지 스캔해야 하므로 세션으로 처리
+        with SaveFile(path) as save:
+            return save.values(names)
+
+    buffers = get_buffer_cache()
+    hit = buffers.get(path) if buffers is not None else None
+    if hit is None and cache_buffer and buffers is not None:
+        hit = _decompress_cached(path)
+    if hit is not None:
+        return _values_from_buffer(hit[0], hit[1], specs)
+
+    cache = get_index_cache()
+    key = cached = None
+    if cache is not None:
+        signature = _stat_signature(path)
+        # 파일 전체를 해시하지 않음 (처음 읽는 파일은 필요한 필드까지만 해제하도록)
+        key = cache.key_for(path)
+        cached = cache.load(key)
+        if cached is not None and all(spec.pattern in cached[0] for spec in specs.values()):
+            # 캐시 적중: 스캔 없이 알려진 오프셋까지만 해제
+            ranges = {
+                name: (cached[0][spec.pattern], spec.codec.size)
+                for name, spec in specs.items()
+                if cached[0][spec.pattern] >= 0
+            }
+            raw_values = read_ranges_streaming(path, ranges)
+            # 읽는 사이 파일이 바뀌었으면 아래에서 다시 스캔
+            if _stat_signature(path) == signature:
+                result = {}
+                for name, spec in specs.items():
+                    raw = raw_values.get(name)
+                    result[name] = spec.codec.unpack(raw)[0] if raw else '(필드 없음)'
+                return result
+
+    # 필요한 필드를 모두 찾으면 나머지는 해제하지 않음
+    found = read_fields_streaming(
+        path,
+        {name: spec.pattern for name, spec in specs.items()},
+        {name: spec.codec.size for name, spec in specs.items()},
+    )
     result = {}
-    for name, field in [
-        ('Money', FIELD_MONEY),
-        ('Energy', FIELD_ENERGY),
-        ('NetWorth', FIELD_NET_WORTH),
-    ]:
-        off = find_field_value_offset(raw, field, 4)
-        if off >= 0:
-            result[name] = read_float_at(raw, off)
+    for name, hit in found.items():
+        if hit is not None:
+            result[name] = specs[name].codec.unpack(hit[1])[0]
         else:
             result[name] = '(필드 없음)'
+    if cache is not None:
+        offsets = dict(cached[0]) if cached else {}
+        offsets.update({specs[name].pattern: hit[0] if hit else -1 for name, hit in found.items()})
+        cache.store(key, offsets, cached[1] if cached else None)
     return result
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description='Big Ambitions .hsg 세이브 파일 수정')
-    parser.add_argument('save_file', help='.hsg 세이브 파일 경로')
-    parser.add_argument('-o', '--output', default=None, help='출력 파일 경로 (기본: 입력 파일 덮어쓰기)')
+class EditSpec(NamedTuple):
+    """
+    세이브에 적용할 수정 목록. 프로세스 간에 그대로 넘길 수 있습니다.
+
+    - values: 필드 이름 -> 새 값 (스키마의 타입/등장 정책 적용)
+    - bulk_ops: (연산, 필드, 값) 목록. 연산은 BULK_OPS 중 하나
+    """
+
+    values: dict[str, float]
+    bulk_ops: tuple[tuple[str, str, object], ...] = ()
+
+    def is_empty(self) -> bool:
+        """적용할 수정이 없으면 True."""
+        return not self.values and not self.bulk_ops
+
+
+def apply_edit_spec(save: SaveFile, spec: EditSpec) -> dict:
+    """
+    SaveFile 세션에 수정 목록을 적용합니다 (저장은 하지 않음).
+
+    Returns:
+        변경된 필드와 이전/이후 값을 담은 dict (edit_save()와 같은 형식)
+    """
+    changes = save.update(spec.values)
+    if spec.bulk_ops:
+        save.locate_all({field for _op, field, _value in spec.bulk_ops})
+    for op, field, value in spec.bulk_ops:
+        count, changed = save.bulk_edit(field, op, value)
+        changes[f'{field}[*] {op}'] = (None, f'{count}곳 중 {changed}곳 변경')
+    return changes
+
+
+def format_changes(changes: dict) -> list[str]:
+    """변경 사항 dict를 화면 출력용 줄 목록으로 바꿉니다."""
+    lines = []
+    for name, (old, new) in changes.items():
+        if isinstance(new, str):
+            lines.append(f'{name}: {new}')
+        elif isinstance(old, list):
+            lines.append(f'{name}: {len(old)}곳 -> {new}')
+        else:
+            lines.append(f'{name}: {old} -> {new}')
+    return lines
+
+
+def _parse_bulk_number(text: str) -> tuple[str, float]:
+    """'FIELD=NUMBER' 형식 인자를 (필드, 숫자)로 바꿉니다."""
+    field, sep, number = text.partition('=')
+    if not sep or not field:
+        raise argparse.ArgumentTypeError(f'FIELD=숫자 형식이어야 합니다: {text}')
+    try:
+        return field, float(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'숫자가 아닙니다: {number}') from None
+
+
+def _parse_bulk_range(text: str) -> tuple[str, tuple[float | None, float | None]]:
+    """'FIELD=MIN:MAX' 형식 인자를 (필드, (최소, 최대))로 바꿉니다. 빈 쪽은 None"""
+    field, sep, bounds = text.partition('=')
+    lo, colon, hi = bounds.partition(':')
+    if not sep or not field or not colon:
+        raise argparse.ArgumentTypeError(f'FIELD=MIN:MAX 형식이어야 합니다: {text}')
+    try:
+        return field, (float(lo) if lo else None, float(hi) if hi else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'숫자가 아닙니다: {bounds}') from None
+
+
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """필드 스키마/캐시 관련 공통 옵션을 추가합니다 (단일 파일·batch 공용)."""
+    parser.add_argument(
+        '--schema',
+        action='append',
+        default=[],
+        metavar='FILE',
+        help='필드 선언 JSON 파일 (이름/타입/태그/등장 정책). 여러 번 지정 가능',
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='필드 오프셋 디스크 캐시, 해제 버퍼 캐시, 증분 저장을 쓰지 않음 (항상 세이브를 해제·스캔·전체 압축)',
+    )
+
+
+def add_edit_arguments(parser: argparse.ArgumentParser) -> None:
+    """수정 내용(EditSpec)과 저장 방식 옵션을 추가합니다 (단일 파일·batch 공용)."""
     parser.add_argument('-m', '--money', type=float, default=None, help='Money 값 설정')
     parser.add_argument('-e', '--energy', type=float, default=None, help='Energy 값 설정 (0~1 등)')
     parser.add_argument('-n', '--networth', type=float, default=None, help='NetWorth 값 설정')
+    parser.add_argument(
+        '--set',
+        type=_parse_bulk_number,
+        action='append',
+        default=[],
+        metavar='FIELD=VALUE',
+        help='임의 필드 값 설정 (스키마의 타입/등장 정책 적용). 여러 번 지정 가능',
+    )
+    parser.add_argument(
+        '--set-all',
+        type=_parse_bulk_number,
+        action='append',
+        default=[],
+        metavar='FIELD=VALUE',
+        help='필드의 모든 등장 위치 값을 VALUE로 설정 (여러 번 지정 가능)',
+    )
+    parser.add_argument(
+        '--scale-all',
+        type=_parse_bulk_number,
+        action='append',
+        default=[],
+        metavar='FIELD=FACTOR',
+        help='필드의 모든 등장 위치 값에 FACTOR를 곱함',
+    )
+    parser.add_argument(
+        '--clamp-all',
+        type=_parse_bulk_range,
+        action='append',
+        default=[],
+        metavar='FIELD=MIN:MAX',
+        help='필드의 모든 등장 위치 값을 MIN~MAX로 제한 (한쪽 생략 가능, 예: Salary=:5000)',
+    )
     parser.add_argument('--no-backup', action='store_true', help='덮어쓸 때 백업 파일 생성 안 함')
+    parser.add_argument(
+        '--verify',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='저장한 파일을 교체 전에 다시 풀어 CRC/길이와 고친 값을 확인 (기본: 덮어쓸 때만 확인)',
+    )
+    parser.add_argument(
+        '-l',
+        '--level',
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESS_LEVEL,
+        metavar='0-9',
+        help=f'저장 시 압축 수준 (0=무압축·가장 빠름, 9=최대 압축, 기본 {DEFAULT_COMPRESS_LEVEL})',
+    )
+
+
+def apply_common_arguments(args: argparse.Namespace) -> bool:
+    """
+    공통 옵션(캐시 끄기, 스키마 로드)을 적용합니다.
+
+    Returns:
+        성공하면 True (스키마 오류는 출력 후 False)
+    """
+    if args.no_cache:
+        configure_index_cache(enabled=False)
+        configure_buffer_cache(0)
+        configure_restart_index(enabled=False)
+    try:
+        for schema_path in args.schema:
+            load_field_schema(schema_path)
+    except (OSError, ValueError, KeyError) as e:
+        print('오류: 필드 스키마를 읽을 수 없습니다.', e)
+        return False
+    return True
+
+
+# edit_spec_from_dict() 키 -> 일괄 연산 (BULK_OPS)
+_EDIT_DICT_BULK_KEYS = {'set_all': 'set', 'scale_all': 'scale', 'clamp_all': 'clamp'}
+
+
+def edit_spec_from_dict(doc: dict) -> EditSpec:
+    """
+    JSON 객체(수정 프로필, 서비스 요청)를 EditSpec으로 바꿉니다. 모르는 키는 ValueError
+
+    형식:
+        {"set": {"Money": 10000000}, "set_all": {"Energy": 1}, "scale_all": {"Price": 0.5},
+         "clamp_all": {"Salary": [null, 5000]}}
+    """
+    unknown = set(doc) - {'set', *_EDIT_DICT_BULK_KEYS}
+    if unknown:
+        raise ValueError(f'알 수 없는 수정 키: {", ".join(sorted(unknown))}')
+    values = {str(field): float(value) for field, value in doc.get('set', {}).items()}
+    bulk_ops = []
+    for key, op in _EDIT_DICT_BULK_KEYS.items():
+        for field, value in doc.get(key, {}).items():
+            if op == 'clamp':
+                lo, hi = value
+                value = (None if lo is None else float(lo), None if hi is None else float(hi))
+            else:
+                value = float(value)
+            bulk_ops.append((op, str(field), value))
+    return EditSpec(values, tuple(bulk_ops))
+
+
+def edit_spec_from_args(args: argparse.Namespace) -> EditSpec:
+    """add_edit_arguments()로 받은 옵션을 EditSpec으로 바꿉니다."""
+    values = {'Money': args.money, 'Energy': args.energy, 'NetWorth': args.networth, **dict(args.set)}
+    bulk_ops = (
+        [('set', field, value) for field, value in args.set_all]
+        + [('scale', field, value) for field, value in args.scale_all]
+        + [('clamp', field, value) for field, value in args.clamp_all]
+    )
+    return EditSpec(
+        {name: value for name, value in values.items() if value is not None},
+        tuple(bulk_ops),
+    )
+
+
+# 하위 명령 이름 -> (모듈, 진입 함수). 첫 인자가 이 이름이고 같은 이름의 파일이 없으면 하위 명령으로 실행
+SUBCOMMANDS = {
+    'batch': ('save_library', 'batch_main'),
+    'report': ('save_library', 'report_main'),
+    'snapshot': ('snapshot_store', 'snapshot_main'),
+    'diff': ('save_diff', 'diff_main'),
+    'watch': ('save_watch', 'watch_main'),
+    'serve': ('save_service', 'serve_main'),
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in SUBCOMMANDS and not os.path.isfile(argv[0]):
+        module_name, func_name = SUBCOMMANDS[argv[0]]
+        getattr(importlib.import_module(module_name), func_name)(argv[1:])
+        return
+
+    parser = argparse.ArgumentParser(
+        description='Big Ambitions .hsg 세이브 파일 수정',
+        epilog=(
+            '여러 세이브 일괄 수정: edit_save.py batch --help / 값 보고서: edit_save.py report --help'
+            ' / 스냅샷: edit_save.py snapshot --help / 세이브 비교: edit_save.py diff --help'
+            ' / 자동 적용 감시: edit_save.py watch --help / 로컬 서비스: edit_save.py serve --help'
+        ),
+    )
+    parser.add_argument('save_file', help='.hsg 세이브 파일 경로')
+    parser.add_argument('-o', '--output', default=None, help='출력 파일 경로 (기본: 입력 파일 덮어쓰기)')
+    add_edit_arguments(parser)
     parser.add_argument('--read-only', action='store_true', help='수정 없이 현재 값만 출력')
-    args = parser.parse_args()
+    parser.add_argument(
+        '--list-fields',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='PREFIX',
+        help='세이브 안의 모든 필드명(접두어 지정 가능)과 등장 횟수·첫 오프셋 출력',
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='세이브 전체를 메모리에 올리지 않고 스트리밍으로 수정 (대용량 세이브용)',
+    )
+    parser.add_argument(
+        '--snapshot',
+        action='store_true',
+        help='덮어쓰기 전에 기존 세이브를 스냅샷 저장소에 남김 (edit_save.py snapshot list 로 확인)',
+    )
+    add_common_arguments(parser)
+    parser.add_argument(
+        '-f',
+        '--field',
+        action='append',
+        default=[],
+        metavar='NAME',
+        help='--read-only 에서 읽을 필드 (기본: Money/Energy/NetWorth). 여러 번 지정 가능',
+    )
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='단계별 시간(해제/스캔/쓰기/압축/백업)과 처리량(MB/초) 출력',
+    )
+    parser.add_argument(
+        '--timings-json',
+        default=None,
+        metavar='FILE',
+        help='단계별 시간을 JSON으로 저장 (- 이면 화면에 출력)',
+    )
+    parser.add_argument(
+        '--profile',
+        default=None,
+        metavar='FILE',
+        help='cProfile 결과를 파일로 저장 (python -m pstats FILE 로 확인)',
+    )
+    args = parser.parse_args(argv)
 
     if not os.path.isfile(args.save_file):
         print('오류: 세이브 파일을 찾을 수 없습니다.', args.save_file)
         return
+    if not apply_common_arguments(args):
+        return
+    # 한 번 실행하고 끝나는 명령이므로 해제 버퍼를 캐시에 남길 필요 없음
+    configure_buffer_cache(0)
+
+    profiler = cProfile.Profile() if args.profile else None
+    with collect_timings() as timings:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            _run_single(args)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    if profiler is not None:
+        profiler.dump_stats(args.profile)
+        print('프로파일 저장:', args.profile)
+    if args.timings:
+        print('\n'.join(timings.format_lines()))
+    if args.timings_json:
+        report = json.dumps({'file': args.save_file, **timings.to_dict()}, ensure_ascii=False, indent=2)
+        if args.timings_json == '-':
+            print(report)
+        else:
+            with open(args.timings_json, 'w', encoding='utf-8') as f:
+                f.write(report + '\n')
+
+
+def _run_single(args: argparse.Namespace) -> None:
+    """단일 세이브 명령 본체: 필드 목록 / 읽기 전용 / 수정."""
+    spec = edit_spec_from_args(args)
+
+    # 필드 목록: 전체 인덱스를 한 번 만들어 출력
+    if args.list_fields is not None:
+        with SaveFile(args.save_file) as save:
+            index = save.index
+            names = index.names_with_prefix(args.list_fields)
+            for name in names:
+                print(f'{name}\t{index.count(name)}\t{index.first(name)}')
+            print(f'필드 {len(names)}개 (전체 {len(index)}개)')
+        return
 
     # 읽기 전용: 현재 값만 출력
     if args.read_only:
-        vals = read_current_values(args.save_file)
+        vals = read_current_values(args.save_file, args.field or None)
         print('현재 세이브 값:', vals)
         return
 
     output = args.output or args.save_file
-    changes = edit_save(
-        args.save_file,
-        output,
-        money=args.money,
-        energy=args.energy,
-        net_worth=args.networth,
-        backup=not args.no_backup,
-    )
+    if args.streaming and (spec.bulk_ops or args.set):
+        print('오류: --streaming 은 --set/--set-all/--scale-all/--clamp-all 과 함께 쓸 수 없습니다.')
+        return
+    written = False
+    if args.streaming:
+        if args.snapshot and (args.money is not None or args.energy is not None or args.networth is not None):
+            _snapshot_before_write(output)
+        changes, written = edit_save_streaming(
+            args.save_file,
+            output,
+            money=args.money,
+            energy=args.energy,
+            net_worth=args.networth,
+            backup=not args.no_backup,
+            compress_level=args.level,
+            verify=args.verify,
+        )
+    else:
+        # 한 번 해제 -> 수정 -> 변경이 있을 때만 한 번 압축
+        with SaveFile(args.save_file) as save:
+            changes = apply_edit_spec(save, spec)
+            if changes:
+                if args.snapshot:
+                    _snapshot_before_write(output)
+                written = save.commit(
+                    output, backup=not args.no_backup, compress_level=args.level, verify=args.verify
+                )
 
     if changes:
         print('변경 사항:')
-        for name, (old, new) in changes.items():
-            if isinstance(new, str):
-                print(f'  {name}: {new}')
-            else:
-                print(f'  {name}: {old} -> {new}')
-        print('저장 완료:', output)
+        for line in format_changes(changes):
+            print(f'  {line}')
+        print('저장 완료:' if written else '바뀐 값이 없어 저장하지 않았습니다:', output)
     else:
-        print('변경할 항목이 없습니다. -m, -e, -n 중 하나 이상 지정하세요.')
+        print('변경할 항목이 없습니다. -m, -e, -n, --set-all 등 하나 이상 지정하세요.')
+
+
+def _snapshot_before_write(path: str) -> None:
+    """덮어쓸 세이브의 지금 내용을 스냅샷으로 남깁니다 (--snapshot)."""
+    if not os.path.isfile(path):
+        return
+    import snapshot_store
+
+    info, created = snapshot_store.SnapshotStore().take(path, label='수정 전')
+    if created:
+        print(f'스냅샷 저장: {info.id} (새로 저장 {snapshot_store.format_size(info.stored_bytes)})')
 
 
 if __name__ == '__main__':
@@ -4,65 +4,190 @@ Big Ambitions (.hsg) 세이브 파일 수정 - 화면(GUI) 버전
 
 tkinter 기반 단일 화면에서 파일 선택, 현재 값 확인, Money/Energy/NetWorth 수정 및 저장을 수행합니다.
 게임 기본 폴더(AppData\\LocalLow\\Hovgaard Games\\Big Ambitions)의 세이브 목록을 화면에 표시합니다.
+읽기/저장(해제·스캔·압축)은 작업 스레드에서 실행하고, 결과는 root.after 로 화면 스레드에 전달합니다.
 """
 
 import os
 import sys
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from tkinter import ttk, filedialog, messagebox
 
 # 기존 edit_save 모듈의 읽기/쓰기 함수 사용
+from edit_journal import EditJournal, JournalStatus, step_journal
 from edit_save import (
+    DEFAULT_COMPRESS_LEVEL,
+    SaveFile,
+    collect_timings,
     read_current_values,
-    edit_save,
 )
+from save_library import (
+    SaveDirectoryScanner,
+    ScanDelta,
+    get_default_game_root,
+    get_default_savegames_dir,
+)
+from save_diff import describe_region, format_region
+from snapshot_store import DEFAULT_KEEP_DAYS, DEFAULT_KEEP_LAST, SnapshotStore, format_size
 
 
 # .hsg 기본 필터
 FILE_TYPES = [('Big Ambitions 세이브', '*.hsg'), ('모든 파일', '*.*')]
 
-# Unity 기본 저장 위치 (Windows)
-# Company: Hovgaard Games, Product: Big Ambitions
-def get_default_game_root() -> str:
+# 작업 스레드 결과 확인 주기 (ms)
+POLL_INTERVAL_MS = 50
+
+# 세이브 목록 열: (열 id, 제목, 너비, 정렬)
+SAVE_LIST_COLUMNS = (
+    ('name', '세이브', 200, tk.W),
+    ('Money', 'Money', 100, tk.E),
+    ('NetWorth', 'NetWorth', 100, tk.E),
+    ('Energy', 'Energy', 70, tk.E),
+    ('size', '크기', 70, tk.E),
+    ('modified', '수정 시각', 120, tk.W),
+)
+PREVIEW_FIELDS = ('Money', 'NetWorth', 'Energy')
+# 미리보기 값 캐시 항목 수, 동시에 읽는 스레드 수
+PREVIEW_CACHE_SIZE = 512
+PREVIEW_WORKERS = min(4, os.cpu_count() or 1)
+# 스크롤/크기 변경 후 보이는 행을 채우기까지 기다리는 시간 (ms)
+PREVIEW_FILL_DELAY_MS = 100
+# 세이브 폴더 자동 감시 주기 (ms). 바뀐 폴더만 다시 읽으므로 짧아도 부담이 적음
+WATCH_INTERVAL_MS = 2000
+
+# 스냅샷 창 목록 열: (열 id, 제목, 너비, 정렬)
+SNAPSHOT_COLUMNS = (
+    ('created', '시각', 130, tk.W),
+    ('label', '설명', 140, tk.W),
+    ('Money', 'Money', 100, tk.E),
+    ('stored', '추가 저장', 80, tk.E),
+)
+# 스냅샷 비교 창에 자세히 보여 줄 바뀐 구간 수
+SNAPSHOT_DIFF_SHOWN = 5
+
+
+class PreviewCache:
     """
-    Big Ambitions 게임 루트 폴더 경로를 반환합니다.
-    반환: ...\\AppData\\LocalLow\\Hovgaard Games\\Big Ambitions
+    세이브 미리보기 값 LRU 캐시. 키는 (경로, 크기, 수정 시각 ns)이므로 파일이 바뀌면 자연히 새로 읽습니다.
+    화면 스레드에서만 사용합니다.
     """
-    user = os.environ.get('USERPROFILE', os.path.expanduser('~'))
-    return os.path.join(user, 'AppData', 'LocalLow', 'Hovgaard Games', 'Big Ambitions')
 
+    def __init__(self, max_entries: int = PREVIEW_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, dict] = OrderedDict()
+
+    def get(self, key: tuple) -> dict | None:
+        values = self._entries.get(key)
+        if values is not None:
+            self._entries.move_to_end(key)
+        return values
+
+    def put(self, key: tuple, values: dict) -> None:
+        self._entries[key] = values
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _preview_key(path: str) -> tuple | None:
+    """미리보기 캐시 키 (경로, 크기, 수정 시각 ns). 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_size, st.st_mtime_ns)
+
+
+def _format_value(value) -> str:
+    """미리보기 칸 표시: 큰 수는 천 단위 구분, 없는 값은 —"""
+    if not isinstance(value, (int, float)):
+        return '—'
+    if abs(value) >= 1000:
+        return f'{value:,.0f}'
+    return f'{value:g}'
+
+
+def _format_size(size: int) -> str:
+    """파일 크기 표시 (KB/MB)"""
+    if size >= 1 << 20:
+        return f'{size / (1 << 20):.1f} MB'
+    return f'{size / 1024:.0f} KB'
+
+
+def _load_job(path: str) -> tuple[dict, str, JournalStatus]:
+    """
+    작업 스레드에서 실행되는 읽기 작업. 연 세이브는 곧 다시 읽거나 저장하므로 해제한 버퍼를 캐시에 남깁니다.
+    반환: (현재 값 dict, 단계별 시간 요약, 수정 기록 상태)
+    """
+    with collect_timings() as timings:
+        values = read_current_values(path, None, cache_buffer=True)
+    return values, timings.summary(), EditJournal.load(path).status()
+
+
+def _revision_label(changes: dict) -> str:
+    """수정 기록에 남길 설명: 바뀐 필드의 이전 -> 이후 값"""
+    parts = [
+        f'{name} {_format_value(old)} -> {_format_value(new)}'
+        for name, (old, new) in changes.items()
+        if not isinstance(new, str)
+    ]
+    return ', '.join(parts) or '수정'
 
-def get_default_savegames_dir() -> str:
+
+def _save_job(
+    input_path: str,
+    output_path: str,
+    edits: dict[str, float | None],
+    backup: bool,
+    compress_level: int,
+    snapshot: bool = False,
+    journal: bool = False,
+) -> tuple[dict, dict, str, JournalStatus, int]:
     """
-    게임 세이브가 들어 있는 SaveGames 폴더 경로를 반환합니다.
-    반환: ...\\Big Ambitions\\SaveGames
+    작업 스레드에서 실행되는 저장 작업. 한 번 해제 -> 수정 -> 한 번 압축합니다.
+    snapshot이 True면 덮어쓰기 전에 기존 파일을 스냅샷 저장소에 남깁니다.
+    journal이 True면 바뀐 바이트를 저장한 파일의 수정 기록에 리비전으로 남깁니다 (되돌리기/다시 실행).
+    기록 없이 파일을 썼거나 기록이 이미 세이브와 맞지 않으면 이전 기록은 쓸 수 없으므로 지웁니다.
+    반환: (변경 내역 dict, 저장한 버퍼에서 읽은 현재 값 dict, 단계별 시간 요약, 수정 기록 상태, 지운 리비전 수)
     """
-    return os.path.join(get_default_game_root(), 'SaveGames')
+    history = EditJournal.load(output_path)
+    dropped = 0
+    with collect_timings() as timings:
+        with SaveFile(input_path) as save:
+            overwrite = os.path.abspath(output_path) == os.path.abspath(input_path)
+            # 다른 내용으로 덮어쓰는 파일이나 기록 뒤에 바뀐 세이브의 이전 기록은 쓸 수 없음
+            if not (overwrite and history.matches()):
+                dropped = len(history.revisions)
+                history.clear()
+            if journal:
+                save.record_patches()
+            changes = save.update(edits)
+            if snapshot and changes and os.path.isfile(output_path):
+                SnapshotStore().take(output_path, label='수정 전')
+            written = save.commit(output_path, backup=backup, compress_level=compress_level)
+            values = save.values()
+            if journal and written:
+                history.record(_revision_label(changes), save.take_patches())
+    if written and not journal and history.revisions:
+        # 이번 수정은 패치로 남지 않았으므로 이전 리비전을 되돌리면 세이브가 어긋남
+        dropped = len(history.revisions)
+        history.clear()
+    if written or not history.revisions:
+        history.mark_saved()
+        history.store()
+    return changes, values, timings.summary(), history.status(), dropped
 
 
-def scan_hsg_files(top_dir: str) -> list[tuple[str, str]]:
+def _history_job(path: str, redo: bool, backup: bool, compress_level: int) -> tuple:
     """
-    지정 폴더 아래에서 재귀적으로 .hsg 파일을 찾아 (전체경로, 표시이름) 목록을 반환합니다.
-    표시이름은 게임 폴더 기준 상대 경로입니다.
-    입력: top_dir — 검색 루트 (예: SaveGames 경로)
-    반환: [(full_path, display_name), ...]
+    작업 스레드에서 실행되는 되돌리기/다시 실행 작업. 기록한 패치만 버퍼에 다시 쓰고 증분 저장합니다.
+    반환: (적용한 리비전, 현재 값 dict, 단계별 시간 요약, 수정 기록 상태)
     """
-    root = os.path.normpath(top_dir)
-    if not os.path.isdir(root):
-        return []
-    result = []
-    for dirpath, _dirnames, filenames in os.walk(root):
-        for name in filenames:
-            if name.lower().endswith('.hsg'):
-                full = os.path.join(dirpath, name)
-                try:
-                    rel = os.path.relpath(full, root)
-                except ValueError:
-                    rel = name
-                result.append((full, rel))
-    # 표시 이름 기준 정렬 (같은 폴더끼리 묶이도록)
-    result.sort(key=lambda x: (x[1].lower(), x[0]))
-    return result
+    with collect_timings() as timings:
+        revision, values, status = step_journal(path, redo, backup, compress_level)
+    return revision, values, timings.summary(), status
 
 
 def _icon_path() -> str | None:
@@ -109,7 +234,35 @@ class SaveEditorScreen:
         # 현재 열린 파일 경로 (없으면 None)
         self._current_path: str | None = None
 
+        # 읽기/저장 작업 스레드. 읽기는 세대 번호로 구분해 이전 요청 결과를 버립니다.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='save-editor')
+        self._load_future: Future | None = None
+        self._load_generation = 0
+        self._saving = False
+        self._busy_count = 0
+        self._save_buttons: list[ttk.Button] = []
+        # 되돌리기/다시 실행 버튼과 열린 세이브의 수정 기록 상태
+        self._history_buttons: dict[str, ttk.Button] = {}
+        self._history = JournalStatus(None, None, 0, 0)
+
+        # 세이브 목록 미리보기: 값 캐시, 읽는 중인 키, 정렬 상태
+        self._preview_executor = ThreadPoolExecutor(
+            max_workers=PREVIEW_WORKERS, thread_name_prefix='save-preview'
+        )
+        self._preview_cache = PreviewCache()
+        self._preview_pending: set[tuple] = set()
+        self._preview_fill_job: str | None = None
+        self._row_keys: dict[str, tuple] = {}
+        self._sort_column: str | None = None
+        self._sort_descending = False
+
+        # 세이브 폴더 증분 스캐너 (폴더가 바뀌면 새로 만듦), 스캔 진행 여부
+        self._scanner: SaveDirectoryScanner | None = None
+        self._scanning = False
+
         self._build_ui()
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+        self.root.after(WATCH_INTERVAL_MS, self._watch_tick)
 
     def _build_ui(self) -> None:
         """화면 위젯을 구성합니다."""
@@ -152,32 +305,39 @@ class SaveEditorScreen:
             anchor=tk.W
         )
 
-        # .hsg 목록 리스트박스 + 스크롤
+        # .hsg 목록 표 + 스크롤 (항목 id = 전체 경로, 제목 클릭으로 정렬)
         list_container = ttk.Frame(game_dir_frame)
         list_container.pack(fill=tk.BOTH, expand=True, pady=(4, 0))
         scroll = ttk.Scrollbar(list_container)
-        self._save_listbox = tk.Listbox(
+
+        def on_scroll(first, last) -> None:
+            scroll.set(first, last)
+            self._schedule_preview_fill()
+
+        self._save_tree = ttk.Treeview(
             list_container,
+            columns=[col for col, *_ in SAVE_LIST_COLUMNS],
+            show='headings',
             height=6,
-            selectmode=tk.SINGLE,
-            yscrollcommand=scroll.set,
-            font=('Segoe UI', 9),
+            selectmode='browse',
+            yscrollcommand=on_scroll,
         )
-        scroll.config(command=self._save_listbox.yview)
-        self._save_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for col, title, width, anchor in SAVE_LIST_COLUMNS:
+            self._save_tree.heading(col, text=title, command=lambda c=col: self._sort_save_list(c))
+            self._save_tree.column(col, width=width, anchor=anchor, stretch=(col == 'name'))
+        scroll.config(command=self._save_tree.yview)
+        self._save_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        # 클릭 시 선택한 파일 경로로 로드
-        self._save_list_paths: list[str] = []
 
+        # 클릭 시 선택한 파일 경로로 로드
         def on_list_select(_event) -> None:
-            sel = self._save_listbox.curselection()
-            if sel and 0 <= sel[0] < len(self._save_list_paths):
-                path = self._save_list_paths[sel[0]]
+            path = self._selected_list_path()
+            if path:
                 self._path_var.set(path)
                 self._on_file_selected(path)
 
-        self._save_listbox.bind('<<ListboxSelect>>', on_list_select)
-        self._save_listbox.bind('<Double-1>', on_list_select)
+        self._save_tree.bind('<<TreeviewSelect>>', on_list_select)
+        self._save_tree.bind('<Configure>', lambda _e: self._schedule_preview_fill())
 
         btn_row = ttk.Frame(game_dir_frame)
         btn_row.pack(fill=tk.X, pady=(4, 0))
@@ -187,9 +347,15 @@ class SaveEditorScreen:
         ttk.Button(btn_row, text='이 파일 열기', command=self._open_selected_from_list).pack(
             side=tk.LEFT
         )
+        self._watch_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            btn_row,
+            text='새 세이브 자동 표시',
+            variable=self._watch_var,
+        ).pack(side=tk.RIGHT)
 
-        # 초기 목록 채우기
-        self._refresh_save_list()
+        # 초기 목록 채우기 (작업 중 표시 위젯은 아직 없음)
+        self._refresh_save_list(busy=False)
 
         # ---- 현재 값 표시 영역 ----
         current_frame = ttk.LabelFrame(main, text='현재 값 (읽기 전용)', padding=6)
@@ -227,6 +393,29 @@ class SaveEditorScreen:
             text='저장 시 원본을 .hsg.bak 으로 백업',
             variable=self._backup_var,
         ).pack(anchor=tk.W)
+        self._snapshot_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            opt_frame,
+            text='저장 시 기존 내용을 스냅샷으로 남기기 (스냅샷... 에서 복원)',
+            variable=self._snapshot_var,
+        ).pack(anchor=tk.W)
+        self._journal_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            opt_frame,
+            text='저장 시 바뀐 값을 수정 기록에 남기기 (되돌리기/다시 실행)',
+            variable=self._journal_var,
+        ).pack(anchor=tk.W)
+        level_row = ttk.Frame(opt_frame)
+        level_row.pack(anchor=tk.W, pady=(2, 0))
+        ttk.Label(level_row, text='압축 수준 (0=빠름, 9=작게):').pack(side=tk.LEFT, padx=(0, 6))
+        self._level_var = tk.StringVar(value=str(DEFAULT_COMPRESS_LEVEL))
+        ttk.Combobox(
+            level_row,
+            textvariable=self._level_var,
+            values=[str(n) for n in range(10)],
+            width=4,
+            state='readonly',
+        ).pack(side=tk.LEFT)
 
         # ---- 버튼 영역 ----
         btn_frame = ttk.Frame(main)
@@ -235,57 +424,264 @@ class SaveEditorScreen:
         ttk.Button(btn_frame, text='현재 값 다시 읽기', command=self._reload_current).pack(
             side=tk.LEFT, padx=(0, 6)
         )
-        ttk.Button(btn_frame, text='저장 (덮어쓰기)', command=self._save_overwrite).pack(
-            side=tk.LEFT, padx=(0, 6)
-        )
-        ttk.Button(btn_frame, text='다른 이름으로 저장', command=self._save_as).pack(
-            side=tk.LEFT
-        )
+        overwrite_btn = ttk.Button(btn_frame, text='저장 (덮어쓰기)', command=self._save_overwrite)
+        overwrite_btn.pack(side=tk.LEFT, padx=(0, 6))
+        save_as_btn = ttk.Button(btn_frame, text='다른 이름으로 저장', command=self._save_as)
+        save_as_btn.pack(side=tk.LEFT, padx=(0, 6))
+        self._save_buttons = [overwrite_btn, save_as_btn]
+        ttk.Button(btn_frame, text='스냅샷...', command=self._open_snapshots).pack(side=tk.RIGHT)
+        redo_btn = ttk.Button(btn_frame, text='다시 실행', command=lambda: self._step_history(redo=True))
+        redo_btn.pack(side=tk.RIGHT, padx=(0, 6))
+        undo_btn = ttk.Button(btn_frame, text='되돌리기', command=lambda: self._step_history(redo=False))
+        undo_btn.pack(side=tk.RIGHT, padx=(0, 6))
+        self._history_buttons = {'undo': undo_btn, 'redo': redo_btn}
+        self._set_history(self._history)
 
-        # ---- 상태 메시지 ----
+        # ---- 상태 메시지 + 작업 중 표시 ----
+        status_row = ttk.Frame(main)
+        status_row.pack(fill=tk.X)
+        self._busy_bar = ttk.Progressbar(status_row, mode='indeterminate', length=80)
+        self._busy_bar.pack(side=tk.RIGHT)
         self._status_var = tk.StringVar(value='파일을 선택하거나 경로를 입력한 뒤 값을 확인·수정하세요.')
-        ttk.Label(main, textvariable=self._status_var, foreground='gray').pack(
-            anchor=tk.W
+        ttk.Label(status_row, textvariable=self._status_var, foreground='gray').pack(
+            side=tk.LEFT, fill=tk.X, expand=True
         )
 
+    def _run_in_background(self, fn, *args, on_done, on_error, busy: bool = True) -> Future:
+        """
+        fn(*args)를 작업 스레드에서 실행하고, 끝나면 화면 스레드에서 on_done(결과) 또는 on_error(예외)를 호출합니다.
+        취소된 작업은 어느 쪽도 호출하지 않습니다. busy가 True면 실행 중에 작업 중 표시가 돌아갑니다.
+        """
+        future = self._executor.submit(fn, *args)
+        if busy:
+            self._set_busy(True)
+
+        def poll() -> None:
+            if not future.done():
+                self.root.after(POLL_INTERVAL_MS, poll)
+                return
+            if busy:
+                self._set_busy(False)
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                on_error(exc)
+            else:
+                on_done(future.result())
+
+        self.root.after(POLL_INTERVAL_MS, poll)
+        return future
+
+    def _set_busy(self, busy: bool) -> None:
+        """진행 중인 작업 수를 세어 작업 중 표시를 켜고 끕니다."""
+        self._busy_count += 1 if busy else -1
+        if self._busy_count > 0:
+            self._busy_bar.start(15)
+            self.root.config(cursor='watch')
+        else:
+            self._busy_count = 0
+            self._busy_bar.stop()
+            self.root.config(cursor='')
+
+    def _on_close(self) -> None:
+        """창 닫기: 대기 중인 읽기는 취소하고, 진행 중인 저장은 끝까지 마친 뒤 종료됩니다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._preview_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def _on_file_selected(self, path: str) -> None:
         """
         파일이 선택되었을 때 현재 값을 로드하여 화면에 반영합니다.
         입력: path — .hsg 파일 경로
         """
         self._current_path = path
+        self._set_history(JournalStatus(None, None, 0, 0))
         self._reload_current()
 
-    def _refresh_save_list(self) -> None:
-        """게임 세이브 폴더를 스캔하여 리스트박스에 .hsg 목록을 표시합니다."""
-        self._save_list_paths.clear()
-        self._save_listbox.delete(0, tk.END)
+    def _refresh_save_list(self, busy: bool = True) -> None:
+        """
+        게임 세이브 폴더를 작업 스레드에서 증분 스캔하고, 바뀐 파일만 표에 반영합니다.
+        값 열은 캐시에 있으면 바로 채우고, 나머지는 보이는 행만 백그라운드에서 읽습니다.
+        """
+        if self._scanning:
+            return
         search_dir = self._game_dir_var.get().strip() or get_default_savegames_dir()
         if not os.path.isdir(search_dir):
             search_dir = get_default_game_root()
         if not os.path.isdir(search_dir):
-            self._save_listbox.insert(tk.END, '(게임 폴더를 찾을 수 없습니다)')
+            self._scanner = None
+            self._clear_save_list('(게임 폴더를 찾을 수 없습니다)')
             return
         self._game_dir_var.set(search_dir)
-        pairs = scan_hsg_files(search_dir)
-        for _full, display in pairs:
-            self._save_list_paths.append(_full)
-            self._save_listbox.insert(tk.END, display)
-        if not pairs:
-            self._save_listbox.insert(tk.END, '(이 폴더에 .hsg 파일이 없습니다)')
+        if self._scanner is None or self._scanner.root != os.path.normpath(search_dir):
+            self._scanner = SaveDirectoryScanner(search_dir)
+            self._clear_save_list()
+        scanner = self._scanner
+
+        def on_done(delta: ScanDelta) -> None:
+            self._scanning = False
+            if scanner is self._scanner:
+                self._apply_scan_delta(delta)
+
+        def on_error(exc: BaseException) -> None:
+            self._scanning = False
+            self._status_var.set(f'폴더 스캔 오류: {exc}')
+
+        self._scanning = True
+        self._run_in_background(scanner.scan, on_done=on_done, on_error=on_error, busy=busy)
+
+    def _watch_tick(self) -> None:
+        """자동 감시: 주기적으로 증분 스캔해 게임이 새로 쓴 자동 저장 등을 목록에 반영합니다."""
+        if self._watch_var.get() and self._scanner is not None:
+            self._refresh_save_list(busy=False)
+        self.root.after(WATCH_INTERVAL_MS, self._watch_tick)
+
+    def _clear_save_list(self, message: str | None = None) -> None:
+        """표를 비우고, message가 있으면 안내 행 하나를 넣습니다."""
+        tree = self._save_tree
+        tree.delete(*tree.get_children())
+        self._row_keys.clear()
+        if message:
+            tree.insert('', tk.END, values=(message,))
+
+    def _apply_scan_delta(self, delta: ScanDelta) -> None:
+        """증분 스캔 결과(추가/삭제/수정)를 표에 제자리 반영합니다. 바뀌지 않은 행은 건드리지 않습니다."""
+        tree = self._save_tree
+        if not delta and self._row_keys:
+            return
+        # 안내 행 제거
+        for iid in tree.get_children():
+            if iid not in self._row_keys:
+                tree.delete(iid)
+        for full in delta.removed:
+            self._row_keys.pop(full, None)
+            if tree.exists(full):
+                tree.delete(full)
+        for full, display in delta.added + delta.modified:
+            key = _preview_key(full)
+            if key is None:
+                continue
+            self._row_keys[full] = key
+            if tree.exists(full):
+                tree.item(full, values=self._row_values(full, display))
+            else:
+                tree.insert('', tk.END, iid=full, values=self._row_values(full, display))
+        if not self._row_keys:
+            tree.insert('', tk.END, values=('(이 폴더에 .hsg 파일이 없습니다)',))
+            return
+        if delta.added or self._sort_column is not None:
+            self._apply_sort()
+        self._schedule_preview_fill()
+
+    def _row_values(self, path: str, display: str) -> tuple:
+        """표 한 행의 표시 값. 캐시에 없는 값 열은 …(읽는 중/아직 안 읽음)"""
+        _path, size, mtime_ns = self._row_keys[path]
+        cached = self._preview_cache.get(self._row_keys[path])
+        fields = [_format_value(cached.get(name)) if cached else '…' for name in PREVIEW_FIELDS]
+        modified = datetime.fromtimestamp(mtime_ns / 1e9).strftime('%Y-%m-%d %H:%M')
+        return (display, *fields, _format_size(size), modified)
+
+    def _schedule_preview_fill(self) -> None:
+        """스크롤·크기 변경이 잦아도 한 번만 채우도록 보이는 행 미리보기 읽기를 미룹니다."""
+        if self._preview_fill_job is not None:
+            self.root.after_cancel(self._preview_fill_job)
+        self._preview_fill_job = self.root.after(PREVIEW_FILL_DELAY_MS, self._fill_visible_previews)
+
+    def _fill_visible_previews(self) -> None:
+        """화면에 보이는 행 중 캐시에 없는 세이브 값을 미리보기 스레드 풀에서 읽습니다."""
+        self._preview_fill_job = None
+        tree = self._save_tree
+        for path in tree.get_children():
+            key = self._row_keys.get(path)
+            if key is None or not tree.bbox(path):
+                continue
+            if key in self._preview_pending or self._preview_cache.get(key) is not None:
+                continue
+            self._preview_pending.add(key)
+            future = self._preview_executor.submit(read_current_values, path, list(PREVIEW_FIELDS))
+            self._poll_preview(key, future)
+
+    def _poll_preview(self, key: tuple, future: Future) -> None:
+        """미리보기 읽기가 끝나면 캐시에 넣고, 같은 파일 상태의 행이 있으면 갱신합니다."""
+        if not future.done():
+            self.root.after(POLL_INTERVAL_MS, self._poll_preview, key, future)
+            return
+        self._preview_pending.discard(key)
+        if future.cancelled():
+            return
+        values = {} if future.exception() is not None else future.result()
+        self._update_preview(key, values)
+
+    def _update_preview(self, key: tuple, values: dict) -> None:
+        """미리보기 캐시에 값을 넣고, 같은 파일 상태의 행이 있으면 표시를 갱신합니다."""
+        self._preview_cache.put(key, values)
+        path = key[0]
+        if self._row_keys.get(path) == key and self._save_tree.exists(path):
+            display = self._save_tree.set(path, 'name')
+            self._save_tree.item(path, values=self._row_values(path, display))
+            if self._sort_column in PREVIEW_FIELDS:
+                # 순서가 바뀌면 새로 보이게 된 행도 채움
+                self._apply_sort()
+                self._schedule_preview_fill()
+
+    def _sort_save_list(self, column: str) -> None:
+        """열 제목 클릭: 그 열로 정렬하고, 같은 열을 다시 누르면 순서를 뒤집습니다."""
+        if self._sort_column == column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = column in PREVIEW_FIELDS
+        self._apply_sort()
+        self._schedule_preview_fill()
+
+    def _apply_sort(self) -> None:
+        """현재 정렬 열 기준으로 행 순서를 바꿉니다. 값을 아직 모르는 행은 항상 뒤로 갑니다."""
+        column = self._sort_column or 'name'
+        tree = self._save_tree
+
+        def sort_key(path: str):
+            key = self._row_keys[path]
+            if column == 'name':
+                return tree.set(path, 'name').lower()
+            if column == 'size':
+                return key[1]
+            if column == 'modified':
+                return key[2]
+            value = (self._preview_cache.get(key) or {}).get(column)
+            return value if isinstance(value, (int, float)) else None
+
+        rows = [path for path in tree.get_children() if path in self._row_keys]
+        known = [path for path in rows if sort_key(path) is not None]
+        unknown = [path for path in rows if sort_key(path) is None]
+        known.sort(key=sort_key, reverse=self._sort_descending)
+        for index, path in enumerate(known + unknown):
+            tree.move(path, '', index)
+        for col, title, *_ in SAVE_LIST_COLUMNS:
+            mark = (' ▼' if self._sort_descending else ' ▲') if col == self._sort_column else ''
+            tree.heading(col, text=title + mark)
+
+    def _selected_list_path(self) -> str | None:
+        """표에서 선택한 세이브 경로. 안내 행이거나 선택이 없으면 None"""
+        sel = self._save_tree.selection()
+        if sel and sel[0] in self._row_keys:
+            return sel[0]
+        return None
 
     def _open_selected_from_list(self) -> None:
-        """리스트박스에서 선택한 항목을 세이브 경로로 설정하고 로드합니다."""
-        sel = self._save_listbox.curselection()
-        if not sel or sel[0] >= len(self._save_list_paths):
+        """표에서 선택한 항목을 세이브 경로로 설정하고 로드합니다."""
+        path = self._selected_list_path()
+        if not path:
             self._status_var.set('목록에서 세이브 파일을 선택하세요.')
             return
-        path = self._save_list_paths[sel[0]]
         self._path_var.set(path)
         self._on_file_selected(path)
 
     def _reload_current(self) -> None:
-        """경로가 있으면 해당 세이브의 현재 값을 읽어 라벨에 표시합니다."""
+        """
+        경로가 있으면 해당 세이브의 현재 값을 작업 스레드에서 읽어 라벨에 표시합니다.
+        새 읽기 요청이 오면 이전 요청은 취소(시작 전)하거나 결과를 버립니다(실행 중).
+        """
         path = self._path_var.get().strip()
         if not path:
             self._status_var.set('먼저 세이브 파일을 선택하세요.')
@@ -293,21 +689,68 @@ class SaveEditorScreen:
         if not os.path.isfile(path):
             self._status_var.set(f'파일을 찾을 수 없습니다: {path}')
             return
+        if self._saving:
+            # 저장 중인 파일을 읽으면 쓰다 만 내용을 볼 수 있으므로 저장 완료 후 값을 갱신함
+            self._status_var.set('저장 중입니다. 저장이 끝나면 값이 갱신됩니다.')
+            return
 
-        try:
-            values = read_current_values(path)
-            for name, lbl in self._current_labels.items():
-                val = values.get(name, '—')
-                if isinstance(val, (int, float)):
-                    lbl.config(text=str(val))
-                else:
-                    lbl.config(text=str(val))
-            self._status_var.set('현재 값을 불러왔습니다.')
-        except Exception as e:
-            self._status_var.set(f'읽기 오류: {e}')
+        if self._load_future is not None:
+            self._load_future.cancel()
+        self._load_generation += 1
+        generation = self._load_generation
+
+        def on_done(result: tuple[dict, str, JournalStatus]) -> None:
+            if generation != self._load_generation:
+                return
+            self._load_future = None
+            values, timing, history = result
+            self._show_values(values)
+            self._remember_preview(path, values)
+            self._set_history(history)
+            self._status_var.set(f'현재 값을 불러왔습니다. ({timing})')
+
+        def on_error(exc: BaseException) -> None:
+            if generation != self._load_generation:
+                return
+            self._load_future = None
+            self._status_var.set(f'읽기 오류: {exc}')
             for lbl in self._current_labels.values():
                 lbl.config(text='—')
 
+        self._status_var.set(f'읽는 중: {os.path.basename(path)}')
+        self._load_future = self._run_in_background(
+            _load_job, path, on_done=on_done, on_error=on_error
+        )
+
+    def _remember_preview(self, path: str, values: dict) -> None:
+        """
+        이미 읽은 값을 목록 미리보기 캐시에 넣어 같은 파일을 다시 읽지 않게 합니다.
+        저장 후에는 파일 크기/수정 시각이 바뀌므로 새 키로 행 정보도 갱신합니다.
+        """
+        key = _preview_key(path)
+        if key is None:
+            return
+        if path in self._row_keys:
+            self._row_keys[path] = key
+        self._update_preview(key, {name: values.get(name) for name in PREVIEW_FIELDS})
+
+    def _set_history(self, history: JournalStatus) -> None:
+        """수정 기록 상태에 맞춰 되돌리기/다시 실행 버튼을 켜고 끕니다 (저장 중에는 끔)."""
+        self._history = history
+        for key, label in (('undo', history.undo), ('redo', history.redo)):
+            btn = self._history_buttons.get(key)
+            if btn is not None:
+                btn.state(['!disabled'] if label and not self._saving else ['disabled'])
+
+    def _show_values(self, values: dict) -> None:
+        """
+        현재 값 라벨을 갱신합니다.
+        입력: values — 필드명 -> float 값 또는 오류 메시지
+        """
+        for name, lbl in self._current_labels.items():
+            val = values.get(name, '—')
+            lbl.config(text=str(val))
+
     def _get_edit_numbers(self) -> dict[str, float | None]:
         """
         수정 입력란에서 숫자만 추출합니다. 빈 칸은 None.
@@ -327,6 +770,8 @@ class SaveEditorScreen:
 
     def _save_overwrite(self) -> None:
         """현재 경로에 덮어쓰기로 저장합니다."""
+        if self._saving:
+            return
         path = self._path_var.get().strip()
         if not path or not os.path.isfile(path):
             messagebox.showwarning('저장 불가', '유효한 세이브 파일을 먼저 선택하세요.')
@@ -335,6 +780,8 @@ class SaveEditorScreen:
 
     def _save_as(self) -> None:
         """다른 이름/경로로 저장합니다."""
+        if self._saving:
+            return
         path = self._path_var.get().strip()
         if not path:
             messagebox.showwarning('저장 불가', '먼저 세이브 파일을 선택하세요.')
@@ -359,7 +806,9 @@ class SaveEditorScreen:
         output_path: str,
     ) -> None:
         """
-        edit_save를 호출하여 수정 후 저장합니다.
+        SaveFile 세션으로 한 번 해제 -> 수정 -> 한 번 압축하여 저장합니다 (작업 스레드).
+        저장 후 현재 값은 같은 세션의 버퍼에서 읽으므로 다시 해제하지 않습니다.
+        저장이 끝날 때까지 저장 버튼을 막고, 진행 중인 읽기는 취소합니다.
         입력: input_path — 원본 .hsg, output_path — 저장할 경로
         """
         edits = self._get_edit_numbers()
@@ -374,30 +823,311 @@ class SaveEditorScreen:
             )
             return
 
-        try:
-            changes = edit_save(
-                input_path,
-                output_path,
-                money=money,
-                energy=energy,
-                net_worth=net_worth,
-                backup=self._backup_var.get(),
-            )
+        self._begin_save()
+
+        def on_done(result: tuple[dict, dict, str, JournalStatus, int]) -> None:
+            self._end_save()
+            changes, values, timing, history, dropped = result
             lines = ['저장 완료: ' + output_path]
             for name, (old, new) in changes.items():
                 if isinstance(new, str):
                     lines.append(f'  {name}: {new}')
                 else:
                     lines.append(f'  {name}: {old} -> {new}')
-            self._status_var.set('저장했습니다.')
+            if dropped:
+                lines.append(f'이전 수정 기록 {dropped}개는 이 세이브와 맞지 않아 지웠습니다 (되돌릴 수 없음).')
+            self._status_var.set(f'저장했습니다. ({timing})')
             messagebox.showinfo('저장 완료', '\n'.join(lines))
-            # 저장 후 현재 값 다시 읽기
+            # 저장한 버퍼의 값으로 화면 갱신 (파일을 다시 해제하지 않음)
             self._current_path = output_path
             self._path_var.set(output_path)
+            self._show_values(values)
+            self._remember_preview(output_path, values)
+            self._set_history(history)
+
+        def on_error(exc: BaseException) -> None:
+            self._end_save()
+            messagebox.showerror('저장 오류', str(exc))
+            self._status_var.set(f'저장 오류: {exc}')
+
+        self._status_var.set(f'저장 중: {os.path.basename(output_path)}')
+        self._run_in_background(
+            _save_job,
+            input_path,
+            output_path,
+            {'Money': money, 'Energy': energy, 'NetWorth': net_worth},
+            self._backup_var.get(),
+            int(self._level_var.get()),
+            self._snapshot_var.get(),
+            self._journal_var.get(),
+            on_done=on_done,
+            on_error=on_error,
+        )
+
+    def _begin_save(self) -> None:
+        """저장(되돌리기 포함)을 시작합니다: 다른 저장을 막고, 이전 읽기 결과는 버림."""
+        self._saving = True
+        for btn in self._save_buttons:
+            btn.state(['disabled'])
+        self._set_history(self._history)
+        if self._load_future is not None:
+            self._load_future.cancel()
+            self._load_future = None
+        self._load_generation += 1
+
+    def _end_save(self) -> None:
+        """저장이 끝나면 저장 버튼을 다시 켭니다."""
+        self._saving = False
+        for btn in self._save_buttons:
+            btn.state(['!disabled'])
+        self._set_history(self._history)
+
+    def _step_history(self, redo: bool) -> None:
+        """
+        현재 세이브를 수정 기록에서 한 단계 되돌리거나 다시 실행합니다 (작업 스레드).
+        기록한 패치만 버퍼에 다시 쓰므로 바뀐 블록만 다시 압축합니다.
+        """
+        if self._saving:
+            return
+        path = self._path_var.get().strip()
+        if not path or not os.path.isfile(path):
+            messagebox.showwarning('수정 기록', '유효한 세이브 파일을 먼저 선택하세요.')
+            return
+        title = '다시 실행' if redo else '되돌리기'
+        self._begin_save()
+
+        def on_done(result: tuple) -> None:
+            self._end_save()
+            revision, values, timing, history = result
+            self._current_path = path
+            self._show_values(values)
+            self._remember_preview(path, values)
+            self._set_history(history)
+            self._status_var.set(
+                f'{title} ({history.position}/{history.count}): {revision.label} ({timing})'
+            )
+
+        def on_error(exc: BaseException) -> None:
+            self._end_save()
+            messagebox.showerror(f'{title} 오류', str(exc))
+            self._status_var.set(f'{title} 오류: {exc}')
             self._reload_current()
-        except Exception as e:
-            messagebox.showerror('저장 오류', str(e))
-            self._status_var.set(f'저장 오류: {e}')
+
+        self._status_var.set(f'{title} 중: {os.path.basename(path)}')
+        self._run_in_background(
+            _history_job,
+            path,
+            redo,
+            self._backup_var.get(),
+            int(self._level_var.get()),
+            on_done=on_done,
+            on_error=on_error,
+        )
+
+    def _open_snapshots(self) -> None:
+        """현재 세이브의 스냅샷 창을 엽니다."""
+        path = self._path_var.get().strip()
+        if not path:
+            messagebox.showwarning('스냅샷', '먼저 세이브 파일을 선택하세요.')
+            return
+        SnapshotWindow(self, path)
+
+
+class SnapshotWindow:
+    """
+    세이브 하나의 스냅샷 창.
+    - 목록: 시각, 설명, Money, 새로 저장한 크기
+    - 동작: 지금 스냅샷 남기기, 선택한 스냅샷과 현재 파일 비교, 복원, 보존 정책에 따른 정리
+    저장소 작업은 모두 에디터 화면의 작업 스레드에서 실행합니다.
+    """
+
+    def __init__(self, screen: SaveEditorScreen, path: str) -> None:
+        self.screen = screen
+        self.path = path
+        self.store = SnapshotStore()
+        self.window = tk.Toplevel(screen.root)
+        self.window.title(f'스냅샷 - {os.path.basename(path)}')
+        self.window.minsize(480, 300)
+        self._build_ui()
+        self._refresh()
+
+    def _build_ui(self) -> None:
+        frame = ttk.Frame(self.window, padding=8)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        list_container = ttk.Frame(frame)
+        list_container.pack(fill=tk.BOTH, expand=True)
+        scroll = ttk.Scrollbar(list_container)
+        self._tree = ttk.Treeview(
+            list_container,
+            columns=[col for col, *_ in SNAPSHOT_COLUMNS],
+            show='headings',
+            height=10,
+            selectmode='browse',
+            yscrollcommand=scroll.set,
+        )
+        for col, title, width, anchor in SNAPSHOT_COLUMNS:
+            self._tree.heading(col, text=title)
+            self._tree.column(col, width=width, anchor=anchor, stretch=(col == 'label'))
+        scroll.config(command=self._tree.yview)
+        self._tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        btn_row = ttk.Frame(frame)
+        btn_row.pack(fill=tk.X, pady=(6, 0))
+        ttk.Button(btn_row, text='지금 스냅샷', command=self._take).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(btn_row, text='현재 파일과 비교', command=self._diff).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(btn_row, text='이 스냅샷으로 복원', command=self._restore).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(btn_row, text='오래된 스냅샷 정리', command=self._gc).pack(side=tk.RIGHT)
+
+        self._status_var = tk.StringVar()
+        ttk.Label(frame, textvariable=self._status_var, foreground='gray').pack(anchor=tk.W, pady=(6, 0))
+
+    def _run(self, fn, *args, on_done, on_finish=None) -> None:
+        """
+        저장소 작업을 작업 스레드에서 실행합니다. 오류는 상태 줄과 메시지 창으로 알립니다.
+        on_finish를 주면 성공/실패와 상관없이 on_done/오류 처리보다 먼저 호출합니다.
+        """
+
+        def done(result) -> None:
+            if on_finish is not None:
+                on_finish()
+            on_done(result)
+
+        def on_error(exc: BaseException) -> None:
+            if on_finish is not None:
+                on_finish()
+            message = exc.args[0] if isinstance(exc, KeyError) else str(exc)
+            self._set_status(f'오류: {message}')
+            messagebox.showerror('스냅샷 오류', message, parent=self.window)
+
+        self.screen._run_in_background(fn, *args, on_done=done, on_error=on_error)
+
+    def _set_status(self, text: str) -> None:
+        if self.window.winfo_exists():
+            self._status_var.set(text)
+
+    def _refresh(self) -> None:
+        def on_done(infos) -> None:
+            if not self.window.winfo_exists():
+                return
+            self._tree.delete(*self._tree.get_children())
+            for info in reversed(infos):
+                self._tree.insert(
+                    '',
+                    tk.END,
+                    iid=info.id,
+                    values=(
+                        info.created[:19].replace('T', ' '),
+                        info.label,
+                        _format_value(info.values.get('Money')),
+                        format_size(info.stored_bytes),
+                    ),
+                )
+            self._set_status(f'스냅샷 {len(infos)}개')
+
+        self._run(self.store.snapshots, self.path, on_done=on_done)
+
+    def _selected_id(self) -> str | None:
+        sel = self._tree.selection()
+        if not sel:
+            self._set_status('목록에서 스냅샷을 선택하세요.')
+            return None
+        return sel[0]
+
+    def _take(self) -> None:
+        if not os.path.isfile(self.path):
+            self._set_status(f'파일을 찾을 수 없습니다: {self.path}')
+            return
+
+        def on_done(result) -> None:
+            info, created = result
+            if created:
+                self._set_status(f'스냅샷 저장: {info.id} (새로 저장 {format_size(info.stored_bytes)})')
+            else:
+                self._set_status('마지막 스냅샷과 내용이 같아 새로 만들지 않았습니다.')
+            self._refresh()
+
+        self._run(self.store.take, self.path, '수동', on_done=on_done)
+
+    def _diff(self) -> None:
+        snapshot_id = self._selected_id()
+        if snapshot_id is None or not os.path.isfile(self.path):
+            return
+
+        def on_done(result: dict) -> None:
+            regions = result['regions']
+            lines = [
+                f'크기: {result["size"][0]:,} -> {result["size"][1]:,} 바이트',
+                f'바뀐 구간 {len(regions)}개, {sum(region.new_length for region in regions):,} 바이트',
+            ]
+            for name, (old, new) in result['values'].items():
+                lines.append(f'  {name}: {old} -> {new}')
+            for region in regions[:SNAPSHOT_DIFF_SHOWN]:
+                lines.extend(format_region(describe_region(result['old_data'], result['new_data'], region)))
+            if len(regions) > SNAPSHOT_DIFF_SHOWN:
+                lines.append(f'... 외 {len(regions) - SNAPSHOT_DIFF_SHOWN}개 (edit_save.py diff 로 전체 확인)')
+            messagebox.showinfo('스냅샷과 현재 파일 비교', '\n'.join(lines), parent=self.window)
+
+        self._set_status('비교 중...')
+        self._run(self.store.diff, snapshot_id, self.path, on_done=on_done)
+
+    def _restore(self) -> None:
+        snapshot_id = self._selected_id()
+        if snapshot_id is None:
+            return
+        if self.screen._saving:
+            self._set_status('저장 중입니다. 저장이 끝난 뒤 복원하세요.')
+            return
+        if not messagebox.askyesno(
+            '복원',
+            f'{snapshot_id} 스냅샷으로 세이브를 되돌립니다.\n지금 내용은 먼저 스냅샷으로 남깁니다.',
+            parent=self.window,
+        ):
+            return
+        # 확인 창을 띄운 사이 시작된 저장이 있을 수 있음
+        if self.screen._saving:
+            self._set_status('저장 중입니다. 저장이 끝난 뒤 복원하세요.')
+            return
+
+        def on_done(path: str) -> None:
+            self._set_status(f'복원 완료: {path}')
+            self._refresh()
+            if os.path.normcase(os.path.abspath(path)) == os.path.normcase(
+                os.path.abspath(self.screen._path_var.get().strip())
+            ):
+                self.screen._reload_current()
+
+        # 복원도 세이브를 덮어쓰므로 끝날 때까지 에디터의 저장/되돌리기를 막음
+        self._set_status('복원 중...')
+        self.screen._begin_save()
+        self._run(
+            self.store.restore,
+            snapshot_id,
+            self.path,
+            self.screen._backup_var.get(),
+            int(self.screen._level_var.get()),
+            on_done=on_done,
+            on_finish=self.screen._end_save,
+        )
+
+    def _gc(self) -> None:
+        if not messagebox.askyesno(
+            '정리',
+            f'모든 세이브의 스냅샷 중 최근 {DEFAULT_KEEP_LAST}개와 '
+            f'{DEFAULT_KEEP_DAYS:g}일 안의 것만 남기고 지웁니다.',
+            parent=self.window,
+        ):
+            return
+
+        def on_done(result) -> None:
+            self._set_status(
+                f'정리: 스냅샷 {len(result.removed_snapshots)}개, 청크 {result.removed_chunks}개, '
+                f'{format_size(result.freed_bytes)}'
+            )
+            self._refresh()
+
+        self._run(self.store.gc, on_done=on_done)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""
+Big Ambitions 세이브 두 개 비교 (필드 위치 찾기용)
+
+게임에서 값 하나만 바꾸고 저장한 세이브 두 개를 비교하면, 바뀐 바이트 구간과 그 앞의 UTF-16
+필드명, 그 자리를 float32/float64/int32로 읽은 값을 보여 줍니다. 새 필드의 이름·값 위치·타입을
+추측 대신 확인할 수 있습니다.
+(실행: python edit_save.py diff 이전.hsg 이후.hsg)
+"""
+
+import argparse
+import json
+import math
+import sys
+from typing import NamedTuple
+
+from edit_save import (
+    FIELD_NAME_MIN_CHARS,
+    VALUE_CODECS,
+    _field_name_regex,
+    decompress_save,
+)
+
+
+# 같은 구간을 빨리 건너뛸 때 처음 비교하는 크기와 최대 크기 (두 배씩 늘림)
+MATCH_STEP_MIN = 256
+MATCH_STEP_MAX = 1 << 20
+# 어긋난 뒤 다시 맞는 자리를 찾는 범위. 못 찾으면 두 배씩 넓혀 다시 찾고 (긴 삽입/삭제),
+# 최대 범위에서도 못 찾으면 그만큼을 바뀐 구간으로 보고 계속함
+RESYNC_WINDOW = 64 << 10
+RESYNC_WINDOW_MAX = 16 << 20
+# 같은 오프셋 차이(대각선)로 다시 맞는지: 가까운 곳은 DIAGONAL_STEP 간격으로 DIAGONAL_MATCH 바이트씩
+# (DIAGONAL_MATCH + DIAGONAL_STEP - 1 = 11바이트 이상 같은 틈은 놓치지 않음), 먼 곳은 범위/RESYNC_PROBES 간격
+DIAGONAL_NEAR = 256
+DIAGONAL_MATCH = 8
+DIAGONAL_STEP = 4
+RESYNC_PROBES = 1024
+RESYNC_STRIDE = 16
+# 밀림(삽입/삭제) 찾기용 앵커 길이와, 앵커를 뽑는 위치 (어긋난 곳에서의 거리)
+ANCHOR_SIZE = 32
+ANCHOR_PROBES = (16, 256, 4096)
+# 다시 맞았다고 인정하는 연속 일치 길이
+RESYNC_VERIFY = 64
+# 바뀐 구간 사이 일치가 DENSE_GAP 바이트보다 짧은 경우가 DENSE_LIMIT번 이어지면 (거의 다 바뀐 곳)
+# 잘게 나누지 않고 찾기 범위만큼 한 구간으로 묶어 건너뜀
+DENSE_GAP = 32
+DENSE_LIMIT = 16
+# 바뀐 구간 사이 일치가 LONG_RUN 바이트보다 짧은 경우가 STREAK_LIMIT번 이어지면, 비슷한 내용끼리
+# 잘못 맞춰졌을 수 있으므로 넓은 범위에서 LONG_RUN 이상 이어지는 자리를 다시 찾음
+# (못 찾으면 다음에는 두 배 더 이어질 때 다시 봄)
+LONG_RUN = 4096
+STREAK_LIMIT = 8
+# 필드명을 찾을 때 바뀐 구간 앞에서 거슬러 보는 범위
+FIELD_LOOKBACK = 512
+# 후보 해석을 보여 주는 구간 최대 길이 (이보다 길면 값 하나가 바뀐 것으로 보지 않음)
+DECODE_MAX_LENGTH = 16
+DECODE_TYPES = ('float32', 'float64', 'int32')
+# diff 명령 기본 최대 구간 수 (전혀 다른 세이브를 비교할 때 끝없이 잘게 나누지 않도록)
+DEFAULT_MAX_REGIONS = 10000
+
+
+class DiffRegion(NamedTuple):
+    """바뀐 구간: 이전 버퍼의 (오프셋, 길이)가 이후 버퍼의 (오프셋, 길이)로 바뀜. 길이 0은 삽입/삭제."""
+
+    old_offset: int
+    old_length: int
+    new_offset: int
+    new_length: int
+
+
+def _common_prefix(old: bytes, new: bytes, i: int, j: int, limit: int | None = None) -> int:
+    """
+    old[i:]와 new[j:]의 공통 앞부분 길이 (limit를 주면 최대 limit).
+    일치 구간을 두 배씩 늘려 건너뛰고, 마지막만 이진 탐색합니다.
+    """
+    limit = min(len(old) - i, len(new) - j, limit if limit is not None else len(old))
+    matched = 0
+    step = MATCH_STEP_MIN
+    while matched < limit:
+        size = min(step, limit - matched)
+        if old[i + matched : i + matched + size] != new[j + matched : j + matched + size]:
+            # [matched, matched + size) 안에 첫 차이가 있음
+            lo, hi = 0, size
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if old[i + matched : i + matched + mid] == new[j + matched : j + matched + mid]:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            return matched + lo
+        matched += size
+        step = min(step * 2, MATCH_STEP_MAX)
+    return matched
+
+
+def _common_suffix(old: bytes, new: bytes, a: int, b: int, limit: int) -> int:
+    """old[:a]와 new[:b]의 공통 뒷부분 길이 (최대 limit). 일치 여부가 길이에 대해 단조이므로 이진 탐색합니다."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[a - mid : a] == new[b - mid : b]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _resync(
+    old: bytes, new: bytes, i: int, j: int, window: int = RESYNC_WINDOW, long_only: bool = False
+) -> tuple[int, int] | None:
+    """
+    old[i] != new[j] 인 곳에서, 두 버퍼가 다시 같아지는 가장 가까운 (이전 오프셋, 이후 오프셋)을 찾습니다.
+
+    - 값만 바뀐 경우(길이 같음): 같은 오프셋 차이에서 DIAGONAL_MATCH 바이트가 다시 같은 곳을 찾습니다.
+      어긋남이 없으므로 짧은 일치로 충분하고, 붙어 있는 값 두 개도 따로 잡힙니다.
+    - 삽입/삭제: 한쪽에서 앵커를 뽑아 다른 쪽 범위 안에서 bytes.find 로 찾습니다 (C 구현 검색).
+      우연히 맞는 것을 피하려고 RESYNC_VERIFY 바이트 일치로 확인합니다.
+    찾은 자리는 뒤로 최대한 당겨 바뀐 구간을 최소로 만듭니다. window 안에서 못 찾으면 None
+    long_only가 True면 범위 전체를 찾고, 뒤로 LONG_RUN 바이트 이상 같은 자리만 돌려줍니다.
+    """
+    n_old, n_new = len(old), len(new)
+
+    def verified(a: int, b: int) -> bool:
+        return old[a : a + RESYNC_VERIFY] == new[b : b + RESYNC_VERIFY]
+
+    candidates = []
+    # 같은 대각선 (값 치환): 가까운 곳은 바이트마다, 먼 곳은 간격을 두고
+    limit = min(window, n_old - i, n_new - j)
+    for k in range(1, min(DIAGONAL_NEAR, limit), DIAGONAL_STEP):
+        if old[i + k : i + k + DIAGONAL_MATCH] == new[j + k : j + k + DIAGONAL_MATCH]:
+            candidates.append((i + k, j + k))
+            break
+    else:
+        stride = max(RESYNC_STRIDE, window // RESYNC_PROBES)
+        for k in range(DIAGONAL_NEAR, limit, stride):
+            if old[i + k : i + k + RESYNC_STRIDE] == new[j + k : j + k + RESYNC_STRIDE] and verified(i + k, j + k):
+                candidates.append((i + k, j + k))
+                break
+    # 밀린 대각선 (삽입/삭제): 앵커를 반대쪽 범위에서 검색. 대각선에서 확실한(RESYNC_VERIFY 바이트) 일치를
+    # 찾았으면 그보다 짧은 구간이 될 수 있는 범위(2 * 거리)까지만 찾음
+    budget = window
+    if candidates and verified(*candidates[0]) and not long_only:
+        budget = 2 * (candidates[0][0] - i)
+    for probe in ANCHOR_PROBES:
+        if probe >= budget:
+            break
+        if i + probe + ANCHOR_SIZE <= n_old:
+            anchor = old[i + probe : i + probe + ANCHOR_SIZE]
+            if anchor.count(anchor[:1]) != ANCHOR_SIZE:  # 같은 바이트만 이어진 앵커는 어디서나 맞으므로 제외
+                pos = new.find(anchor, j, min(n_new, j + budget + ANCHOR_SIZE))
+                if pos >= 0 and verified(i + probe, pos):
+                    candidates.append((i + probe, pos))
+        if j + probe + ANCHOR_SIZE <= n_new:
+            anchor = new[j + probe : j + probe + ANCHOR_SIZE]
+            if anchor.count(anchor[:1]) != ANCHOR_SIZE:
+                pos = old.find(anchor, i, min(n_old, i + budget + ANCHOR_SIZE))
+                if pos >= 0 and verified(pos, j + probe):
+                    candidates.append((pos, j + probe))
+    # 바뀐 구간이 가장 짧아지도록 뒤로 당긴 뒤 고름
+    best = None
+    for a, b in candidates:
+        back = _common_suffix(old, new, a, b, min(a - i, b - j))
+        a, b = a - back, b - back
+        if long_only and _common_prefix(old, new, a, b, LONG_RUN) < min(LONG_RUN, n_old - a, n_new - b):
+            continue
+        if best is None or (a - i) + (b - j) < (best[0] - i) + (best[1] - j):
+            best = (a, b)
+    return best
+
+
+def diff_buffers(old: bytes, new: bytes, max_regions: int | None = None) -> list[DiffRegion]:
+    """
+    해제한 세이브 두 개를 비교해 바뀐 구간 목록을 만듭니다.
+
+    같은 구간은 크게 잘라 비교(C 수준 memcmp)하며 건너뛰고, 어긋나면 _resync 로 다시 맞춥니다.
+    바이트마다 파이썬 반복을 돌지 않으므로 시간은 버퍼 크기보다 바뀐 구간 수에 비례하며,
+    비슷한 세이브라면 100MB 이상도 1초 안팎입니다.
+
+    Args:
+        max_regions: 구간이 이만큼 모이면 나머지 전체를 마지막 구간 하나로 묶고 멈춤 (전혀 다른 세이브용)
+    """
+    old, new = bytes(old), bytes(new)
+    if old == new:
+        return []
+    regions: list[DiffRegion] = []
+    i = j = 0
+    n_old, n_new = len(old), len(new)
+    window = RESYNC_WINDOW
+    dense = 0
+    streak = 0
+    streak_limit = STREAK_LIMIT
+    while i < n_old and j < n_new:
+        if max_regions is not None and len(regions) >= max_regions:
+            break
+        k = _common_prefix(old, new, i, j)
+        if regions:
+            if k < DENSE_GAP:
+                dense += 1
+            else:
+                dense = 0
+                window = RESYNC_WINDOW
+            if k < LONG_RUN:
+                streak += 1
+            else:
+                streak = 0
+                streak_limit = STREAK_LIMIT
+        i += k
+        j += k
+        if i >= n_old or j >= n_new:
+            break
+        found = None
+        if streak >= streak_limit:
+            # 짧은 일치만 이어짐: 넓혀 가며 길게 이어지는 자리를 찾음
+            streak = 0
+            wide = window
+            while found is None:
+                found = _resync(old, new, i, j, wide, long_only=True)
+                if wide >= RESYNC_WINDOW_MAX or (i + wide >= n_old and j + wide >= n_new):
+                    break
+                wide *= 2
+            if found is None:
+                streak_limit *= 2
+        if found is None and dense < DENSE_LIMIT:
+            # 못 찾으면 같은 자리에서 범위를 두 배씩 넓혀 다시 찾음 (긴 삽입/삭제도 맞춤)
+            while True:
+                found = _resync(old, new, i, j, window)
+                if found is not None or window >= RESYNC_WINDOW_MAX or (
+                    i + window >= n_old and j + window >= n_new
+                ):
+                    break
+                window *= 2
+        if found is None:
+            # 끝내 못 찾았거나 거의 다 바뀐 곳: 범위만큼 한 구간으로 넘기고, 다음에도 넓게 찾음
+            a, b = min(n_old, i + window), min(n_new, j + window)
+            window = min(window * 2, RESYNC_WINDOW_MAX)
+            dense = 0
+        else:
+            a, b = found
+        if regions and regions[-1].old_offset + regions[-1].old_length == i and (
+            regions[-1].new_offset + regions[-1].new_length == j
+        ):
+            prev = regions.pop()
+            regions.append(DiffRegion(prev.old_offset, a - prev.old_offset, prev.new_offset, b - prev.new_offset))
+        else:
+            regions.append(DiffRegion(i, a - i, j, b - j))
+        i, j = a, b
+    if i < n_old or j < n_new:
+        regions.append(DiffRegion(i, n_old - i, j, n_new - j))
+    return regions
+
+
+def nearest_field_name(data: bytes, offset: int) -> tuple[str, int] | None:
+    """
+    offset 앞에서 가장 가까운 UTF-16 필드명과 그 끝 오프셋. FIELD_LOOKBACK 안에 없으면 None
+    """
+    start = max(0, offset - FIELD_LOOKBACK)
+    last = None
+    for m in _field_name_regex(FIELD_NAME_MIN_CHARS).finditer(data, start, offset):
+        last = m
+    if last is None:
+        return None
+    return last.group().decode('utf-16-le'), last.end()
+
+
+def _plausible(value) -> bool:
+    """후보 해석 중 게임 값으로 그럴듯한 것 (유한하고 너무 작거나 크지 않은 수)"""
+    if isinstance(value, float):
+        return math.isfinite(value) and (value == 0 or 1e-6 <= abs(value) <= 1e15)
+    return True
+
+
+def _json_number(value):
+    """JSON에 넣을 수 있는 값으로: NaN/무한대 float는 'nan', 'inf', '-inf' 문자열"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    return value
+
+
+def describe_region(old: bytes, new: bytes, region: DiffRegion) -> dict:
+    """
+    바뀐 구간 하나를 설명합니다.
+
+    Returns:
+        {'old_offset', 'old_length', 'new_offset', 'new_length',
+         'field': 필드명 또는 None, 'after_field': 필드명 끝에서 값 시작까지 바이트 (VALUE_OFFSET_AFTER_FIELD 후보),
+         'old_hex', 'new_hex', 'decodings': {타입: [이전, 이후, 그럴듯함]}}
+        값 시작은 필드명 끝을 기준으로 타입 크기에 맞춰 정렬한 위치입니다 (필드명이 없으면 절대 오프셋 기준).
+        NaN/무한대로 읽히는 값은 JSON으로 쓸 수 있도록 'nan', 'inf', '-inf' 문자열로 넣습니다.
+    """
+    info = dict(region._asdict())
+    field = nearest_field_name(old, region.old_offset)
+    info['field'] = field[0] if field else None
+    base = field[1] if field else 0
+    info['old_hex'] = old[region.old_offset : region.old_offset + min(region.old_length, 32)].hex(' ')
+    info['new_hex'] = new[region.new_offset : region.new_offset + min(region.new_length, 32)].hex(' ')
+    decodings = {}
+    if 0 < region.old_length == region.new_length <= DECODE_MAX_LENGTH:
+        end = region.old_offset + region.old_length
+        for name in DECODE_TYPES:
+            codec = VALUE_CODECS[name]
+            start = base + (region.old_offset - base) // codec.size * codec.size
+            if start + codec.size < end or start + codec.size > len(old):
+                continue  # 값 하나로 덮을 수 없는 구간
+            new_start = start + region.new_offset - region.old_offset
+            before = codec.unpack_from(old, start)[0]
+            after = codec.unpack_from(new, new_start)[0]
+            decodings[name] = [
+                _json_number(before),
+                _json_number(after),
+                _plausible(before) and _plausible(after),
+            ]
+    # 4바이트 값 기준 시작 위치가 필드명 끝에서 얼마나 떨어졌는지 (필드명이 없으면 None)
+    info['after_field'] = (region.old_offset - base) // 4 * 4 if field else None
+    info['decodings'] = decodings
+    return info
+
+
+def format_region(desc: dict) -> list[str]:
+    """describe_region 결과를 사람이 읽는 줄들로"""
+    head = (
+        f'0x{desc["old_offset"]:08x} (-{desc["old_length"]}) -> '
+        f'0x{desc["new_offset"]:08x} (+{desc["new_length"]})'
+    )
+    if desc['field']:
+        head += f'  필드 {desc["field"]} 뒤 {desc["after_field"]}바이트'
+    lines = [head]
+    if desc['decodings']:
+        for name, (before, after, plausible) in desc['decodings'].items():
+            mark = '' if plausible else '  (값으로 보기 어려움)'
+            lines.append(f'    {name:8} {before} -> {after}{mark}')
+    else:
+        lines.append(f'    이전: {desc["old_hex"] or "(없음)"}')
+        lines.append(f'    이후: {desc["new_hex"] or "(없음)"}')
+    return lines
+
+
+def diff_main(argv: list[str] | None = None) -> None:
+    """`edit_save.py diff` 명령: 세이브 두 개를 비교해 바뀐 구간과 필드명·후보 값을 출력."""
+    parser = argparse.ArgumentParser(
+        prog='edit_save.py diff',
+        description='세이브 두 개를 비교해 바뀐 바이트 구간, 앞의 UTF-16 필드명, 후보 값(float32/float64/int32) 출력',
+    )
+    parser.add_argument('old', help='이전 .hsg 세이브')
+    parser.add_argument('new', help='이후 .hsg 세이브')
+    parser.add_argument('--limit', type=int, default=50, help='출력할 최대 구간 수 (기본 50, 0이면 전부)')
+    parser.add_argument('--field', default=None, metavar='NAME', help='이 이름이 들어간 필드 뒤의 구간만 출력')
+    parser.add_argument(
+        '--max-regions',
+        type=int,
+        default=DEFAULT_MAX_REGIONS,
+        help=f'구간이 이만큼 모이면 나머지는 한 구간으로 묶고 비교를 멈춤 (기본 {DEFAULT_MAX_REGIONS}, 0이면 끝까지)',
+    )
+    parser.add_argument('--json', action='store_true', help='JSON 줄(JSON Lines)로 출력')
+    args = parser.parse_args(argv)
+
+    try:
+        old = decompress_save(args.old)
+        new = decompress_save(args.new)
+    except OSError as e:
+        print('오류:', e, file=sys.stderr)
+        sys.exit(1)
+    regions = diff_buffers(old, new, args.max_regions or None)
+    shown = 0
+    for region in regions:
+        if args.limit and shown >= args.limit:
+            break
+        desc = describe_region(old, new, region)
+        if args.field and args.field not in (desc['field'] or ''):
+            continue
+        shown += 1
+        if args.json:
+            print(json.dumps(desc, ensure_ascii=False, allow_nan=False))
+        else:
+            print('\n'.join(format_region(desc)))
+    if not args.json:
+        changed = sum(region.new_length for region in regions)
+        print(f'바뀐 구간 {len(regions)}개 (이후 기준 {changed} 바이트), 크기 {len(old)} -> {len(new)}', file=sys.stderr)
@@ -0,0 +1,566 @@
+# -*- coding: utf-8 -*-
+"""
+Big Ambitions 세이브 라이브러리(여러 세이브) 작업
+
+게임 세이브 폴더 탐색(변경분만 다시 보는 증분 스캐너 포함), 여러 .hsg 파일에 같은 수정을 프로세스 풀로 병렬 적용하는 batch 명령,
+여러 세이브의 필드 값을 CSV/JSON Lines로 뽑는 읽기 전용 report 명령을 제공합니다.
+(실행: python edit_save.py batch ... / python edit_save.py report ...)
+"""
+
+import argparse
+import csv
+import glob
+import json
+import operator
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from datetime import datetime
+from typing import NamedTuple
+
+import edit_save
+from edit_save import (
+    EditSpec,
+    SaveFile,
+    add_common_arguments,
+    add_edit_arguments,
+    apply_common_arguments,
+    apply_edit_spec,
+    edit_spec_from_args,
+    format_changes,
+    read_current_values,
+)
+
+
+# Unity 기본 저장 위치 (Windows)
+# Company: Hovgaard Games, Product: Big Ambitions
+def get_default_game_root() -> str:
+    """
+    Big Ambitions 게임 루트 폴더 경로를 반환합니다.
+    반환: ...\\AppData\\LocalLow\\Hovgaard Games\\Big Ambitions
+    """
+    user = os.environ.get('USERPROFILE', os.path.expanduser('~'))
+    return os.path.join(user, 'AppData', 'LocalLow', 'Hovgaard Games', 'Big Ambitions')
+
+
+def get_default_savegames_dir() -> str:
+    """
+    게임 세이브가 들어 있는 SaveGames 폴더 경로를 반환합니다.
+    반환: ...\\Big Ambitions\\SaveGames
+    """
+    return os.path.join(get_default_game_root(), 'SaveGames')
+
+
+def scan_hsg_files(top_dir: str) -> list[tuple[str, str]]:
+    """
+    지정 폴더 아래에서 재귀적으로 .hsg 파일을 찾아 (전체경로, 표시이름) 목록을 반환합니다.
+    표시이름은 게임 폴더 기준 상대 경로입니다.
+    입력: top_dir — 검색 루트 (예: SaveGames 경로)
+    반환: [(full_path, display_name), ...]
+    """
+    root = os.path.normpath(top_dir)
+    if not os.path.isdir(root):
+        return []
+    scanner = SaveDirectoryScanner(root)
+    scanner.scan()
+    return scanner.files()
+
+
+class ScanDelta(NamedTuple):
+    """증분 스캔 한 번의 변경분. added/modified는 (전체경로, 표시이름), removed는 전체경로"""
+
+    added: list[tuple[str, str]]
+    removed: list[str]
+    modified: list[tuple[str, str]]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+class SaveDirectoryScanner:
+    """
+    세이브 폴더 증분 스캐너.
+    폴더별 수정 시각과 내용(하위 폴더, .hsg 파일)을 기억해 두고, 수정 시각이 그대로인 폴더는
+    목록을 다시 읽지 않습니다. 파일 추가/삭제/이름 변경은 폴더 수정 시각을 바꾸지만 제자리 덮어쓰기는
+    바꾸지 않으므로, 알고 있는 파일은 매번 stat()으로 크기·수정 시각만 확인합니다.
+    """
+
+    def __init__(self, top_dir: str) -> None:
+        self.root = os.path.normpath(top_dir)
+        # 폴더 경로 -> (수정 시각 ns, 하위 폴더들, .hsg 파일들)
+        self._dirs: dict[str, tuple[int, tuple[str, ...], tuple[str, ...]]] = {}
+        # .hsg 전체 경로 -> (크기, 수정 시각 ns)
+        self._files: dict[str, tuple[int, int]] = {}
+
+    def _display_name(self, full: str) -> str:
+        try:
+            return os.path.relpath(full, self.root)
+        except ValueError:
+            return os.path.basename(full)
+
+    def scan(self) -> ScanDelta:
+        """
+        폴더를 다시 살펴 지난 스캔 이후의 변경분을 반환합니다. 첫 스캔은 모든 파일이 added입니다.
+        반환: ScanDelta
+        """
+        dirs = {}
+        files = {}
+        stack = [self.root]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                dir_mtime = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            cached = self._dirs.get(dirpath)
+            if cached is not None and cached[0] == dir_mtime:
+                _mtime, subdirs, names = cached
+                for full in names:
+                    try:
+                        st = os.stat(full)
+                    except OSError:
+                        continue
+                    files[full] = (st.st_size, st.st_mtime_ns)
+            else:
+                subdir_list = []
+                name_list = []
+                try:
+                    with os.scandir(dirpath) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdir_list.append(entry.path)
+                                elif entry.name.lower().endswith('.hsg') and entry.is_file():
+                                    st = entry.stat()
+                                    files[entry.path] = (st.st_size, st.st_mtime_ns)
+                                    name_list.append(entry.path)
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                subdirs, names = tuple(subdir_list), tuple(name_list)
+            dirs[dirpath] = (dir_mtime, subdirs, names)
+            stack.extend(subdirs)
+
+        old = self._files
+        added = [(full, self._display_name(full)) for full in files if full not in old]
+        removed = [full for full in old if full not in files]
+        modified = [
+            (full, self._display_name(full))
+            for full, sig in files.items()
+            if full in old and old[full] != sig
+        ]
+        self._dirs = dirs
+        self._files = files
+        return ScanDelta(added, removed, modified)
+
+    def directories(self) -> list[str]:
+        """마지막 스캔에서 본 폴더 경로 목록 (루트 포함)."""
+        return list(self._dirs)
+
+    def files(self) -> list[tuple[str, str]]:
+        """마지막 스캔의 (전체경로, 표시이름) 목록. 표시 이름 기준 정렬 (같은 폴더끼리 묶이도록)"""
+        result = [(full, self._display_name(full)) for full in self._files]
+        result.sort(key=lambda x: (x[1].lower(), x[0]))
+        return result
+
+
+def collect_save_files(targets: list[str]) -> list[str]:
+    """
+    폴더 / glob 패턴 / 파일 경로들을 .hsg 파일 목록으로 펼칩니다.
+    폴더는 scan_hsg_files()와 같은 방식으로 재귀 탐색하고, 중복은 처음 한 번만 남깁니다.
+    입력: targets — 폴더, glob 패턴(예: SaveGames/**/*.hsg), 파일 경로
+    반환: 전체 경로 목록
+    """
+    paths = []
+    seen = set()
+
+    def add(path: str) -> None:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            paths.append(path)
+
+    for target in targets:
+        if os.path.isdir(target):
+            for full, _display in scan_hsg_files(target):
+                add(full)
+        elif os.path.isfile(target):
+            add(target)
+        else:
+            for match in sorted(glob.glob(target, recursive=True)):
+                if os.path.isdir(match):
+                    for full, _display in scan_hsg_files(match):
+                        add(full)
+                elif match.lower().endswith('.hsg'):
+                    add(match)
+    return paths
+
+
+class BatchResult(NamedTuple):
+    """batch 작업 하나의 결과."""
+
+    path: str
+    ok: bool
+    changes: list[str]  # format_changes() 줄 목록
+    error: str
+    seconds: float
+    nbytes: int  # 입력(압축) 파일 크기
+    written: bool
+
+
+def _init_worker(schema_files: tuple[str, ...], cache: dict, compress_workers: int) -> None:
+    """
+    작업 프로세스 초기화: 부모와 같은 스키마/디스크 캐시 설정 (edit_save.cache_settings()), 압축 스레드 수 제한.
+    파일마다 한 번씩만 다루므로 해제 버퍼 캐시는 끕니다 (작업자마다 메모리를 잡지 않도록).
+    """
+    edit_save.COMPRESS_WORKERS = compress_workers
+    edit_save.configure_buffer_cache(0)
+    edit_save.apply_cache_settings(cache)
+    for path in schema_files:
+        edit_save.load_field_schema(path)
+
+
+def edit_one(
+    path: str,
+    spec: EditSpec,
+    output_path: str | None = None,
+    backup: bool = True,
+    compress_level: int = edit_save.DEFAULT_COMPRESS_LEVEL,
+    verify: bool | None = None,
+) -> BatchResult:
+    """
+    세이브 하나에 수정 목록을 적용하고 저장합니다. 예외는 결과로 돌려줍니다.
+    입력: path — .hsg 경로, spec — 수정 목록, output_path — 저장 경로 (None이면 덮어쓰기)
+    반환: BatchResult
+    """
+    start = time.perf_counter()
+    try:
+        nbytes = os.path.getsize(path)
+        with SaveFile(path) as save:
+            changes = apply_edit_spec(save, spec)
+            if output_path:
+                os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            written = save.commit(output_path, backup=backup, compress_level=compress_level, verify=verify)
+        return BatchResult(path, True, format_changes(changes), '', time.perf_counter() - start, nbytes, written)
+    except Exception as e:
+        return BatchResult(path, False, [], f'{type(e).__name__}: {e}', time.perf_counter() - start, 0, False)
+
+
+def _output_path_for(path: str, root: str, output_dir: str | None) -> str | None:
+    """output_dir이 있으면 공통 루트 기준 상대 경로를 그 아래에 그대로 둡니다."""
+    if not output_dir:
+        return None
+    try:
+        rel = os.path.relpath(os.path.abspath(path), root)
+    except ValueError:
+        rel = os.path.basename(path)
+    return os.path.join(output_dir, rel)
+
+
+def run_batch(
+    paths: list[str],
+    spec: EditSpec,
+    jobs: int | None = None,
+    output_dir: str | None = None,
+    backup: bool = True,
+    compress_level: int = edit_save.DEFAULT_COMPRESS_LEVEL,
+    schema_files: tuple[str, ...] = (),
+    use_cache: bool = True,
+    on_result=None,
+    verify: bool | None = None,
+) -> list[BatchResult]:
+    """
+    여러 세이브에 같은 수정을 프로세스 풀로 병렬 적용합니다.
+
+    Args:
+        paths: .hsg 파일 목록
+        spec: 수정 목록
+        jobs: 작업 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 차례로 처리)
+        output_dir: 지정하면 원본을 두고 이 폴더 아래에 같은 상대 경로로 저장
+        backup: 덮어쓸 때 .hsg.bak 백업
+        compress_level: 압축 수준 0~9
+        schema_files: 작업 프로세스에서 불러올 필드 스키마 파일
+        use_cache: 디스크 캐시(오프셋 인덱스, 복원 지점) 사용 여부
+        on_result: 결과가 나올 때마다 호출할 함수 (BatchResult 하나를 받음)
+        verify: 저장 후 검증 (기본: 덮어쓸 때만, SaveFile.commit() 참고)
+
+    Returns:
+        완료 순서대로의 BatchResult 목록
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(paths) or 1))
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths]) if paths else ''
+    results = []
+
+    def done(result: BatchResult) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    if jobs == 1:
+        for path in paths:
+            done(edit_one(path, spec, _output_path_for(path, root, output_dir), backup, compress_level, verify))
+        return results
+
+    # 프로세스마다 압축 스레드를 나눠 CPU를 과하게 쓰지 않도록 함
+    compress_workers = max(1, (os.cpu_count() or 1) // jobs)
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(tuple(schema_files), edit_save.cache_settings(use_cache), compress_workers),
+    ) as pool:
+        futures = [
+            pool.submit(edit_one, path, spec, _output_path_for(path, root, output_dir), backup, compress_level, verify)
+            for path in paths
+        ]
+        for future in as_completed(futures):
+            done(future.result())
+    return results
+
+
+def batch_main(argv: list[str] | None = None) -> None:
+    """`edit_save.py batch` 명령: 여러 세이브에 같은 수정을 일괄 적용하고 결과/처리량을 출력합니다."""
+    parser = argparse.ArgumentParser(
+        prog='edit_save.py batch',
+        description='여러 세이브 파일에 같은 수정을 프로세스 병렬로 일괄 적용',
+    )
+    parser.add_argument(
+        'targets',
+        nargs='+',
+        help='세이브 폴더(하위 폴더 포함), glob 패턴(예: "SaveGames/**/*.hsg") 또는 .hsg 파일',
+    )
+    add_edit_arguments(parser)
+    add_common_arguments(parser)
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수)')
+    parser.add_argument(
+        '--output-dir',
+        default=None,
+        help='원본을 덮어쓰지 않고 이 폴더 아래에 같은 상대 경로로 저장',
+    )
+    args = parser.parse_args(argv)
+
+    if not apply_common_arguments(args):
+        return
+    edit_save.configure_buffer_cache(0)
+    spec = edit_spec_from_args(args)
+    if spec.is_empty():
+        print('변경할 항목이 없습니다. -m, -e, -n, --set, --set-all 등 하나 이상 지정하세요.')
+        return
+    paths = collect_save_files(args.targets)
+    if not paths:
+        print('오류: 대상 세이브 파일(.hsg)을 찾을 수 없습니다.')
+        return
+
+    def report(result: BatchResult) -> None:
+        if result.ok:
+            state = '저장' if result.written else '변경 없음'
+            print(f'[{state}] {result.path} ({result.seconds:.2f}s)')
+            for line in result.changes:
+                print(f'    {line}')
+        else:
+            print(f'[실패] {result.path}: {result.error}')
+
+    print(f'세이브 {len(paths)}개 처리 시작...')
+    start = time.perf_counter()
+    results = run_batch(
+        paths,
+        spec,
+        jobs=args.jobs,
+        output_dir=args.output_dir,
+        backup=not args.no_backup,
+        compress_level=args.level,
+        schema_files=tuple(args.schema),
+        use_cache=not args.no_cache,
+        on_result=report,
+        verify=args.verify,
+    )
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    ok = sum(1 for r in results if r.ok)
+    written = sum(1 for r in results if r.written)
+    mbytes = sum(r.nbytes for r in results) / (1 << 20)
+    print(
+        f'완료: {ok}/{len(results)}개 성공 (저장 {written}개, 실패 {len(results) - ok}개), '
+        f'{elapsed:.2f}초, {len(results) / elapsed:.1f}개/초, {mbytes / elapsed:.1f} MB/초'
+    )
+
+
+# report 필터 비교 연산자
+_PREDICATE_OPS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+_PREDICATE_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(>=|<=|==|!=|>|<)\s*(\S+)\s*$')
+
+# report 출력의 기본 열 (필드 열 앞)
+REPORT_BASE_COLUMNS = ('path', 'size', 'modified', 'error')
+
+
+class Predicate(NamedTuple):
+    """report 필터 조건 하나 (예: Money > 1e6)."""
+
+    field: str
+    op: str
+    value: float
+
+    def matches(self, row: dict) -> bool:
+        """행의 필드 값이 조건을 만족하면 True. 값이 없으면 False, 목록이면 하나라도 만족하면 True"""
+        value = row.get(self.field)
+        values = value if isinstance(value, list) else [value]
+        compare = _PREDICATE_OPS[self.op]
+        return any(isinstance(v, (int, float)) and compare(v, self.value) for v in values)
+
+
+def parse_predicate(text: str) -> Predicate:
+    """'FIELD OP NUMBER' 형식(예: 'Money > 1e6')을 Predicate로 바꿉니다."""
+    m = _PREDICATE_RE.match(text)
+    if not m:
+        raise argparse.ArgumentTypeError(f'"필드 연산자 숫자" 형식이어야 합니다 (예: Money > 1e6): {text}')
+    try:
+        return Predicate(m.group(1), m.group(2), float(m.group(3)))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'숫자가 아닙니다: {m.group(3)}') from None
+
+
+def report_one(path: str, fields: tuple[str, ...]) -> dict:
+    """
+    세이브 하나의 필드 값을 읽어 report 행을 만듭니다 (조기 종료 스트리밍 읽기 사용).
+    입력: path — .hsg 경로, fields — 읽을 필드 이름들
+    반환: {'path', 'size', 'modified', 'error', 필드...} (없는 값은 None)
+    """
+    row = {'path': path, 'size': None, 'modified': None, 'error': None}
+    try:
+        st = os.stat(path)
+        row['size'] = st.st_size
+        row['modified'] = datetime.fromtimestamp(st.st_mtime).isoformat(timespec='seconds')
+        values = read_current_values(path, list(fields))
+        for name in fields:
+            value = values.get(name)
+            row[name] = None if isinstance(value, str) else value
+    except Exception as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+        for name in fields:
+            row.setdefault(name, None)
+    return row
+
+
+def iter_report(
+    paths: list[str],
+    fields: tuple[str, ...],
+    jobs: int | None = None,
+    schema_files: tuple[str, ...] = (),
+    use_cache: bool = True,
+):
+    """
+    여러 세이브의 report 행을 작업 프로세스 풀에서 만들어, 끝나는 순서대로 생성합니다.
+    진행 중인 작업 수를 작업자 수의 2배로 제한하므로 메모리는 파일 수가 아니라 작업자 수에 비례합니다.
+
+    Yields:
+        report_one()의 행 dict
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(paths) or 1))
+    if jobs == 1:
+        for path in paths:
+            yield report_one(path, fields)
+        return
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(tuple(schema_files), edit_save.cache_settings(use_cache), 1),
+    ) as pool:
+        pending = set()
+        for path in paths:
+            pending.add(pool.submit(report_one, path, fields))
+            if len(pending) >= jobs * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def _report_cell(value):
+    """CSV 칸 값: 목록은 JSON 문자열, None은 빈 칸."""
+    if isinstance(value, list):
+        return json.dumps(value)
+    return '' if value is None else value
+
+
+def report_main(argv: list[str] | None = None) -> None:
+    """`edit_save.py report` 명령: 여러 세이브의 필드 값을 CSV/JSON Lines로 스트리밍 출력합니다."""
+    parser = argparse.ArgumentParser(
+        prog='edit_save.py report',
+        description='여러 세이브의 필드 값을 읽어 CSV / JSON Lines로 출력 (읽기 전용, 프로세스 병렬)',
+    )
+    parser.add_argument(
+        'targets',
+        nargs='+',
+        help='세이브 폴더(하위 폴더 포함), glob 패턴 또는 .hsg 파일',
+    )
+    parser.add_argument(
+        '-f',
+        '--field',
+        action='append',
+        default=[],
+        metavar='NAME',
+        help='출력할 필드 (기본: Money/Energy/NetWorth). 여러 번 또는 쉼표로 지정',
+    )
+    parser.add_argument(
+        '-w',
+        '--where',
+        type=parse_predicate,
+        action='append',
+        default=[],
+        metavar='"FIELD OP NUMBER"',
+        help='필터 조건 (예: "Money > 1e6"). 여러 번 지정하면 모두 만족하는 세이브만 출력',
+    )
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default='csv', help='출력 형식 (기본 csv)')
+    parser.add_argument('-o', '--output', default=None, help='출력 파일 (기본: 화면)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수)')
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not apply_common_arguments(args):
+        return
+    edit_save.configure_buffer_cache(0)
+    fields = [name for item in args.field for name in item.split(',') if name] or list(edit_save.SAVE_FIELDS)
+    # 필터에만 쓰인 필드도 읽어야 함
+    for predicate in args.where:
+        if predicate.field not in fields:
+            fields.append(predicate.field)
+    paths = collect_save_files(args.targets)
+    if not paths:
+        print('오류: 대상 세이브 파일(.hsg)을 찾을 수 없습니다.', file=sys.stderr)
+        return
+
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        writer = None
+        if args.format == 'csv':
+            writer = csv.DictWriter(out, fieldnames=[*REPORT_BASE_COLUMNS, *fields])
+            writer.writeheader()
+        start = time.perf_counter()
+        total = matched = 0
+        for row in iter_report(paths, tuple(fields), args.jobs, tuple(args.schema), not args.no_cache):
+            total += 1
+            if row['error'] is None and not all(p.matches(row) for p in args.where):
+                continue
+            matched += 1
+            if writer is not None:
+                writer.writerow({key: _report_cell(value) for key, value in row.items()})
+            else:
+                out.write(json.dumps(row, ensure_ascii=False) + '\n')
+            out.flush()
+        elapsed = max(time.perf_counter() - start, 1e-9)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(
+        f'세이브 {total}개 중 {matched}개 출력, {elapsed:.2f}초, {total / elapsed:.1f}개/초',
+        file=sys.stderr,
+    )
@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+"""
+Big Ambitions 세이브 로컬 서비스 (JSON-RPC over HTTP)와 클라이언트
+
+자동화 도구가 작업마다 edit_save.py를 새로 실행하면 인터프리터 시작·import·압축 해제 비용을 매번 냅니다.
+이 모듈의 상주 서비스는 해제한 세이브(버퍼 캐시)와 필드 오프셋 인덱스(메모리 + 디스크 캐시)를 계속 들고
+읽기/수정/보고서 요청을 여러 스레드에서 동시에 처리합니다. 같은 세이브 쓰기는 파일별 잠금으로 하나씩 처리합니다.
+표준 라이브러리만 씁니다. (실행: python edit_save.py serve ...)
+
+클라이언트 사용 예:
+    from save_service import SaveServiceClient
+    with SaveServiceClient() as client:
+        print(client.read('Save.hsg'))
+        client.edit('Save.hsg', set={'Money': 10000000})
+"""
+
+import argparse
+import http.client
+import inspect
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import edit_save
+from edit_save import (
+    BUFFER_CACHE_MAX_BYTES,
+    DEFAULT_COMPRESS_LEVEL,
+    SaveFile,
+    add_common_arguments,
+    apply_common_arguments,
+    apply_edit_spec,
+    edit_spec_from_dict,
+    get_buffer_cache,
+    invalidate_buffer_cache,
+    latency_summary,
+    read_current_values,
+)
+from save_library import collect_save_files, parse_predicate, report_one
+
+
+DEFAULT_SERVICE_HOST = '127.0.0.1'
+DEFAULT_SERVICE_PORT = 47315
+# 메모리에 둘 오프셋 인덱스 캐시 항목 수
+SERVICE_INDEX_MEMORY_ENTRIES = 256
+# keep-alive 연결에 이 시간(초) 동안 요청이 없으면 닫음
+SERVICE_IDLE_TIMEOUT = 60.0
+# 요청 본문 최대 크기
+MAX_REQUEST_BYTES = 16 << 20
+# 메서드별 지연 시간 통계에 남길 최근 요청 수
+LATENCY_SAMPLES = 1000
+
+# JSON-RPC 2.0 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class ServiceError(Exception):
+    """JSON-RPC 오류. 서비스 메서드가 올리면 그대로 오류 응답이 되고, 클라이언트는 오류 응답을 이 예외로 올립니다."""
+
+    def __init__(self, code: int, message: str, data=None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> dict:
+        error = {'code': self.code, 'message': self.message}
+        if self.data is not None:
+            error['data'] = self.data
+        return error
+
+
+class FileLocks:
+    """
+    세이브 경로별 잠금. 같은 세이브에 대한 쓰기를 한 번에 하나씩 처리합니다.
+    항목은 지우지 않으므로 다룬 세이브 수만큼만 늘어납니다.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    @contextmanager
+    def hold(self, *paths: str):
+        """paths의 잠금을 모두 잡습니다 (정렬된 순서로 잡아 교착을 막음)."""
+        keys = sorted({os.path.normcase(os.path.abspath(p)) for p in paths})
+        locks = [self._lock_for(key) for key in keys]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+def _require_file(path) -> str:
+    if not isinstance(path, str) or not os.path.isfile(path):
+        raise ServiceError(INVALID_PARAMS, f'세이브 파일을 찾을 수 없습니다: {path}')
+    return path
+
+
+class SaveService:
+    """
+    JSON-RPC 요청 처리기 (HTTP와 무관). 여러 스레드에서 동시에 handle()을 불러도 됩니다.
+
+    메서드 (params는 이름 있는 인자 객체):
+        ping()                                      -> {'pid', 'uptime'}
+        read(path, fields=None)                     -> 필드명 -> 값
+        edit(path, output=None, backup=True, level=9, verify=None, set=..., set_all=..., scale_all=..., clamp_all=...)
+                                                    -> {'changes': {이름: [이전, 이후]}, 'written', 'output'}
+        list_fields(path, prefix='')                -> [[필드명, 등장 횟수, 첫 오프셋], ...]
+        report(targets, fields=None, where=())      -> report 명령과 같은 행 목록 (where: "Money > 1e6" 등)
+        invalidate(path)                            -> 해제 버퍼 캐시에서 버림 (서비스 밖에서 파일을 바꾼 뒤)
+        stats()                                     -> 메서드별 호출/오류 수와 지연 시간, 캐시 사용량
+    """
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.locks = FileLocks()
+        self._methods = {
+            'ping': self.ping,
+            'read': self.read,
+            'edit': self.edit,
+            'list_fields': self.list_fields,
+            'report': self.report,
+            'invalidate': self.invalidate,
+            'stats': self.stats,
+        }
+        self._stats_lock = threading.Lock()
+        # 메서드 -> [호출 수, 오류 수, 최근 지연 시간들]
+        self._calls: dict[str, list] = {}
+        self._active = 0
+
+    def handle(self, request):
+        """
+        JSON으로 읽은 요청(객체 하나 또는 배치 목록)을 처리해 응답을 돌려줍니다.
+        알림(id 없는 요청)만 있으면 None
+        """
+        if isinstance(request, list):
+            if not request:
+                return self._error(None, ServiceError(INVALID_REQUEST, '빈 배치 요청입니다.'))
+            responses = [r for r in map(self._handle_one, request) if r is not None]
+            return responses or None
+        return self._handle_one(request)
+
+    @staticmethod
+    def _error(req_id, error: ServiceError) -> dict:
+        return {'jsonrpc': '2.0', 'id': req_id, 'error': error.to_dict()}
+
+    def _handle_one(self, request) -> dict | None:
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or not isinstance(request.get('method'), str):
+            return self._error(None, ServiceError(INVALID_REQUEST, 'JSON-RPC 2.0 요청이 아닙니다.'))
+        req_id = request.get('id')
+        notification = 'id' not in request
+        name = request['method']
+        method = self._methods.get(name)
+        if method is None:
+            return None if notification else self._error(req_id, ServiceError(METHOD_NOT_FOUND, f'없는 메서드입니다: {name}'))
+        params = request.get('params', {})
+        start = time.perf_counter()
+        with self._stats_lock:
+            self._active += 1
+        failed = True
+        try:
+            if not isinstance(params, dict):
+                raise ServiceError(INVALID_PARAMS, 'params는 객체여야 합니다.')
+            try:
+                inspect.signature(method).bind(**params)
+            except TypeError as e:
+                raise ServiceError(INVALID_PARAMS, str(e)) from None
+            result = method(**params)
+            failed = False
+        except ServiceError as e:
+            error = e
+        except Exception as e:
+            error = ServiceError(SERVER_ERROR, f'{type(e).__name__}: {e}')
+        finally:
+            self._record(name, time.perf_counter() - start, failed)
+        if notification:
+            return None
+        if failed:
+            return self._error(req_id, error)
+        return {'jsonrpc': '2.0', 'id': req_id, 'result': result}
+
+    def _record(self, name: str, seconds: float, failed: bool) -> None:
+        with self._stats_lock:
+            self._active -= 1
+            entry = self._calls.get(name)
+            if entry is None:
+                entry = self._calls[name] = [0, 0, deque(maxlen=LATENCY_SAMPLES)]
+            entry[0] += 1
+            entry[1] += failed
+            entry[2].append(seconds)
+
+    # --- 메서드 ---
+
+    def ping(self) -> dict:
+        return {'pid': os.getpid(), 'uptime': time.time() - self.started}
+
+    def read(self, path: str, fields: list[str] | None = None) -> dict:
+        # 곧 다시 읽거나 수정할 세이브이므로 해제 버퍼를 캐시에 둠
+        return read_current_values(_require_file(path), fields or None, cache_buffer=True)
+
+    def edit(
+        self,
+        path: str,
+        output: str | None = None,
+        backup: bool = True,
+        level: int = DEFAULT_COMPRESS_LEVEL,
+        verify: bool | None = None,
+        **edits,
+    ) -> dict:
+        _require_file(path)
+        try:
+            spec = edit_spec_from_dict(edits)
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ServiceError(INVALID_PARAMS, f'수정 내용이 올바르지 않습니다: {e}') from None
+        if spec.is_empty():
+            raise ServiceError(INVALID_PARAMS, '변경할 항목이 없습니다. set/set_all/scale_all/clamp_all 중 하나 이상 지정하세요.')
+        if not isinstance(level, int) or not 0 <= level <= 9:
+            raise ServiceError(INVALID_PARAMS, f'압축 수준은 0~9입니다: {level}')
+        output = output or path
+        with self.locks.hold(path, output):
+            with SaveFile(path) as save:
+                changes = apply_edit_spec(save, spec)
+                written = save.commit(output, backup=backup, compress_level=level, verify=verify)
+        return {
+            'changes': {name: [old, new] for name, (old, new) in changes.items()},
+            'written': written,
+            'output': output,
+        }
+
+    def list_fields(self, path: str, prefix: str = '') -> list:
+        with SaveFile(_require_file(path)) as save:
+            index = save.index
+            return [[name, index.count(name), index.first(name)] for name in index.names_with_prefix(prefix)]
+
+    def report(self, targets: list[str], fields: list[str] | None = None, where: list[str] = ()) -> list[dict]:
+        if isinstance(targets, str):
+            targets = [targets]
+        try:
+            predicates = [parse_predicate(text) for text in where]
+        except argparse.ArgumentTypeError as e:
+            raise ServiceError(INVALID_PARAMS, str(e)) from None
+        names = list(fields or edit_save.SAVE_FIELDS)
+        for predicate in predicates:
+            if predicate.field not in names:
+                names.append(predicate.field)
+        rows = []
+        for path in collect_save_files(targets):
+            row = report_one(path, tuple(names))
+            if row['error'] is None and not all(p.matches(row) for p in predicates):
+                continue
+            rows.append(row)
+        return rows
+
+    def invalidate(self, path: str) -> bool:
+        invalidate_buffer_cache(path)
+        return True
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            requests = {
+                name: {'calls': calls, 'errors': errors, 'latency': latency_summary(samples)}
+                for name, (calls, errors, samples) in self._calls.items()
+            }
+            active = self._active
+        buffers = get_buffer_cache()
+        return {
+            'uptime': time.time() - self.started,
+            # stats 요청 자신도 포함
+            'active': active,
+            'requests': requests,
+            'buffer_cache': buffers.stats() if buffers is not None else None,
+        }
+
+
+class _RpcHandler(BaseHTTPRequestHandler):
+    """POST /rpc 로 받은 JSON-RPC 요청을 SaveService에 넘깁니다. 연결은 keep-alive로 재사용합니다."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'BigAmbitionsSaveService/1'
+    timeout = SERVICE_IDLE_TIMEOUT
+    # 헤더와 본문을 따로 보내므로 Nagle + 지연 ACK로 응답마다 ~40ms 늦어지지 않도록
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        if self.path != '/rpc':
+            self._reply(404, SaveService._error(None, ServiceError(INVALID_REQUEST, '경로는 /rpc 입니다.')))
+            return
+        # 브라우저가 로컬 서비스로 요청을 보내지 못하도록: Host는 서비스 주소, 본문은 application/json만
+        if self.headers.get('Host', '') not in self.server.allowed_hosts:
+            self._reply(403, SaveService._error(None, ServiceError(INVALID_REQUEST, '허용되지 않은 Host입니다.')))
+            return
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type != 'application/json':
+            self._reply(415, SaveService._error(None, ServiceError(INVALID_REQUEST, 'Content-Type은 application/json 이어야 합니다.')))
+            return
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._reply(413, SaveService._error(None, ServiceError(INVALID_REQUEST, '요청 길이가 없거나 너무 큽니다.')))
+            return
+        body = self.rfile.read(length)
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            response = SaveService._error(None, ServiceError(PARSE_ERROR, f'JSON을 읽을 수 없습니다: {e}'))
+        else:
+            response = self.server.service.handle(request)
+        if response is None:
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self._reply(200, response)
+
+    def _reply(self, status: int, payload) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SaveServiceServer(ThreadingHTTPServer):
+    """연결마다 스레드 하나로 요청을 처리하는 HTTP 서버."""
+
+    daemon_threads = True
+    # 여러 클라이언트가 한꺼번에 연결해도 거절되지 않도록 (기본 5)
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], service: SaveService | None = None, verbose: bool = False) -> None:
+        super().__init__(address, _RpcHandler)
+        self.service = service or SaveService()
+        self.verbose = verbose
+        host, port = self.server_address[:2]
+        names = {host, 'localhost', '127.0.0.1', '[::1]'} if host in ('127.0.0.1', '::1', 'localhost') else {host}
+        self.allowed_hosts = {f'{name}:{port}' for name in names}
+
+
+class SaveServiceClient:
+    """
+    서비스 클라이언트. 연결 하나를 계속 쓰므로(keep-alive) 요청마다 연결 비용이 없습니다.
+    연결을 공유하므로 스레드마다 하나씩 만드세요. 오류 응답은 ServiceError로 올립니다.
+    """
+
+    def __init__(self, host: str = DEFAULT_SERVICE_HOST, port: int = DEFAULT_SERVICE_PORT, timeout: float = 300.0) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._conn: http.client.HTTPConnection | None = None
+        self._next_id = 0
+
+    def __enter__(self) -> 'SaveServiceClient':
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def call(self, method: str, **params):
+        """메서드를 호출해 result를 돌려줍니다."""
+        self._next_id += 1
+        body = json.dumps({'jsonrpc': '2.0', 'id': self._next_id, 'method': method, 'params': params}).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        for attempt in range(2):
+            reused = self._conn is not None
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+                self._conn.connect()
+                # http.client는 헤더와 본문을 따로 보내므로 Nagle을 끄지 않으면 요청마다 ~40ms 늦어짐
+                self._conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                self._conn.request('POST', '/rpc', body, headers)
+                response = self._conn.getresponse()
+                data = response.read()
+                break
+            except (ConnectionError, http.client.HTTPException):
+                self.close()
+                # 쉬던 연결을 서버가 닫은 경우만 한 번 다시 시도 (요청이 처리되지 않았음)
+                if not reused or attempt:
+                    raise
+        if response.status == 204:
+            return None
+        try:
+            reply = json.loads(data)
+        except ValueError:
+            raise ServiceError(SERVER_ERROR, f'HTTP {response.status}: {data[:200]!r}') from None
+        if 'error' in reply:
+            error = reply['error']
+            raise ServiceError(error.get('code', SERVER_ERROR), error.get('message', ''), error.get('data'))
+        return reply.get('result')
+
+    def ping(self) -> dict:
+        return self.call('ping')
+
+    def read(self, path: str, fields: list[str] | None = None) -> dict:
+        return self.call('read', path=os.path.abspath(path), fields=fields)
+
+    def edit(self, path: str, output: str | None = None, backup: bool = True, level: int | None = None, **edits) -> dict:
+        """edits: set / set_all / scale_all / clamp_all (예: set={'Money': 1e7}, clamp_all={'Salary': [None, 5000]})"""
+        params = {'path': os.path.abspath(path), 'backup': backup, **edits}
+        if output:
+            params['output'] = os.path.abspath(output)
+        if level is not None:
+            params['level'] = level
+        return self.call('edit', **params)
+
+    def list_fields(self, path: str, prefix: str = '') -> list:
+        return self.call('list_fields', path=os.path.abspath(path), prefix=prefix)
+
+    def report(self, targets: list[str], fields: list[str] | None = None, where: list[str] = ()) -> list[dict]:
+        return self.call('report', targets=[os.path.abspath(t) for t in targets], fields=fields, where=list(where))
+
+    def invalidate(self, path: str) -> bool:
+        return self.call('invalidate', path=os.path.abspath(path))
+
+    def stats(self) -> dict:
+        return self.call('stats')
+
+
+def serve_main(argv: list[str] | None = None) -> None:
+    """`edit_save.py serve` 명령: 로컬 JSON-RPC 서비스를 실행합니다."""
+    parser = argparse.ArgumentParser(
+        prog='edit_save.py serve',
+        description='해제한 세이브와 필드 인덱스를 메모리에 두고 읽기/수정/보고서 요청을 처리하는 로컬 서비스 (JSON-RPC)',
+    )
+    parser.add_argument('--host', default=DEFAULT_SERVICE_HOST, help=f'주소 (기본 {DEFAULT_SERVICE_HOST}, 이 PC에서만 접속)')
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVICE_PORT, help=f'포트 (기본 {DEFAULT_SERVICE_PORT})')
+    parser.add_argument(
+        '--buffer-cache-mb',
+        type=int,
+        default=BUFFER_CACHE_MAX_BYTES >> 20,
+        metavar='MB',
+        help=f'해제한 세이브를 메모리에 둘 용량 (기본 {BUFFER_CACHE_MAX_BYTES >> 20}MB)',
+    )
+    parser.add_argument(
+        '--index-memory',
+        type=int,
+        default=SERVICE_INDEX_MEMORY_ENTRIES,
+        metavar='N',
+        help=f'메모리에 둘 필드 오프셋 인덱스 수 (기본 {SERVICE_INDEX_MEMORY_ENTRIES})',
+    )
+    parser.add_argument('-v', '--verbose', action='store_true', help='요청마다 접속 기록 출력')
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not apply_common_arguments(args):
+        return
+    if not args.no_cache:
+        edit_save.configure_buffer_cache(args.buffer_cache_mb << 20)
+        edit_save.configure_index_cache(memory_entries=args.index_memory)
+    try:
+        server = SaveServiceServer((args.host, args.port), verbose=args.verbose)
+    except OSError as e:
+        print('오류: 서비스를 시작할 수 없습니다.', e)
+        return
+    host, port = server.server_address[:2]
+    print(f'서비스 시작: http://{host}:{port}/rpc (끝내려면 Ctrl+C)', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print('서비스 종료')
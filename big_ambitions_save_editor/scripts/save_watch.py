@@ -0,0 +1,634 @@
+# -*- coding: utf-8 -*-
+"""
+Big Ambitions 세이브 감시 (자동 저장에 수정 프로필 자동 적용)
+
+게임이 세이브(자동 저장 포함)를 쓸 때마다 같은 수정을 다시 적용하는 상주 모드입니다. SaveGames 폴더를
+Linux에서는 inotify로, 그 밖에서는 주기적 증분 스캔(SaveDirectoryScanner)으로 지켜보고, 크기·수정 시각이
+일정 시간 그대로일 때(게임이 다 쓸 때)까지 기다린 뒤 이름 붙인 수정 프로필을 크기 제한 작업 큐로 적용합니다.
+처리 전에 같은 세이브가 다시 쓰이면 작업 하나로 합칩니다.
+(실행: python edit_save.py watch ...)
+"""
+
+import argparse
+import asyncio
+import ctypes
+import fnmatch
+import json
+import os
+import signal
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import edit_save
+from edit_save import (
+    EditSpec,
+    add_common_arguments,
+    add_edit_arguments,
+    apply_common_arguments,
+    atomic_write,
+    edit_spec_from_args,
+    edit_spec_from_dict,
+    latency_summary,
+)
+from save_library import BatchResult, SaveDirectoryScanner, edit_one, get_default_savegames_dir
+
+
+# 크기·수정 시각이 이 시간(초) 동안 그대로면 쓰기가 끝난 것으로 봄
+DEFAULT_SETTLE_SECONDS = 3.0
+# 폴링 감시의 스캔 간격 (초)
+DEFAULT_POLL_INTERVAL = 2.0
+# 시작 전 작업 큐 크기 (가득 차면 감시가 기다림; 같은 세이브는 합쳐지므로 보통 세이브 수보다 작음)
+DEFAULT_QUEUE_SIZE = 16
+# inotify를 써도 이 간격(초)마다 한 번은 스캔 (이벤트 큐 넘침 등으로 놓친 변경 대비)
+INOTIFY_RESCAN_SECONDS = 60.0
+# 지연 시간 통계에 남길 최근 작업 수
+LATENCY_SAMPLES = 1000
+# 카운터 출력 간격 기본값 (초)
+DEFAULT_STATS_INTERVAL = 60.0
+
+WATCH_BACKENDS = ('auto', 'inotify', 'poll')
+
+class EditProfile(NamedTuple):
+    """이름 붙인 수정 프로필. match(glob)가 있으면 표시 이름(SaveGames 기준 상대 경로)이 맞는 세이브에만 적용"""
+
+    name: str
+    spec: EditSpec
+    match: str | None = None
+
+    def applies_to(self, display_name: str) -> bool:
+        """이 세이브에 적용하는 프로필이면 True."""
+        if not self.match:
+            return True
+        return fnmatch.fnmatch(display_name.replace('\\', '/'), self.match.replace('\\', '/'))
+
+
+def load_edit_profiles(path: str) -> dict[str, EditProfile]:
+    """
+    수정 프로필 JSON 파일을 읽습니다. 프로필 하나는 edit_spec_from_dict() 형식에 "match"(glob)를 더한 것입니다.
+
+    형식:
+        {"profiles": {"rich": {"set": {"Money": 10000000}},
+                      "rested": {"set_all": {"Energy": 1}, "clamp_all": {"Salary": [null, 5000]}, "match": "*/Autosave*"}}}
+
+    Returns:
+        이름 -> EditProfile (파일 순서대로)
+    """
+    with open(path, encoding='utf-8') as f:
+        doc = json.load(f)
+    profiles = {}
+    for name, entry in doc.get('profiles', {}).items():
+        body = {key: value for key, value in entry.items() if key != 'match'}
+        profiles[name] = EditProfile(name, edit_spec_from_dict(body), entry.get('match'))
+    return profiles
+
+
+def merge_edit_specs(specs) -> EditSpec:
+    """여러 EditSpec을 하나로 합칩니다 (같은 필드 값은 뒤의 것이 이김, 일괄 연산은 순서대로)."""
+    values = {}
+    bulk_ops = ()
+    for spec in specs:
+        values.update(spec.values)
+        bulk_ops += spec.bulk_ops
+    return EditSpec(values, bulk_ops)
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """SaveDirectoryScanner와 같은 (크기, 수정 시각 ns). 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class WatchStats:
+    """
+    감시 카운터. 이벤트 루프 스레드에서만 바꿉니다.
+
+    - detected: 쓰기가 끝난 것으로 확인한 세이브 변경 수 (쓰는 도중의 변화는 한 번으로 셈)
+    - coalesced: 처리 시작 전에 같은 세이브(--newest-only면 같은 폴더)가 다시 준비되어 합쳐진 수
+    - own_writes: 감시가 직접 저장해서 생긴 변경 (무시)
+    - skipped: 적용할 프로필이 없는 세이브
+    - processed = written + unchanged + failed
+    - latency: 감지 -> 저장 완료 (쓰기 완료 대기 포함), process: 작업 시간만
+    """
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.detected = 0
+        self.coalesced = 0
+        self.own_writes = 0
+        self.skipped = 0
+        self.processed = 0
+        self.written = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.pending = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.active = 0
+        self._latency: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._process: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def set_queue_depth(self, depth: int) -> None:
+        self.queue_depth = depth
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def record(self, result: BatchResult, latency: float) -> None:
+        """작업 하나의 결과를 반영합니다."""
+        self.processed += 1
+        if not result.ok:
+            self.failed += 1
+        elif result.written:
+            self.written += 1
+        else:
+            self.unchanged += 1
+        self._latency.append(latency)
+        self._process.append(result.seconds)
+
+    def to_dict(self) -> dict:
+        """카운터와 지연 시간 통계 (JSON으로 바로 쓸 수 있는 dict)."""
+        return {
+            'uptime': time.time() - self.started,
+            'detected': self.detected,
+            'coalesced': self.coalesced,
+            'own_writes': self.own_writes,
+            'skipped': self.skipped,
+            'processed': self.processed,
+            'written': self.written,
+            'unchanged': self.unchanged,
+            'failed': self.failed,
+            'pending': self.pending,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'active': self.active,
+            'latency': latency_summary(self._latency),
+            'process': latency_summary(self._process),
+        }
+
+    def format_line(self) -> str:
+        """화면 출력용 한 줄 요약."""
+        latency = latency_summary(self._latency)
+        text = (
+            f'감지 {self.detected}, 처리 {self.processed} (저장 {self.written}, 변경 없음 {self.unchanged}, '
+            f'실패 {self.failed}), 합침 {self.coalesced}, 대기 {self.pending}, 큐 {self.queue_depth}/최대 {self.max_queue_depth}'
+        )
+        if latency['p50'] is not None:
+            text += f', 지연 p50 {latency["p50"]:.2f}s p95 {latency["p95"]:.2f}s 최대 {latency["max"]:.2f}s'
+        return text
+
+
+class InotifyWatcher:
+    """
+    Linux inotify로 폴더 변경을 알려 주는 감시자 (ctypes 사용, 추가 패키지 없음).
+    이벤트 내용으로 변경을 판단하지 않고 깨우기만 하며, 실제 변경분은 SaveDirectoryScanner가 찾습니다.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ONLYDIR = 0x01000000
+    IN_IGNORED = 0x00008000
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    # struct inotify_event: wd, mask, cookie, len (+ name[len])
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+        # 폴더 경로 -> watch descriptor
+        self._watches: dict[str, int] = {}
+
+    def sync(self, directories) -> None:
+        """지켜볼 폴더 목록을 맞춥니다 (새 폴더 추가, 사라진 폴더 해제)."""
+        wanted = set(directories)
+        for path in [p for p in self._watches if p not in wanted]:
+            self._rm_watch(self.fd, self._watches.pop(path))
+        for path in wanted - self._watches.keys():
+            wd = self._add_watch(self.fd, os.fsencode(path), self.MASK | self.IN_ONLYDIR)
+            if wd >= 0:
+                self._watches[path] = wd
+
+    def drain(self) -> bool:
+        """쌓인 이벤트를 모두 읽어 버립니다. 커널이 해제한 watch(폴더 삭제)는 목록에서 뺍니다. 이벤트가 있었으면 True"""
+        seen = False
+        while True:
+            try:
+                buf = os.read(self.fd, 64 << 10)
+            except (BlockingIOError, InterruptedError):
+                return seen
+            if not buf:
+                return seen
+            seen = True
+            pos = 0
+            while pos + self._EVENT.size <= len(buf):
+                wd, mask, _cookie, name_len = self._EVENT.unpack_from(buf, pos)
+                pos += self._EVENT.size + name_len
+                if mask & self.IN_IGNORED:
+                    for path, watch in list(self._watches.items()):
+                        if watch == wd:
+                            del self._watches[path]
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class WatchJob(NamedTuple):
+    """쓰기가 끝나 처리할 세이브 하나."""
+
+    path: str
+    display: str
+    detected: float  # time.monotonic() 기준 처음 감지한 시각
+    profiles: tuple[EditProfile, ...]
+
+
+class SaveWatcher:
+    """
+    SaveGames 폴더를 지켜보며 쓰기가 끝난 세이브에 수정 프로필을 적용하는 asyncio 데몬.
+
+    흐름: 변경 감지(inotify 또는 폴링) -> 대기 목록에서 크기·수정 시각이 settle초 동안 그대로인지 확인
+    -> 작업 큐(크기 제한, 같은 키는 합침) -> 작업자 jobs개가 스레드에서 적용·저장.
+    시작할 때 이미 있던 세이브는 건드리지 않고, 감시가 직접 저장해서 생긴 변경은 무시합니다.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        profiles: list[EditProfile],
+        jobs: int = 1,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        settle: float = DEFAULT_SETTLE_SECONDS,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        backend: str = 'auto',
+        newest_only: bool = False,
+        backup: bool = True,
+        compress_level: int = edit_save.DEFAULT_COMPRESS_LEVEL,
+        verify: bool | None = None,
+        on_result=None,
+    ) -> None:
+        """
+        Args:
+            root: 감시할 폴더 (하위 폴더 포함)
+            profiles: 적용할 수정 프로필 (세이브마다 match가 맞는 것을 합쳐 한 번에 저장)
+            jobs: 동시에 처리할 세이브 수
+            queue_size: 시작 전 작업 큐 크기
+            settle: 쓰기 완료로 볼 변화 없는 시간 (초)
+            interval: 폴링 간격 (초)
+            backend: 'auto'(Linux면 inotify, 안 되면 폴링) / 'inotify' / 'poll'
+            newest_only: 같은 폴더(게임 세이브 하나)에서 처리 전에 여러 파일이 준비되면 가장 최근 것만 처리
+            backup: 덮어쓸 때 .hsg.bak 백업
+            compress_level: 압축 수준 0~9
+            verify: 저장 후 검증 (기본: 덮어쓰므로 켜짐, SaveFile.commit() 참고)
+            on_result: 작업이 끝날 때마다 (WatchJob, BatchResult, 지연 초)로 호출
+        """
+        self.root = os.path.normpath(root)
+        self.profiles = list(profiles)
+        self.jobs = max(1, jobs)
+        self.settle = settle
+        self.interval = interval
+        self.backend = backend
+        self.newest_only = newest_only
+        self.backup = backup
+        self.compress_level = compress_level
+        self.verify = verify
+        self.on_result = on_result
+        self.stats = WatchStats()
+        self.backend_used = None
+        self._queue_size = max(1, queue_size)
+        self._scanner = SaveDirectoryScanner(self.root)
+        # 쓰는 중일 수 있는 세이브: 경로 -> [서명, 처음 감지, 마지막 변화, 표시 이름]
+        self._pending: dict[str, list] = {}
+        # 시작 전 작업: 키(경로, --newest-only면 폴더) -> WatchJob
+        self._queued: dict[str, WatchJob] = {}
+        self._active: set[str] = set()
+        # 감시가 직접 저장한 파일 -> 저장 직후 서명
+        self._own: dict[str, tuple[int, int]] = {}
+        self._queue: asyncio.Queue | None = None
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping = False
+
+    def stop(self) -> None:
+        """감시를 멈춥니다 (진행 중인 저장은 끝까지, 시작 전 작업은 버림). 다른 스레드에서 불러도 됩니다."""
+        self._stopping = True
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _open_inotify(self) -> InotifyWatcher | None:
+        if self.backend == 'poll' or (self.backend == 'auto' and not sys.platform.startswith('linux')):
+            return None
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            if self.backend == 'inotify':
+                raise
+            return None
+
+    async def run(self) -> None:
+        """stop()이 불릴 때까지 감시합니다."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self._queue_size)
+        self._wake = asyncio.Event()
+        if self._stopping:
+            return
+        # 지금 있는 세이브는 기준으로만 삼음
+        self._scanner.scan()
+        inotify = self._open_inotify()
+        self.backend_used = 'inotify' if inotify is not None else 'poll'
+        if inotify is not None:
+            inotify.sync(self._scanner.directories())
+            self._loop.add_reader(inotify.fd, self._on_inotify, inotify)
+        executor = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix='save-watch')
+        workers = [asyncio.create_task(self._worker(executor)) for _ in range(self.jobs)]
+        try:
+            while not self._stopping:
+                if self._pending:
+                    timeout = max(0.05, min(self.interval, self.settle / 4))
+                else:
+                    timeout = INOTIFY_RESCAN_SECONDS if inotify is not None else self.interval
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                if self._stopping:
+                    break
+                self._collect(time.monotonic())
+                await self._enqueue_ready(time.monotonic())
+                if inotify is not None:
+                    inotify.sync(self._scanner.directories())
+        finally:
+            if inotify is not None:
+                self._loop.remove_reader(inotify.fd)
+                inotify.close()
+            # 시작 전 작업은 버리고, 진행 중인 작업이 끝나면 작업자 종료
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queued.clear()
+            for _ in workers:
+                await self._queue.put(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+            executor.shutdown(wait=True)
+            self.stats.set_queue_depth(0)
+
+    def _on_inotify(self, inotify: InotifyWatcher) -> None:
+        if inotify.drain():
+            self._wake.set()
+
+    def _collect(self, now: float) -> None:
+        """스캔해서 바뀐 세이브를 대기 목록에 넣고, 대기 중인 세이브의 크기·수정 시각 변화를 기록합니다."""
+        delta = self._scanner.scan()
+        for path in delta.removed:
+            self._pending.pop(path, None)
+            self._own.pop(path, None)
+        for path, display in (*delta.added, *delta.modified):
+            if path in self._pending:
+                continue
+            sig = _file_signature(path)
+            if sig is None:
+                continue
+            if sig == self._own.get(path):
+                self.stats.own_writes += 1
+                continue
+            self._pending[path] = [sig, now, now, display]
+        for path, entry in list(self._pending.items()):
+            sig = _file_signature(path)
+            if sig is None:
+                del self._pending[path]
+            elif sig != entry[0]:
+                entry[0] = sig
+                entry[2] = now
+        self.stats.pending = len(self._pending)
+
+    async def _enqueue_ready(self, now: float) -> None:
+        """settle초 동안 그대로인 세이브를 작업 큐에 넣습니다. 같은 키의 시작 전 작업이 있으면 합칩니다."""
+        for path, (sig, detected, changed, display) in list(self._pending.items()):
+            # 처리 중인 세이브는 끝난 뒤에 판단 (감시가 쓴 결과인지 알 수 있도록)
+            if path in self._active or now - changed < self.settle:
+                continue
+            del self._pending[path]
+            if sig == self._own.get(path):
+                self.stats.own_writes += 1
+                continue
+            self.stats.detected += 1
+            profiles = tuple(p for p in self.profiles if p.applies_to(display))
+            if not profiles:
+                self.stats.skipped += 1
+                continue
+            key = os.path.dirname(path) if self.newest_only else path
+            previous = self._queued.get(key)
+            if previous is not None:
+                # 아직 시작하지 않았으므로 최신 파일로 바꿔 한 번만 처리 (지연은 처음 감지 기준)
+                self._queued[key] = WatchJob(path, display, min(previous.detected, detected), profiles)
+                self.stats.coalesced += 1
+                continue
+            self._queued[key] = WatchJob(path, display, detected, profiles)
+            # 큐가 가득 차면 여기서 기다림 (그동안 새 변경은 대기 목록에 쌓였다가 합쳐짐)
+            await self._queue.put(key)
+            self.stats.set_queue_depth(self._queue.qsize())
+        self.stats.pending = len(self._pending)
+
+    async def _worker(self, executor: ThreadPoolExecutor) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            key = await self._queue.get()
+            if key is None:
+                return
+            job = self._queued.pop(key, None)
+            self.stats.set_queue_depth(self._queue.qsize())
+            if job is None:
+                continue
+            self._active.add(job.path)
+            self.stats.active += 1
+            try:
+                result, sig = await loop.run_in_executor(executor, self._apply, job)
+            finally:
+                self._active.discard(job.path)
+                self.stats.active -= 1
+            if sig is not None:
+                self._own[job.path] = sig
+            latency = time.monotonic() - job.detected
+            self.stats.record(result, latency)
+            if self.on_result is not None:
+                self.on_result(job, result, latency)
+            # 처리하는 동안 쌓인 변경을 바로 확인
+            self._wake.set()
+
+    def _apply(self, job: WatchJob) -> tuple[BatchResult, tuple[int, int] | None]:
+        """작업 스레드: 프로필을 합쳐 한 번 해제·수정·저장하고, 저장했으면 직후 서명을 돌려줍니다."""
+        spec = merge_edit_specs(p.spec for p in job.profiles)
+        result = edit_one(job.path, spec, None, self.backup, self.compress_level, self.verify)
+        # 저장 직후 게임이 또 쓰면 그 서명을 감시가 쓴 것으로 볼 수 있으나, 다음 쓰기에서 다시 감지됨
+        return result, _file_signature(job.path) if result.written else None
+
+
+def _write_stats_json(path: str, stats: WatchStats) -> None:
+    data = json.dumps(stats.to_dict(), ensure_ascii=False, indent=2).encode('utf-8')
+    with atomic_write(path) as f:
+        f.write(data + b'\n')
+
+
+async def _serve(watcher: SaveWatcher, stats_interval: float, stats_json: str | None) -> None:
+    """감시를 돌리며 stats_interval초마다 카운터를 출력(바뀐 경우)하고 JSON 파일로 씁니다."""
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, watcher.stop)
+        except (NotImplementedError, RuntimeError):
+            # Windows: Ctrl+C는 KeyboardInterrupt로 끝남
+            pass
+
+    async def report() -> None:
+        last = None
+        while True:
+            await asyncio.sleep(stats_interval)
+            line = watcher.stats.format_line()
+            if line != last:
+                print('[상태]', line)
+                last = line
+            if stats_json:
+                _write_stats_json(stats_json, watcher.stats)
+
+    reporter = asyncio.create_task(report()) if stats_interval > 0 else None
+    try:
+        await watcher.run()
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+
+
+def watch_main(argv: list[str] | None = None) -> None:
+    """`edit_save.py watch` 명령: 세이브 폴더를 지켜보며 새로 쓰인 세이브에 수정 프로필을 자동 적용합니다."""
+    parser = argparse.ArgumentParser(
+        prog='edit_save.py watch',
+        description='세이브 폴더를 감시하다가 게임이 세이브(자동 저장 포함)를 쓰면 수정 프로필을 자동 적용',
+    )
+    parser.add_argument('folder', nargs='?', default=None, help='감시할 폴더 (기본: 게임 SaveGames 폴더)')
+    parser.add_argument('--profiles', default=None, metavar='FILE', help='수정 프로필 JSON 파일')
+    parser.add_argument(
+        '-p',
+        '--apply',
+        action='append',
+        default=[],
+        metavar='NAME',
+        help='적용할 프로필 이름 (여러 번 지정 가능, 기본: 파일의 모든 프로필)',
+    )
+    add_edit_arguments(parser)
+    add_common_arguments(parser)
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='동시에 처리할 세이브 수 (기본 1)')
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help=f'시작 전 작업 큐 크기 (기본 {DEFAULT_QUEUE_SIZE})',
+    )
+    parser.add_argument(
+        '--settle',
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        metavar='SEC',
+        help=f'크기·수정 시각이 이 시간 동안 그대로면 쓰기 완료로 봄 (기본 {DEFAULT_SETTLE_SECONDS:g}초)',
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        metavar='SEC',
+        help=f'폴링 감시 간격 (기본 {DEFAULT_POLL_INTERVAL:g}초)',
+    )
+    parser.add_argument('--backend', choices=WATCH_BACKENDS, default='auto', help='감시 방식 (기본 auto: Linux면 inotify)')
+    parser.add_argument(
+        '--newest-only',
+        action='store_true',
+        help='같은 폴더에서 처리 전에 여러 세이브가 쓰이면 가장 최근 것만 처리 (자동 저장 슬롯 묶음)',
+    )
+    parser.add_argument(
+        '--stats-interval',
+        type=float,
+        default=DEFAULT_STATS_INTERVAL,
+        metavar='SEC',
+        help=f'카운터(지연 시간, 큐 깊이 등) 출력 간격 (기본 {DEFAULT_STATS_INTERVAL:g}초, 0이면 끝날 때만)',
+    )
+    parser.add_argument('--stats-json', default=None, metavar='FILE', help='카운터를 주기적으로 JSON 파일에 씀')
+    args = parser.parse_args(argv)
+
+    if not apply_common_arguments(args):
+        return
+    # 세이브마다 한 번씩만 다루므로 해제 버퍼를 메모리에 남기지 않음
+    edit_save.configure_buffer_cache(0)
+    profiles = []
+    if args.profiles:
+        try:
+            available = load_edit_profiles(args.profiles)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print('오류: 수정 프로필을 읽을 수 없습니다.', e)
+            return
+        missing = [name for name in args.apply if name not in available]
+        if missing:
+            print('오류: 프로필이 없습니다:', ', '.join(missing), f'(있는 프로필: {", ".join(available) or "없음"})')
+            return
+        profiles = [available[name] for name in args.apply] if args.apply else list(available.values())
+    elif args.apply:
+        print('오류: -p/--apply 는 --profiles FILE 과 함께 지정하세요.')
+        return
+    spec = edit_spec_from_args(args)
+    if not spec.is_empty():
+        profiles.append(EditProfile('명령줄', spec))
+    if not profiles:
+        print('적용할 수정이 없습니다. --profiles FILE 또는 -m, -e, -n, --set, --set-all 등을 지정하세요.')
+        return
+    folder = args.folder or get_default_savegames_dir()
+    if not os.path.isdir(folder):
+        print('오류: 감시할 폴더를 찾을 수 없습니다.', folder)
+        return
+
+    def report(job: WatchJob, result: BatchResult, latency: float) -> None:
+        names = ', '.join(p.name for p in job.profiles)
+        if result.ok:
+            state = '저장' if result.written else '변경 없음'
+            print(f'[{state}] {job.display} <- {names} (감지 후 {latency:.2f}s, 처리 {result.seconds:.2f}s)')
+            for line in result.changes:
+                print(f'    {line}')
+        else:
+            print(f'[실패] {job.display}: {result.error}')
+        sys.stdout.flush()
+
+    watcher = SaveWatcher(
+        folder,
+        profiles,
+        jobs=args.jobs,
+        queue_size=args.queue_size,
+        settle=args.settle,
+        interval=args.interval,
+        backend=args.backend,
+        newest_only=args.newest_only,
+        backup=not args.no_backup,
+        compress_level=args.level,
+        verify=args.verify,
+        on_result=report,
+    )
+    print(f'감시 시작: {folder} (프로필: {", ".join(p.name for p in profiles)}). 끝내려면 Ctrl+C')
+    sys.stdout.flush()
+    try:
+        asyncio.run(_serve(watcher, args.stats_interval, args.stats_json))
+    except KeyboardInterrupt:
+        pass
+    print(f'감시 종료 ({watcher.backend_used or "-"}):', watcher.stats.format_line())
+    if args.stats_json:
+        _write_stats_json(args.stats_json, watcher.stats)
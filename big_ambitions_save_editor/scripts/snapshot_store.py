@@ -0,0 +1,534 @@
+# -*- coding: utf-8 -*-
+"""
+Big Ambitions 세이브 스냅샷 저장소 (중복 제거)
+
+.hsg.bak 하나 대신 세이브의 모든 버전을 남깁니다. 해제한 세이브를 내용 기준 청크(UTF-16 필드명
+위치를 경계 후보로 쓰는 content-defined chunking)로 나누고, 청크를 해시 이름으로 압축해 한 번만
+저장합니다. 몇 바이트만 다른 연속 스냅샷은 바뀐 청크 하나 정도만 새로 저장합니다.
+(실행: python edit_save.py snapshot take|list|diff|restore|gc ...)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+from datetime import datetime
+from typing import NamedTuple
+
+import edit_save
+from edit_save import (
+    SAVE_FIELDS,
+    atomic_write,
+    batch_decode,
+    compress_and_save,
+    decompress_save,
+    find_field_value_offsets,
+    get_cache_dir,
+)
+from save_diff import DEFAULT_MAX_REGIONS, describe_region, diff_buffers, format_region
+
+
+# 청크 크기: 최소 / 최대 (경계 후보가 없으면 최대 크기에서 자름)
+CHUNK_MIN_SIZE = 8 << 10
+CHUNK_MAX_SIZE = 128 << 10
+# 필드명 해시의 하위 비트가 0인 필드명만 경계 후보 (1/4)
+CHUNK_BOUNDARY_MASK = 0x3
+# 청크 해시 목록을 묶어 저장하는 단위 (해시 64개 = 1.25KB; 작을수록 작은 수정의 저장 비용이 줄고 매니페스트가 길어짐)
+CHUNK_LIST_GROUP = 64
+CHUNK_DIGEST_SIZE = 20
+CHUNK_COMPRESS_LEVEL = 6
+# gc가 막 저장된(아직 스냅샷에 연결되지 않았을 수 있는) 청크를 지우지 않도록 두는 유예 시간
+GC_GRACE_SECONDS = 3600
+# 보존 정책 기본값: 세이브마다 최근 스냅샷 수, 이 기간(일) 안의 스냅샷은 모두 보존
+DEFAULT_KEEP_LAST = 20
+DEFAULT_KEEP_DAYS = 14.0
+
+_MANIFEST_VERSION = 1
+
+
+def get_snapshot_dir() -> str:
+    """스냅샷 저장소 폴더. 환경 변수 BA_SAVE_EDITOR_SNAPSHOTS가 있으면 그 경로, 없으면 캐시 폴더/snapshots"""
+    return os.environ.get('BA_SAVE_EDITOR_SNAPSHOTS') or os.path.join(get_cache_dir(), 'snapshots')
+
+
+class SnapshotInfo(NamedTuple):
+    """스냅샷 하나의 요약 (매니페스트에서 청크 목록을 뺀 것)."""
+
+    id: str
+    path: str
+    created: str
+    label: str
+    size: int
+    digest: str
+    values: dict
+    chunk_count: int
+    stored_bytes: int
+
+
+class GcResult(NamedTuple):
+    """gc 결과: 지운 스냅샷 id 목록, 지운 청크 수, 확보한 바이트."""
+
+    removed_snapshots: list[str]
+    removed_chunks: int
+    freed_bytes: int
+
+
+def iter_chunk_bounds(data: bytes, min_size: int = CHUNK_MIN_SIZE, max_size: int = CHUNK_MAX_SIZE):
+    """
+    내용 기준 청크 경계를 생성합니다.
+
+    UTF-16 필드명이 시작하는 위치 중 필드명 해시가 조건을 만족하는 곳을 경계 후보로 삼습니다.
+    경계가 내용(필드명)에 붙어 있으므로 앞쪽에 바이트가 끼어들거나 빠져도 다음 후보부터는 같은
+    경계로 다시 맞춰집니다. 정규식(C 구현)으로 후보를 찾으므로 롤링 해시를 파이썬으로 도는 것보다 빠릅니다.
+
+    Yields:
+        (시작, 끝) 오프셋
+    """
+    total = len(data)
+    start = 0
+    name_re = edit_save._field_name_regex(edit_save.FIELD_NAME_MIN_CHARS)
+    crc_cache: dict[bytes, bool] = {}
+    for m in name_re.finditer(data):
+        pos = m.start()
+        while pos - start > max_size:
+            yield start, start + max_size
+            start += max_size
+        if pos - start < min_size:
+            continue
+        name = m.group()
+        is_boundary = crc_cache.get(name)
+        if is_boundary is None:
+            is_boundary = crc_cache[name] = (zlib.crc32(name) & CHUNK_BOUNDARY_MASK) == 0
+        if is_boundary:
+            yield start, pos
+            start = pos
+    while total - start > max_size:
+        yield start, start + max_size
+        start += max_size
+    if start < total or total == 0:
+        yield start, total
+
+
+def _chunk_digest(raw) -> bytes:
+    return hashlib.blake2b(raw, digest_size=CHUNK_DIGEST_SIZE).digest()
+
+
+class SnapshotStore:
+    """
+    스냅샷 저장소.
+
+    - chunks/ab/<해시>: zlib 압축한 청크 (데이터 청크와 청크 해시 목록 묶음 모두)
+    - saves/<세이브 id>/<스냅샷 id>.json: 매니페스트 (경로, 시각, 라벨, 크기, 내용 해시, 주요 값, 해시 목록 묶음)
+    매니페스트는 청크를 다 쓴 뒤 마지막에 원자적으로 쓰므로, 중간에 멈춘 스냅샷은 보이지 않습니다.
+    """
+
+    __slots__ = ('root',)
+
+    def __init__(self, root: str | None = None) -> None:
+        self.root = root or get_snapshot_dir()
+
+    # ---- 청크 ----
+
+    def _chunk_path(self, digest_hex: str) -> str:
+        return os.path.join(self.root, 'chunks', digest_hex[:2], digest_hex)
+
+    def _put_chunk(self, raw) -> tuple[bytes, int]:
+        """
+        청크를 저장합니다. 이미 있으면 수정 시각만 갱신합니다 (gc 유예 시간 기준).
+
+        Returns:
+            (해시, 새로 쓴 바이트 수)
+        """
+        digest = _chunk_digest(raw)
+        path = self._chunk_path(digest.hex())
+        try:
+            os.utime(path)
+            return digest, 0
+        except FileNotFoundError:
+            pass
+        body = zlib.compress(raw, CHUNK_COMPRESS_LEVEL)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.{os.urandom(4).hex()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(body)
+        os.replace(tmp, path)
+        return digest, len(body)
+
+    def _get_chunk(self, digest_hex: str) -> bytes:
+        with open(self._chunk_path(digest_hex), 'rb') as f:
+            raw = zlib.decompress(f.read())
+        if _chunk_digest(raw).hex() != digest_hex:
+            raise ValueError(f'손상된 청크입니다: {digest_hex}')
+        return raw
+
+    # ---- 매니페스트 ----
+
+    @staticmethod
+    def save_id(path: str) -> str:
+        """세이브 경로별 폴더 이름 (경로 해시)."""
+        key = os.path.normcase(os.path.abspath(path)).encode('utf-8')
+        return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+    def _save_dir(self, path: str) -> str:
+        return os.path.join(self.root, 'saves', self.save_id(path))
+
+    def _iter_manifest_paths(self, path: str | None = None):
+        base = os.path.join(self.root, 'saves')
+        dirs = [self._save_dir(path)] if path else []
+        if not path:
+            try:
+                dirs = [entry.path for entry in os.scandir(base) if entry.is_dir()]
+            except OSError:
+                return
+        for directory in dirs:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.endswith('.json'):
+                            yield entry.path
+            except OSError:
+                continue
+
+    @staticmethod
+    def _read_manifest(manifest_path: str) -> dict:
+        with open(manifest_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _info(manifest: dict) -> SnapshotInfo:
+        return SnapshotInfo(
+            manifest['id'],
+            manifest['path'],
+            manifest['created'],
+            manifest.get('label', ''),
+            manifest['size'],
+            manifest['digest'],
+            manifest.get('values', {}),
+            manifest['chunk_count'],
+            manifest.get('stored_bytes', 0),
+        )
+
+    def _manifests(self, path: str | None = None) -> list[tuple[str, dict]]:
+        """(매니페스트 경로, 내용) 목록, 오래된 순."""
+        result = []
+        for manifest_path in self._iter_manifest_paths(path):
+            try:
+                result.append((manifest_path, self._read_manifest(manifest_path)))
+            except (OSError, ValueError):
+                continue
+        result.sort(key=lambda item: (item[1]['created'], item[1]['id']))
+        return result
+
+    def _find(self, snapshot_id: str) -> tuple[str, dict]:
+        """스냅샷 id(앞부분만 써도 됨)로 매니페스트를 찾습니다."""
+        matches = [item for item in self._manifests() if item[1]['id'].startswith(snapshot_id)]
+        if not matches:
+            raise KeyError(f'스냅샷을 찾을 수 없습니다: {snapshot_id}')
+        exact = [item for item in matches if item[1]['id'] == snapshot_id]
+        if exact:
+            return exact[0]
+        if len(matches) > 1:
+            raise KeyError(f'여러 스냅샷과 일치합니다. id를 더 길게 지정하세요: {snapshot_id}')
+        return matches[0]
+
+    # ---- 공개 동작 ----
+
+    def take(self, path: str, label: str = '') -> tuple[SnapshotInfo, bool]:
+        """
+        세이브의 현재 내용을 스냅샷으로 남깁니다. 마지막 스냅샷과 내용이 같으면 새로 만들지 않습니다.
+
+        Returns:
+            (스냅샷 정보, 새로 만들었으면 True)
+        """
+        data = decompress_save(path)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        existing = self._manifests(path)
+        if existing and existing[-1][1]['digest'] == digest:
+            return self._info(existing[-1][1]), False
+
+        view = memoryview(data)
+        stored = 0
+        digests = bytearray()
+        for start, end in iter_chunk_bounds(data):
+            chunk_digest, written = self._put_chunk(view[start:end])
+            digests += chunk_digest
+            stored += written
+        group_bytes = CHUNK_LIST_GROUP * CHUNK_DIGEST_SIZE
+        chunk_lists = []
+        for i in range(0, len(digests), group_bytes):
+            list_digest, written = self._put_chunk(bytes(digests[i : i + group_bytes]))
+            chunk_lists.append(list_digest.hex())
+            stored += written
+
+        now = datetime.now()
+        manifest = {
+            'version': _MANIFEST_VERSION,
+            'id': f'{now:%Y%m%d-%H%M%S}-{digest[:8]}',
+            'path': os.path.abspath(path),
+            'created': now.isoformat(timespec='microseconds'),
+            'label': label,
+            'size': len(data),
+            'digest': digest,
+            'values': _summary_values(data),
+            'chunk_count': len(digests) // CHUNK_DIGEST_SIZE,
+            'chunk_lists': chunk_lists,
+        }
+        manifest['stored_bytes'] = stored
+        body = json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8')
+        manifest_path = os.path.join(self._save_dir(path), manifest['id'] + '.json')
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with atomic_write(manifest_path) as f:
+            f.write(body)
+        return self._info(manifest), True
+
+    def snapshots(self, path: str | None = None) -> list[SnapshotInfo]:
+        """스냅샷 목록 (오래된 순). path를 주면 그 세이브의 것만."""
+        return [self._info(manifest) for _path, manifest in self._manifests(path)]
+
+    def chunk_digests(self, snapshot_id: str) -> list[str]:
+        """스냅샷을 이루는 데이터 청크 해시 목록 (순서대로)."""
+        return self._chunk_digests(self._find(snapshot_id)[1])
+
+    def _chunk_digests(self, manifest: dict) -> list[str]:
+        """이미 읽은 매니페스트의 데이터 청크 해시 목록 (매니페스트를 다시 찾지 않음)."""
+        result = []
+        for list_hex in manifest['chunk_lists']:
+            raw = self._get_chunk(list_hex)
+            result.extend(
+                raw[i : i + CHUNK_DIGEST_SIZE].hex() for i in range(0, len(raw), CHUNK_DIGEST_SIZE)
+            )
+        return result
+
+    def load(self, snapshot_id: str) -> bytes:
+        """스냅샷의 해제된 세이브 내용을 청크에서 다시 조립합니다 (내용 해시로 검증)."""
+        return self._load(self._find(snapshot_id)[1])
+
+    def _load(self, manifest: dict) -> bytes:
+        """이미 읽은 매니페스트로 세이브 내용을 조립합니다 (load() 참고)."""
+        data = b''.join(self._get_chunk(digest) for digest in self._chunk_digests(manifest))
+        if hashlib.blake2b(data, digest_size=16).hexdigest() != manifest['digest']:
+            raise ValueError(f'스냅샷 내용이 기록과 다릅니다: {manifest["id"]}')
+        return data
+
+    def restore(
+        self,
+        snapshot_id: str,
+        output_path: str | None = None,
+        backup: bool = True,
+        compress_level: int = edit_save.DEFAULT_COMPRESS_LEVEL,
+    ) -> str:
+        """
+        스냅샷을 세이브 파일로 되돌립니다. 덮어쓰기 전에 지금 내용도 스냅샷으로 남깁니다.
+
+        Args:
+            output_path: 저장 경로 (기본: 스냅샷을 찍은 원래 경로)
+            backup: 덮어쓸 때 기존 파일을 .hsg.bak으로 보존
+
+        Returns:
+            저장한 경로
+        """
+        _path, manifest = self._find(snapshot_id)
+        data = self._load(manifest)
+        output_path = output_path or manifest['path']
+        if os.path.isfile(output_path):
+            self.take(output_path, label=f'복원 전 ({manifest["id"]})')
+        compress_and_save(
+            data,
+            output_path,
+            level=compress_level,
+            backup_path=output_path + '.bak' if backup and os.path.isfile(output_path) else None,
+        )
+        return output_path
+
+    def diff(self, old_id: str, new: str) -> dict:
+        """
+        두 스냅샷(또는 스냅샷과 현재 세이브 파일)을 비교합니다.
+
+        Args:
+            old_id: 기준 스냅샷 id
+            new: 비교할 스냅샷 id 또는 .hsg 파일 경로
+
+        Returns:
+            {'old', 'new', 'values': {필드: (이전, 이후)}, 'regions': [DiffRegion], 'size': (이전, 이후),
+             'old_data', 'new_data': 비교한 해제 버퍼 (구간 설명용)}
+            regions는 save_diff.diff_buffers 의 바뀐 구간 (삽입/삭제로 밀린 곳도 맞춰 비교)
+        """
+        old = self.load(old_id)
+        if os.path.isfile(new):
+            new_data = decompress_save(new)
+        else:
+            new_data = self.load(new)
+        old_values = _summary_values(old)
+        new_values = _summary_values(new_data)
+        return {
+            'old': old_id,
+            'new': new,
+            'values': {
+                name: (old_values.get(name), new_values.get(name))
+                for name in old_values
+                if old_values.get(name) != new_values.get(name)
+            },
+            'regions': diff_buffers(old, new_data, DEFAULT_MAX_REGIONS),
+            'size': (len(old), len(new_data)),
+            'old_data': old,
+            'new_data': new_data,
+        }
+
+    def gc(
+        self,
+        keep_last: int = DEFAULT_KEEP_LAST,
+        keep_days: float = DEFAULT_KEEP_DAYS,
+        dry_run: bool = False,
+    ) -> GcResult:
+        """
+        보존 정책에 따라 오래된 스냅샷을 지우고, 어느 스냅샷도 쓰지 않는 청크를 지웁니다.
+        세이브마다 최근 keep_last개와 keep_days일 안의 스냅샷은 남깁니다.
+        """
+        cutoff = datetime.now().timestamp() - keep_days * 86400
+        by_save: dict[str, list[tuple[str, dict]]] = {}
+        for manifest_path, manifest in self._manifests():
+            by_save.setdefault(os.path.dirname(manifest_path), []).append((manifest_path, manifest))
+        # 남길 청크와 지울 매니페스트를 먼저 모두 정함 (청크 목록을 읽다 실패하면 아무것도 지우지 않음)
+        removed = []
+        removed_paths = []
+        live: set[str] = set()
+        for items in by_save.values():
+            for i, (manifest_path, manifest) in enumerate(items):
+                recent = i >= len(items) - keep_last
+                created = datetime.fromisoformat(manifest['created']).timestamp()
+                if recent or created >= cutoff:
+                    live.update(manifest['chunk_lists'])
+                    live.update(self._chunk_digests(manifest))
+                    continue
+                removed.append(manifest['id'])
+                removed_paths.append(manifest_path)
+        if not dry_run:
+            for manifest_path in removed_paths:
+                os.remove(manifest_path)
+
+        removed_chunks = 0
+        freed = 0
+        grace = time.time() - GC_GRACE_SECONDS
+        chunk_root = os.path.join(self.root, 'chunks')
+        try:
+            subdirs = [entry.path for entry in os.scandir(chunk_root) if entry.is_dir()]
+        except OSError:
+            subdirs = []
+        for subdir in subdirs:
+            with os.scandir(subdir) as it:
+                for entry in it:
+                    if entry.name in live:
+                        continue
+                    st = entry.stat()
+                    if st.st_mtime > grace:
+                        continue
+                    removed_chunks += 1
+                    freed += st.st_size
+                    if not dry_run:
+                        os.remove(entry.path)
+        return GcResult(removed, removed_chunks, freed)
+
+    def disk_usage(self) -> int:
+        """저장소가 쓰는 바이트 수."""
+        total = 0
+        for dirpath, _dirs, files in os.walk(self.root):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(dirpath, name))
+                except OSError:
+                    pass
+        return total
+
+
+def _summary_values(data: bytes) -> dict:
+    """목록/비교용 주요 값 (Money/Energy/NetWorth). 없으면 None"""
+    offsets = find_field_value_offsets(data, SAVE_FIELDS, 4)
+    names = list(SAVE_FIELDS)
+    decoded = batch_decode(data, [(offsets[name], 'float32') for name in names])
+    return dict(zip(names, decoded))
+
+
+def format_size(nbytes: int) -> str:
+    if nbytes >= 1 << 20:
+        return f'{nbytes / (1 << 20):.1f} MB'
+    return f'{nbytes / 1024:.1f} KB'
+
+
+def snapshot_main(argv: list[str] | None = None) -> None:
+    """`edit_save.py snapshot` 명령: 스냅샷 찍기 / 목록 / 비교 / 복원 / 정리."""
+    parser = argparse.ArgumentParser(
+        prog='edit_save.py snapshot',
+        description='세이브 스냅샷 (중복 제거 저장소): 찍기 / 목록 / 비교 / 복원 / 정리',
+    )
+    parser.add_argument('--store', default=None, help='스냅샷 저장소 폴더 (기본: 캐시 폴더/snapshots)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_take = sub.add_parser('take', help='세이브의 지금 내용을 스냅샷으로 남김')
+    p_take.add_argument('save_file', help='.hsg 세이브 파일 경로')
+    p_take.add_argument('-l', '--label', default='', help='스냅샷 설명')
+
+    p_list = sub.add_parser('list', help='스냅샷 목록')
+    p_list.add_argument('save_file', nargs='?', default=None, help='이 세이브의 스냅샷만 (기본: 전체)')
+
+    p_diff = sub.add_parser('diff', help='두 스냅샷 또는 스냅샷과 현재 파일 비교')
+    p_diff.add_argument('old', help='기준 스냅샷 id (앞부분만 써도 됨)')
+    p_diff.add_argument('new', help='비교할 스냅샷 id 또는 .hsg 파일')
+
+    p_restore = sub.add_parser('restore', help='스냅샷으로 되돌리기 (덮어쓰기 전 지금 내용도 스냅샷으로 남김)')
+    p_restore.add_argument('snapshot_id', help='스냅샷 id (앞부분만 써도 됨)')
+    p_restore.add_argument('-o', '--output', default=None, help='저장 경로 (기본: 원래 세이브 경로)')
+    p_restore.add_argument('--no-backup', action='store_true', help='.hsg.bak 백업 안 함')
+
+    p_gc = sub.add_parser('gc', help='보존 정책에 따라 오래된 스냅샷과 쓰지 않는 청크 정리')
+    p_gc.add_argument('--keep', type=int, default=DEFAULT_KEEP_LAST, help=f'세이브마다 남길 최근 스냅샷 수 (기본 {DEFAULT_KEEP_LAST})')
+    p_gc.add_argument('--keep-days', type=float, default=DEFAULT_KEEP_DAYS, help=f'이 기간(일) 안의 스냅샷은 모두 남김 (기본 {DEFAULT_KEEP_DAYS:g})')
+    p_gc.add_argument('--dry-run', action='store_true', help='지우지 않고 지울 대상만 출력')
+
+    args = parser.parse_args(argv)
+    store = SnapshotStore(args.store)
+    try:
+        if args.command == 'take':
+            info, created = store.take(args.save_file, args.label)
+            if created:
+                print(f'스냅샷 저장: {info.id} (청크 {info.chunk_count}개, 새로 저장 {format_size(info.stored_bytes)})')
+            else:
+                print(f'마지막 스냅샷과 같아 새로 만들지 않았습니다: {info.id}')
+        elif args.command == 'list':
+            infos = store.snapshots(args.save_file)
+            for info in infos:
+                values = ' '.join(f'{k}={v:g}' for k, v in info.values.items() if isinstance(v, (int, float)))
+                label = f' [{info.label}]' if info.label else ''
+                print(f'{info.id}  {info.created[:19]}  {format_size(info.size):>9}  '
+                      f'+{format_size(info.stored_bytes):>9}  {values}{label}')
+                if not args.save_file:
+                    print(f'    {info.path}')
+            print(f'스냅샷 {len(infos)}개, 저장소 {format_size(store.disk_usage())}')
+        elif args.command == 'diff':
+            result = store.diff(args.old, args.new)
+            print(f'크기: {result["size"][0]} -> {result["size"][1]}')
+            for name, (old, new) in result['values'].items():
+                print(f'  {name}: {old} -> {new}')
+            regions = result['regions']
+            changed = sum(region.new_length for region in regions)
+            print(f'바뀐 구간 {len(regions)}개, {changed} 바이트')
+            for region in regions[:50]:
+                for line in format_region(describe_region(result['old_data'], result['new_data'], region)):
+                    print(f'  {line}')
+            if len(regions) > 50:
+                print(f'  ... 외 {len(regions) - 50}개')
+        elif args.command == 'restore':
+            path = store.restore(args.snapshot_id, args.output, backup=not args.no_backup)
+            print('복원 완료:', path)
+        elif args.command == 'gc':
+            result = store.gc(args.keep, args.keep_days, dry_run=args.dry_run)
+            verb = '지울 대상' if args.dry_run else '정리'
+            print(f'{verb}: 스냅샷 {len(result.removed_snapshots)}개, 청크 {result.removed_chunks}개, '
+                  f'{format_size(result.freed_bytes)}')
+            for snapshot_id in result.removed_snapshots:
+                print(f'  {snapshot_id}')
+    except (KeyError, ValueError, OSError) as e:
+        print('오류:', e.args[0] if isinstance(e, KeyError) else e, file=sys.stderr)
+        sys.exit(1)